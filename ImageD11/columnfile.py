@@ -31,6 +31,7 @@ An equals sign "=" on a "#" line implies a parameter = value pair
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211-1307  USA
 
 import warnings
+import os, json, struct, hashlib
 
 from ImageD11 import parameters, transform
 import numpy as np
@@ -136,18 +137,170 @@ def clean(str_lst):
     return [s.lstrip().rstrip() for s in str_lst]
 
 
+def column_formats(titles):
+    """ The % format strings used to write the columns in titles """
+    return [FORMATS.get(title, "%f") for title in titles]
+
+
+def format_rows(cols, fmts, sep="  "):
+    """
+    Returns the text for the rows in cols (list of equal length arrays),
+    each column formatted with fmts. This makes a single call to the
+    % operator for the whole block instead of one per row.
+    """
+    ncols = len(cols)
+    nrows = len(cols[0]) if ncols else 0
+    if nrows == 0:
+        return ""
+    fmt = "".join([sep + f for f in fmts]) + "\n"
+    vals = [None] * (nrows * ncols)
+    for j, col in enumerate(cols):
+        vals[j::ncols] = np.asarray(col).tolist()
+    return (fmt * nrows) % tuple(vals)
+
+
 def fillcols(lines, cols):
     for i,line in enumerate(lines): # could be parallel
         for j,item in enumerate(line.split()):
             cols[j][i] = float(item)
 
+
+# Binary sidecar cache for ascii columnfiles.
+#
+# Layout of the file:
+#    8 bytes   : CACHE_MAGIC
+#    8 bytes   : little endian uint64 length of the json header
+#    json      : titles, parameters, nrows, ncols and the source signature
+#    padding   : up to a multiple of CACHE_ALIGN bytes
+#    data      : float64, shape (ncols, nrows), so one contiguous array per
+#                column that can be memory mapped.
+#
+# The cache is written next to the ascii file, so it is off by default.
+# Set CACHE = True to use it for the whole module, or pass cache=True to
+# columnfile.readfile.
+
+CACHE = False
+CACHE_SUFFIX = ".cache"
+CACHE_MAGIC = b"ID11COLF"
+CACHE_ALIGN = 64
+CACHE_HASH_BYTES = 1 << 16
+
+
+def cache_filename(filename):
+    """ Name of the binary cache file that goes with an ascii columnfile """
+    return filename + CACHE_SUFFIX
+
+
+def source_signature(filename):
+    """
+    Identifies the content of a text file without reading all of it:
+    size, modification time and the md5 of the first and last
+    CACHE_HASH_BYTES of the file.
+    """
+    st = os.stat(filename)
+    h = hashlib.md5()
+    with open(filename, "rb") as f:
+        h.update(f.read(CACHE_HASH_BYTES))
+        if st.st_size > CACHE_HASH_BYTES:
+            f.seek(max(CACHE_HASH_BYTES, st.st_size - CACHE_HASH_BYTES))
+            h.update(f.read(CACHE_HASH_BYTES))
+    return {"size": st.st_size,
+            "mtime": repr(st.st_mtime),
+            "md5": h.hexdigest()}
+
+
+def replace_file(src, dst):
+    """ os.replace, with a fallback for python 2 (not atomic there) """
+    if hasattr(os, "replace"):
+        os.replace(src, dst)
+    else:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def write_colfile_cache(filename, titles, pars, cols):
+    """
+    Writes the binary cache for the ascii file filename.
+    titles = column titles
+    pars = list of (name, value) strings found in the header
+    cols = list of float arrays
+
+    Returns the name of the cache file, or None if it could not be written
+    (e.g. read only folder).
+    """
+    cachename = cache_filename(filename)
+    nrows = len(cols[0]) if len(cols) else 0
+    header = json.dumps({"titles": list(titles),
+                         "parameters": [list(p) for p in pars],
+                         "ncols": len(cols),
+                         "nrows": nrows,
+                         "source": source_signature(filename)}).encode("utf-8")
+    offset = len(CACHE_MAGIC) + 8 + len(header)
+    padding = (-offset) % CACHE_ALIGN
+    tmpname = "%s.%d.tmp" % (cachename, os.getpid())
+    try:
+        with open(tmpname, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(b" " * padding)
+            for col in cols:
+                f.write(np.ascontiguousarray(col, dtype="<f8").tobytes())
+        replace_file(tmpname, cachename)
+    except (IOError, OSError):
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+        return None
+    return cachename
+
+
+def read_colfile_cache(filename):
+    """
+    Reads the binary cache for the ascii file filename if it exists and
+    still matches the source file.
+
+    Returns (titles, pars, cols) with cols memory mapped (copy on write),
+    or None if there is no valid cache.
+    """
+    cachename = cache_filename(filename)
+    if not os.path.exists(cachename):
+        return None
+    try:
+        with open(cachename, "rb") as f:
+            if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            hlen, = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(hlen).decode("utf-8"))
+        if header["source"] != source_signature(filename):
+            return None
+        offset = len(CACHE_MAGIC) + 8 + hlen
+        offset += (-offset) % CACHE_ALIGN
+        ncols, nrows = header["ncols"], header["nrows"]
+        if os.path.getsize(cachename) != offset + 8 * ncols * nrows:
+            return None
+        if ncols * nrows > 0:
+            data = np.memmap(cachename, dtype="<f8", mode="c",
+                             offset=offset, shape=(ncols, nrows))
+            cols = list(np.asarray(data))
+        else:
+            cols = [np.empty(nrows, float) for _ in range(ncols)]
+    except (IOError, OSError, ValueError, KeyError, struct.error):
+        return None
+    return header["titles"], header["parameters"], cols
+
+
 class columnfile(object):
     """
     Class to represent an ascii file containing multiple named columns
+
+    cache = True/False to read through a binary copy of the file,
+    None uses the module level CACHE (see readfile)
     """
 
-    def __init__(self, filename = None, new = False):
+    def __init__(self, filename = None, new = False, cache = None):
         self.titles = []
+        self._indices = {}
         self.filename = filename
         self.__data = []
         self.sortedby = None 
@@ -158,7 +311,7 @@ class columnfile(object):
         self.ncols = 0
         self.nrows = 0
         if not new:
-            self.readfile(filename)
+            self.readfile(filename, cache=cache)
 
     def get_bigarray(self):
         # if someone uses this we have to go back to the old
@@ -209,6 +362,7 @@ class columnfile(object):
     def __setitem__(self, key, value):
         if key in self.titles:
             self.getcolumn(key)[:] = value
+            self.drop_index(key)
         else:
             self.addcolumn(value, key)
 
@@ -217,6 +371,7 @@ class columnfile(object):
             super(columnfile, self).__setattr__(key, value)
             return
         if key in self.titles:
+            self.drop_index(key)
             if np.isscalar(value): # broadcast
                 self.__data[self.titles.index(key)][:] = value
             else:
@@ -245,6 +400,80 @@ class columnfile(object):
             np.logical_or( mskfun( col, val, tol ), mask, mask)
         self.filter( ~mask )
 
+    def build_index( self, *names ):
+        """
+        Sorts the columns in names and keeps the permutation to be used by
+        select_range and select_box. The index for a column is dropped when
+        the rows or that column are changed via the columnfile (filter,
+        reorder, addcolumn, setting the attribute, etc). Changing the
+        numpy array in place behind the back of the columnfile will not
+        be noticed.
+        """
+        indices = self.__dict__.setdefault( '_indices', {} )
+        for name in names:
+            col = self.getcolumn( name )
+            order = np.argsort( col, kind='stable' )
+            indices[name] = ( order, col[order] )
+
+    def drop_index( self, name=None ):
+        """
+        Forget the index for column name (or all of them for None)
+        """
+        indices = getattr( self, '_indices', None )
+        if not indices:
+            return
+        if name is None:
+            indices.clear()
+        else:
+            indices.pop( name, None )
+
+    def has_index( self, name ):
+        return name in getattr( self, '_indices', {} )
+
+    def _index_bounds( self, name, lo, hi ):
+        if not self.has_index( name ):
+            self.build_index( name )
+        order, svals = self._indices[name]
+        i0, i1 = np.searchsorted( svals, ( lo, hi ), side='left' )
+        return order, i0, max( i0, i1 )
+
+    def select_range( self, name, lo, hi ):
+        """
+        Returns the (sorted) row indices where lo <= column name < hi
+        The index for column name is built if it does not exist yet.
+        """
+        order, i0, i1 = self._index_bounds( name, lo, hi )
+        return np.sort( order[i0:i1] )
+
+    def select_box( self, **ranges ):
+        """
+        Row indices (sorted) inside a box, e.g.:
+            rows = cf.select_box( omega = (0, 10), dty = (-1, 1) )
+        means 0 <= omega < 10 and -1 <= dty < 1
+
+        The most selective of the indexed columns is used to find the
+        candidates (an index is built for the first column if none exists)
+        and the other ranges are only tested on the candidates.
+        """
+        if len(ranges) == 0:
+            return np.arange( self.nrows )
+        names = [ name for name in ranges if self.has_index( name ) ]
+        if len(names) == 0:
+            names = list( ranges )[:1]
+        best = None
+        for name in names:
+            order, i0, i1 = self._index_bounds( name, *ranges[name] )
+            if best is None or ( i1 - i0 ) < ( best[2] - best[1] ):
+                best = order, i0, i1, name
+        order, i0, i1, first = best
+        rows = np.sort( order[i0:i1] )
+        for name, ( lo, hi ) in ranges.items():
+            if name == first:
+                continue
+            col = self.getcolumn( name )[rows]
+            rows = rows[ ( col >= lo ) & ( col < hi ) ]
+        return rows
+
     def sortby( self, name ):
         """
         Sort arrays according to column named "name"
@@ -268,31 +497,17 @@ class columnfile(object):
         write an ascii columned file
         """
         self.chkarray()
-        fout = open(filename,"w") # appending
-        # Write as "# name = value\n"
-        parnames = list(self.parameters.get_parameters().keys())
-        parnames.sort()
-        for p in parnames:
-            fout.write("# %s = %s\n"%(p, str(self.parameters.get(p) ) ) )
-        # self.parameters.saveparameters(filename)
-        # Now titles line
-        fout.write("#")
-        format_str = ""
-        for title in self.titles:
-            fout.write("  %s"%(title))
-            try:
-                format_str += "  %s" % (FORMATS[title])
-            except KeyError:
-                format_str += "  %f"
-        fout.write("\n")
-        format_str += "\n"
-        for i in range(self.nrows):
-            fout.write(format_str % tuple( [col[i] for col in self.__data] ) )
-        fout.close()
+        with colfile_writer( filename, titles = self.titles,
+                             parameters = self.parameters,
+                             filetype = "text" ) as w:
+            w.append_columns( self.__data )
 
-    def readfile(self, filename):
+    def readfile(self, filename, cache=None):
         """
         Reads in an ascii columned file
+
+        cache = True/False to use a binary copy of the file for faster
+        reading next time. Defaults to the module level CACHE.
         """
         self.titles = []
         self.parameters = parameters.parameters(filename=filename)
@@ -307,9 +522,25 @@ class columnfile(object):
             print("Reading your columnfile in hdf format")
             colfile_from_hdf( filename, obj = self )
             return
+        if cache is None:
+            cache = CACHE
+        if cache:
+            cached = read_colfile_cache( filename )
+            if cached is not None:
+                titles, pars, cols = cached
+                for name, value in pars:
+                    self.parameters.addpar( parameters.par( name, value ) )
+                self.titles = titles
+                self.__data = cols
+                self.ncols = len(cols)
+                self.nrows = len(cols[0]) if self.ncols > 0 else 0
+                self.parameters.dumbtypecheck()
+                self.set_attributes()
+                return
         with open(filename,"r") as f:
             raw = f.readlines()
         header = True
+        pars = []
         while header and i < len(raw):
              if len(raw[i].lstrip())==0:
                  # skip blank lines
@@ -322,6 +553,7 @@ class columnfile(object):
                      name, value = clean(raw[i][1:].split("=",1))
                      self.parameters.addpar(
                          parameters.par( name, value ) )
+                     pars.append( (name, value) )
                  else:
                      self.titles = raw[i][1:].split()
                  i += 1
@@ -342,6 +574,8 @@ class columnfile(object):
         except:
             raise # Exception("Problem interpreting your colfile")
         self.ncols, self.nrows = len(row0), nrows
+        if cache:
+            write_colfile_cache( filename, self.titles, pars, cols )
         self.parameters.dumbtypecheck()
         self.set_attributes()
 
@@ -399,6 +633,29 @@ class columnfile(object):
             a = getattr(self, name)
             self.__data[i] = a
 
+    def view(self, rows=None):
+        """
+        Returns a lazycolumnfile selecting rows (mask, indices or slice)
+        without copying. The data are gathered when a column is used or
+        when the view is materialised. Views of views compose the row
+        selections.
+
+        The view shares memory with self (like a numpy view), so avoid
+        changing self in place (reorder, sortby) while using it.
+        """
+        self.chkarray()
+        idx = None if rows is None else row_indices( rows, self.nrows )
+        sources = { name : ( partial( _take, col ), idx )
+                    for name, col in zip( self.titles, self.__data ) }
+        cnw = lazycolumnfile( self.titles,
+                              self.nrows if idx is None else len(idx),
+                              sources,
+                              filename = self.filename,
+                              pars = parameters.parameters(
+                                  **self.parameters.parameters.copy() ) )
+        cnw.sortedby = self.sortedby
+        return cnw
+
     def addcolumn(self, col, name):
         """
         Add a new column col to the object with name "name"
@@ -555,6 +812,236 @@ def colfile_from_dict( c ):
     return colf
 
 
+def row_indices( rows, nrows ):
+    """
+    Converts a boolean mask, a list of indices or a slice into an
+    array of integer row indices
+    """
+    if isinstance( rows, slice ):
+        return np.arange( nrows )[rows]
+    rows = np.asarray( rows )
+    if rows.dtype == bool:
+        if len(rows) != nrows:
+            raise Exception("Mask is the wrong size")
+        return np.flatnonzero( rows )
+    idx = rows.astype( np.intp ).ravel()
+    if len(idx) and ( idx.min() < -nrows or idx.max() >= nrows ):
+        raise IndexError("Row index out of range")
+    return np.where( idx < 0, idx + nrows, idx )
+
+
+def compose_rows( sources, idx ):
+    """
+    Applies a selection of rows (idx, integer indices) on top of the
+    row selections already held in sources = { name : (reader, rows) }
+    Columns sharing the same rows array keep sharing the result.
+    """
+    done = {}
+    out = {}
+    for name, (reader, rows) in sources.items():
+        if rows is None:
+            out[name] = (reader, idx)
+        else:
+            if id(rows) not in done:
+                done[id(rows)] = rows[idx]
+            out[name] = (reader, done[id(rows)])
+    return out
+
+
+class lazycolumnfile(columnfile):
+    """
+    A columnfile where the columns are only read when they are first used.
+
+    sources = { title : (reader, rows) }
+       reader(rows) returns the column data for the integer row indices
+       in rows, or for all rows if rows is None.
+
+    Filtering, reordering and copyrows only record the selection for the
+    columns that were not read yet. Columns that are added or computed
+    (e.g. by updateGeometry) are held in memory as usual.
+    """
+
+    def __init__(self, titles, nrows, sources, filename=None, pars=None):
+        columnfile.__init__(self, filename=filename, new=True)
+        if pars is not None:
+            self.parameters = pars
+        self._sources = dict(sources)
+        self.titles = list(titles)
+        self.ncols = len(self.titles)
+        self.nrows = nrows
+        self._columnfile__data = [None for _ in self.titles]
+        for name in self.titles:
+            if name not in self._sources:
+                raise Exception("No source for column " + name)
+
+    def __getattr__(self, name):
+        # Only called when name is not found in the usual places
+        sources = self.__dict__.get("_sources", {})
+        if name in sources:
+            return self._load(name)
+        raise AttributeError(name)
+
+    def __setattr__(self, key, value):
+        sources = self.__dict__.get("_sources", {})
+        if key in self.__dict__.get("titles", ()) and np.isscalar(value):
+            # broadcast into the real data and keep pointing at the array
+            col = self.getcolumn(key)
+            col[:] = value
+            value = col
+        elif key in sources:
+            del sources[key]
+        columnfile.__setattr__(self, key, value)
+
+    def _load(self, name):
+        reader, rows = self._sources[name]
+        col = np.asanyarray(reader(rows))
+        assert len(col) == self.nrows, "%s %d %d" % (name, len(col), self.nrows)
+        del self._sources[name]
+        columnfile.__setattr__(self, name, col)
+        return col
+
+    def isloaded(self, name):
+        """ True if the column is in memory """
+        return name in self.titles and name not in self._sources
+
+    def loadall(self):
+        """ Reads in all the columns that are not yet loaded """
+        for name in self.titles:
+            if name in self._sources:
+                self._load(name)
+
+    def set_attributes(self):
+        data = self._columnfile__data
+        for i, name in enumerate(self.titles):
+            if name not in self._sources:
+                setattr(self, name, data[i])
+                assert len(data[i]) == self.nrows, "%s %d %d" % (
+                    name, len(data[i]), self.nrows)
+
+    def chkarray(self):
+        data = self._columnfile__data
+        for i, name in enumerate(self.titles):
+            if name not in self._sources:
+                data[i] = getattr(self, name)
+
+    def getcolumn(self, name):
+        if name in self._sources:
+            return self._load(name)
+        return columnfile.getcolumn(self, name)
+
+    def get_bigarray(self):
+        self.loadall()
+        return columnfile.get_bigarray(self)
+
+    def set_bigarray(self, ar):
+        self._sources = {}
+        columnfile.set_bigarray(self, ar)
+
+    bigarray = property(fget=get_bigarray, fset=set_bigarray)
+
+    def writefile(self, filename):
+        self.loadall()
+        columnfile.writefile(self, filename)
+
+    def _select(self, idx):
+        """ keep the rows idx (integer indices) """
+        self.chkarray()
+        data = self._columnfile__data
+        for i, name in enumerate(self.titles):
+            if name not in self._sources:
+                data[i] = data[i][idx]
+        self._sources = compose_rows(self._sources, idx)
+        self.nrows = len(idx)
+        self.set_attributes()
+
+    def filter(self, mask):
+        """
+        mask is an nrows long array of true/false
+        Columns that were not read yet are not touched.
+        """
+        if len(mask) != self.nrows:
+            raise Exception("Mask is the wrong size")
+        self._select(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+    def reorder(self, indices):
+        """
+        Put array into the order given by indices
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        if len(indices) != self.nrows:
+            raise Exception("Wrong number of indices to reorder")
+        self._select(indices)
+
+    def copy(self):
+        """
+        Returns a copy. Columns that were not read yet are shared with
+        their source and read when needed.
+        """
+        cnw = self.view()
+        for name in self.titles:
+            if name not in self._sources:
+                cnw.addcolumn(self.getcolumn(name).copy(), name)
+        return cnw
+
+    def copyrows(self, rows):
+        """
+        Returns a lazy copy of select rows of the columnfile
+        """
+        cnw = self.view(rows)
+        for name in self.titles:
+            if name not in self._sources:
+                cnw.getcolumn(name)  # gathers a copy now
+        return cnw
+
+    def view(self, rows=None):
+        """
+        Returns a lazycolumnfile for the rows (mask, indices or slice).
+        Nothing is copied: the selections are composed and a column
+        is only gathered when it is used.
+        """
+        self.chkarray()
+        if rows is None:
+            idx = None
+            sources = dict(self._sources)
+            nrows = self.nrows
+        else:
+            idx = row_indices(rows, self.nrows)
+            sources = compose_rows(self._sources, idx)
+            nrows = len(idx)
+        data = self._columnfile__data
+        for i, name in enumerate(self.titles):
+            if name not in self._sources:
+                sources[name] = (partial(_take, data[i]), idx)
+        cnw = lazycolumnfile(self.titles, nrows, sources,
+                             filename=self.filename,
+                             pars=parameters.parameters(
+                                 **self.parameters.parameters.copy()))
+        cnw.sortedby = self.sortedby
+        return cnw
+
+    def materialise(self):
+        """
+        Reads everything and returns an ordinary columnfile holding
+        the same arrays
+        """
+        self.loadall()
+        self.chkarray()
+        cnw = columnfile(self.filename, new=True)
+        cnw.titles = [t for t in self.titles]
+        cnw.parameters = parameters.parameters(**self.parameters.parameters.copy())
+        cnw.set_bigarray([self.getcolumn(t) for t in self.titles])
+        cnw.ncols = self.ncols
+        cnw.sortedby = self.sortedby
+        return cnw
+
+
+def _take(ar, rows):
+    """ reader for columns held in memory """
+    if rows is None:
+        return ar
+    return ar[rows]
+
+
 try:
     import h5py, os
     def colfile_to_hdf( colfile, hdffile, name=None, compression=None,
@@ -587,6 +1074,8 @@ try:
 
         if getattr(c, 'sortedby', None) is not None:
             g.attrs['sorted_by'] = str(c.sortedby)
+        if 'nrows' in g.attrs:
+            g.attrs['nrows'] = c.nrows
         for t in c.titles:
             if t in INTS:
                 ty = np.int64
@@ -630,13 +1119,8 @@ try:
             g.create_dataset( t, data = getattr(cf, t).astype( ty ) )
         h.close()
 
-    def colfile_from_hdf( hdffile , name=None, obj=None ):
-        """
-        Read a columnfile from a hdf file
-        FIXME TODO - add the parameters somewhere (attributes??)
-        """
-        import time
-        h = h5py.File( hdffile, 'r' )
+    def _hdf_peaks_group( h, hdffile, name=None ):
+        """ Locate the group holding the peaks in an open hdf file """
         if hasattr(h, 'listnames'):
             groups = h.listnames()
         else: # API changed
@@ -654,6 +1138,10 @@ try:
             assert len(groups) == 1, "Your hdf file has many groups. Which one??"+str(groups)
             g = h[groups[0]]
             name = groups[0]
+        return g, name
+
+    def _hdf_titles( g ):
+        """ Column names in a hdf group, in the usual order """
         if hasattr(g, 'listnames'):
             titles = g.listnames()
         else: # API changed
@@ -675,18 +1163,103 @@ try:
         # Anything else goes in alphabetically
         [newtitles.append(t) for t in otitles]
         assert len(newtitles) == len( titles )
+        return newtitles
+
+    def colfile_from_hdf( hdffile , name=None, obj=None ):
+        """
+        Read a columnfile from a hdf file
+        FIXME TODO - add the parameters somewhere (attributes??)
+        """
+        h = h5py.File( hdffile, 'r' )
+        g, name = _hdf_peaks_group( h, hdffile, name )
+        newtitles = _hdf_titles( g )
         if obj is None:
             col = columnfile( filename=name, new=True )
         else:
             col = obj
         col.sortedby = g.attrs.get('sorted_by', None)
-        col.nrows = len( g[newtitles[0]] )
+        # files being appended to say how many rows are complete
+        nrows = int( g.attrs.get( 'nrows', len( g[newtitles[0]] ) ) )
+        col.nrows = nrows
         for name in newtitles:
-            col.addcolumn( g[name][:].copy(), name )
+            col.addcolumn( g[name][:nrows].copy(), name )
         h.close()
         return col
 
 
+    # Number of rows to read at once for a subset of a chunked column
+    LAZY_BLOCK = 1 << 16
+
+    def read_hdf_rows( ds, rows ):
+        """
+        Reads ds[rows] for a 1D dataset and an array of row indices.
+
+        Contiguous uncompressed data are memory mapped. Otherwise the
+        dataset is read in chunk aligned blocks, skipping blocks with no
+        selected rows, so each compressed chunk is decoded once.
+        """
+        rows = np.asarray( rows, dtype=np.intp )
+        if len(rows) == 0:
+            return np.empty( 0, ds.dtype )
+        if ds.chunks is None and ds.compression is None:
+            offset = ds.id.get_offset()
+            if offset is not None:
+                ar = np.memmap( ds.file.filename, mode='r', shape=ds.shape,
+                                offset=offset, dtype=ds.dtype )
+                return np.asarray( ar[rows] )
+            return ds[()][rows]
+        order = None
+        if ( rows[1:] < rows[:-1] ).any():
+            order = np.argsort( rows, kind='stable' )
+            rows = rows[order]
+        chunk = ds.chunks[0]
+        block = chunk * max( 1, LAZY_BLOCK // chunk )
+        blk = rows // block
+        starts = np.flatnonzero( np.concatenate( ((True,), blk[1:] != blk[:-1]) ) )
+        ends = np.concatenate( (starts[1:], (len(rows),)) )
+        out = np.empty( len(rows), ds.dtype )
+        for s, e in zip( starts, ends ):
+            lo = blk[s] * block
+            buf = ds[ lo : min( lo + block, ds.shape[0] ) ]
+            out[s:e] = buf[ rows[s:e] - lo ]
+        if order is not None:
+            result = np.empty_like( out )
+            result[order] = out
+            return result
+        return out
+
+
+    class hdfcolumn( object ):
+        """ Reader for one column of a hdf file, used by lazycolumnfile """
+        def __init__( self, hdffile, path ):
+            self.hdffile = hdffile
+            self.path = path
+
+        def __call__( self, rows ):
+            with h5py.File( self.hdffile, 'r' ) as h:
+                ds = h[self.path]
+                if rows is None:
+                    return ds[()]
+                return read_hdf_rows( ds, rows )
+
+
+    def lazy_colfile_from_hdf( hdffile, name=None ):
+        """
+        Opens a columnfile in a hdf file without reading the data.
+        Each column is read the first time it is used.
+        """
+        with h5py.File( hdffile, 'r' ) as h:
+            g, name = _hdf_peaks_group( h, hdffile, name )
+            titles = _hdf_titles( g )
+            nrows = len( g[titles[0]] )
+            sources = { t : ( hdfcolumn( hdffile, g[t].name ), None )
+                        for t in titles }
+            sortedby = g.attrs.get('sorted_by', None)
+        col = lazycolumnfile( titles, nrows, sources, filename=name )
+        col.sortedby = sortedby
+        return col
+
+
     def mmap_h5colf( fname, path='peaks', mode = 'r' ):
         """
         From:
@@ -747,6 +1320,149 @@ except ImportError:
     def colfileobj_to_hdf( cf, hdffile, name=None):
         hdferr()
 
+    def lazy_colfile_from_hdf( hdffile, name=None ):
+        hdferr()
+
+
+class colfile_writer(object):
+    """
+    Writes a columnfile in pieces so that the whole table never has to
+    be held in memory:
+
+        with colfile_writer( "peaks.h5", titles ) as w:
+            for block in blocks:
+                w.append( block ) # dict (or columnfile) of equal length arrays
+
+    filetype is "hdf" (default for .h5/.hdf/.hdf5 names) or "text".
+    For hdf the columns go into resizable chunked datasets in the group
+    "name", blocks are staged in memory until "chunks" rows are waiting.
+    For text the rows are formatted a block at a time with format_rows.
+    """
+
+    HDF_EXTENSIONS = (".h5", ".hdf", ".hdf5")
+
+    def __init__(self, filename, titles=None, parameters=None, filetype=None,
+                 name="peaks", chunks=65536, compression=None,
+                 compression_opts=None):
+        self.filename = filename
+        self.titles = None
+        self.parameters = parameters
+        if filetype is None:
+            if str(filename).lower().endswith(self.HDF_EXTENSIONS):
+                filetype = "hdf"
+            else:
+                filetype = "text"
+        if filetype not in ("hdf", "text"):
+            raise ValueError("Unknown filetype " + str(filetype))
+        self.filetype = filetype
+        self.name = name
+        self.chunks = chunks
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.nrows = 0
+        self._pending = []
+        self._npending = 0
+        self._fout = None
+        self._h5 = None
+        if titles is not None:
+            self._open(list(titles))
+
+    def _open(self, titles):
+        self.titles = titles
+        if self.filetype == "text":
+            self._fout = open(self.filename, "w")
+            if self.parameters is not None:
+                # Write as "# name = value\n"
+                parnames = list(self.parameters.get_parameters().keys())
+                parnames.sort()
+                for p in parnames:
+                    self._fout.write("# %s = %s\n" % (p, str(self.parameters.get(p))))
+            self._fout.write("#" + "".join(["  %s" % t for t in titles]) + "\n")
+            self._fmts = column_formats(titles)
+        else:
+            import h5py
+            self._h5 = h5py.File(self.filename, "a")
+            if self.name in self._h5:
+                self._h5.close()
+                raise Exception("%s already has %s, cannot write a new columnfile"
+                                % (self.filename, self.name))
+            g = self._h5.create_group(self.name)
+            g.attrs["ImageD11_type"] = "peaks"
+            for t in titles:
+                g.create_dataset(t, shape=(0,), maxshape=(None,),
+                                 dtype=np.int64 if t in INTS else np.float64,
+                                 chunks=(self.chunks,),
+                                 compression=self.compression,
+                                 compression_opts=self.compression_opts)
+            self._group = g
+
+    def append(self, block):
+        """
+        block = dict (or columnfile) with an array for each title
+        """
+        if self.titles is None:
+            self._open(list(block.keys()))
+        self.append_columns([block[t] for t in self.titles])
+
+    def append_columns(self, cols):
+        """
+        cols = list of arrays in the same order as self.titles
+        """
+        if len(cols) != len(self.titles):
+            raise Exception("Need %d columns to append" % (len(self.titles)))
+        n = len(cols[0])
+        for col in cols:
+            if len(col) != n:
+                raise Exception("Columns have different lengths")
+        if n == 0:
+            return
+        if self.filetype == "text":
+            for start in range(0, n, self.chunks):
+                self._fout.write(format_rows([col[start:start + self.chunks]
+                                              for col in cols], self._fmts))
+            self.nrows += n
+        else:
+            self._pending.append([np.asarray(col) for col in cols])
+            self._npending += n
+            if self._npending >= self.chunks:
+                self.flush()
+
+    def flush(self):
+        """ Writes any staged rows to the file """
+        if self.filetype == "text":
+            if self._fout is not None:
+                self._fout.flush()
+            return
+        if self._npending == 0:
+            return
+        start, end = self.nrows, self.nrows + self._npending
+        for j, t in enumerate(self.titles):
+            ds = self._group[t]
+            ds.resize((end,))
+            if len(self._pending) == 1:
+                ds[start:end] = self._pending[0][j]
+            else:
+                ds[start:end] = np.concatenate([p[j] for p in self._pending])
+        self._h5.flush()
+        self.nrows = end
+        self._pending = []
+        self._npending = 0
+
+    def close(self):
+        self.flush()
+        if self._fout is not None:
+            self._fout.close()
+            self._fout = None
+        if self._h5 is not None:
+            self._h5.close()
+            self._h5 = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
 
 try:
     import pandas as pd
@@ -989,25 +1705,54 @@ except ImportError:
 def bench():
     """
     Compares the timing for reading with columfile
-    versus np.loadtxt
+    versus np.loadtxt, hdf and the binary cache
+
+    usage: python -m ImageD11.columnfile peaks.flt
     """
-    import sys, time
+    import sys, time, tempfile
+    fname = sys.argv[1]
+    if os.path.exists(cache_filename(fname)):
+        os.remove(cache_filename(fname))
     start = time.time()
     import cProfile, pstats
     pr = cProfile.Profile()
     pr.enable()
-    colf = columnfile(sys.argv[1])
+    colf = columnfile(fname, new=True)
+    colf.readfile(fname, cache=False)
     pr.disable()
     ps = pstats.Stats(pr, stream=sys.stdout )
     ps.sort_stats('tottime')
     ps.reverse_order()
     print(colf.bigarray.shape)
-    print("ImageD11", time.time() - start)
+    print("ImageD11 text", time.time() - start)
     start = time.time()
-    nolf = np.loadtxt(sys.argv[1])
+    nolf = np.loadtxt(fname)
     print(nolf.shape)
-    print("np", time.time() - start)
+    print("np.loadtxt", time.time() - start)
     ps.print_stats()
+    start = time.time()
+    colf = columnfile(fname, new=True)
+    colf.readfile(fname, cache=True)
+    print("ImageD11 text + write cache", time.time() - start)
+    start = time.time()
+    colc = columnfile(fname, new=True)
+    colc.readfile(fname, cache=True)
+    print("ImageD11 from cache", time.time() - start)
+    start = time.time()
+    for t in colc.titles:
+        colc[t].sum()
+    print("ImageD11 touch all cached columns", time.time() - start)
+    try:
+        tmpdir = tempfile.mkdtemp()
+        hname = os.path.join(tmpdir, "bench.h5")
+        colfile_to_hdf(colf, hname, name="peaks")
+        start = time.time()
+        colh = columnfile(hname)
+        print("ImageD11 from hdf", time.time() - start)
+        os.remove(hname)
+        os.rmdir(tmpdir)
+    except Exception as e:
+        print("Skipped hdf", e)
     # os.system("time -p ./a.out")
 
 
@@ -1018,37 +1763,109 @@ import sqlite3 as database_module
 # Doubtless one does not get away with using a filename?
 
 
-def colfile2db( colfilename, dbname ):
+def _sqlname( title ):
+    # Not allowed for sql to have ^ in string
+    return title.replace("^","_pow_")
+
+
+def colfile2db( colfilename, dbname, table="peaks", index_columns=(),
+                extra_columns=None, blocksize=100000 ):
     """
     Read the columnfile into a database
     Ignores parameter metadata (not used yet)
+
+    colfilename = name of a file, or a columnfile
+    dbname = database name (or an open connection)
+    table = name of the table. Rows are appended if it exists already
+    index_columns = names of columns to create an index on
+    extra_columns = { name : value } constants added to every row, e.g. to
+                    tag which scan or sample the peaks came from
+    blocksize = number of rows sent to executemany at once
+
+    Everything is inserted in a single transaction.
     """
-    colf = columnfile( colfilename )
-    dbo = database_module.connect( dbname )
-    curs = dbo.cursor()
+    if isinstance( colfilename, columnfile ):
+        colf = colfilename
+    else:
+        colf = columnfile( colfilename )
+    if extra_columns is None:
+        extra_columns = {}
+    for name, value in extra_columns.items():
+        if not np.isscalar( value ):
+            raise TypeError("extra_columns must be scalars, not "+name)
+    titles = list( colf.titles ) + list( extra_columns.keys() )
+    cols = [ colf.getcolumn( t ) for t in colf.titles ] + \
+           [ np.full( colf.nrows, v ) for v in extra_columns.values() ]
     # Build up columnames and types to make table
     tablecols = []
-    # Not allowed for sql to have ^ in string
-    colf.titles = [t.replace("^","_pow_") for t in colf.titles]
-    for name in colf.titles:
+    for name in titles:
         if name in INTS:
-            tablecols.append(name + " INTEGER")
+            tablecols.append(_sqlname(name) + " INTEGER")
             continue
         if name in FLOATS:
-            tablecols.append(name + " REAL")
+            tablecols.append(_sqlname(name) + " REAL")
+            continue
+        if name in extra_columns and isinstance( extra_columns[name], str ):
+            tablecols.append(_sqlname(name) + " TEXT")
             continue
-        tablecols.append(name + " REAL")
-    curs.execute("create table peaks \n( " + \
-                 " , ".join(tablecols)     + " ) ; \n" )
+        tablecols.append(_sqlname(name) + " REAL")
+    if isinstance( dbname, database_module.Connection ):
+        dbo = dbname
+    else:
+        dbo = database_module.connect( dbname )
     # Make a format string for inserting data
-    ins = "insert into peaks values ("  + \
-          ",".join(["?"]*colf.ncols)    +") ;"
-    # insert the data
-    for i in range(colf.nrows):
-        curs.execute( ins , tuple(colf.bigarray[:, i]) )
+    ins = "insert into %s ( %s ) values ( %s ) ;"%( table,
+        ",".join([ _sqlname(t) for t in titles ]), ",".join(["?"]*len(titles)) )
+    with dbo:  # commits at the end, or rolls back on error
+        dbo.execute("create table if not exists %s \n( "%(table) + \
+                     " , ".join(tablecols)     + " ) ; \n" )
+        for start in range( 0, colf.nrows, blocksize ):
+            # tolist gives python int/float that sqlite understands
+            block = [ col[start:start+blocksize].tolist() for col in cols ]
+            dbo.executemany( ins, zip( *block ) )
+        for name in index_columns:
+            dbo.execute( "create index if not exists %s_%s on %s ( %s ) ;"%(
+                table, _sqlname(name), table, _sqlname(name) ) )
+    if dbo is not dbname:
+        dbo.close()
+
+
+def colfile_from_db( dbname, query="select * from peaks", params=(),
+                     blocksize=100000 ):
+    """
+    Runs an sql query and returns the result as a columnfile, e.g.
+        colfile_from_db( "peaks.db",
+                         "select * from peaks where omega > ? and omega < ?",
+                         ( 0, 10 ) )
+    Text columns are skipped. NULL becomes nan.
+    """
+    if isinstance( dbname, database_module.Connection ):
+        dbo = dbname
+    else:
+        dbo = database_module.connect( dbname )
+    curs = dbo.cursor()
+    curs.execute( query, params )
+    titles = [ d[0].replace("_pow_","^") for d in curs.description ]
+    blocks = []
+    while True:
+        rows = curs.fetchmany( blocksize )
+        if len(rows) == 0:
+            break
+        blocks.append( np.array( rows, dtype=object ) )
     curs.close()
-    dbo.commit()
-    dbo.close()
+    if dbo is not dbname:
+        dbo.close()
+    if len(blocks):
+        data = np.concatenate( blocks ).reshape( -1, len(titles) )
+    else:
+        data = np.empty( (0, len(titles)), object )
+    cols = {}
+    for j, t in enumerate( titles ):
+        try:
+            cols[t] = data[:, j].astype( float )
+        except (TypeError, ValueError):
+            continue # text
+    return colfile_from_dict( cols )
 
 if __name__ == "__main__":
     bench()
@@ -20,6 +20,7 @@ from __future__ import print_function, division
 
 
 import numpy as np
+import numba
 from . import cImageD11, unitcell
 from ImageD11.grain import grain
 from xfab.tools import ubi_to_u, u_to_rod, ubi_to_rod
@@ -275,6 +276,226 @@ def refine(UBI, gv, tol, quiet=True):
     return UBIo
 
 
+@numba.njit(cache=True, nogil=True)
+def _cosine_search(c, cs_sorted):
+    """ first k with cs_sorted[k] >= c (same as np.searchsorted) """
+    lo = 0
+    hi = cs_sorted.shape[0]
+    while lo < hi:
+        m = (lo + hi) >> 1
+        if cs_sorted[m] < c:
+            lo = m + 1
+        else:
+            hi = m
+    return lo
+
+
+@numba.njit(cache=True, nogil=True)
+def _cosine_window(c, cs_sorted, tol):
+    """ range [lo, hi) of cs_sorted with abs(cs - c) < tol """
+    k = _cosine_search(c, cs_sorted)
+    lo = k
+    while lo > 0 and abs(cs_sorted[lo - 1] - c) < tol:
+        lo -= 1
+    hi = k
+    while hi < cs_sorted.shape[0] and abs(cs_sorted[hi] - c) < tol:
+        hi += 1
+    return lo, hi
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def pairs_closest(n1, n2, cs_sorted, ibest, best):
+    """
+    For each unit vector n1[i] find the n2[j] making the angle closest
+    to one of the allowed cosines in cs_sorted (ascending).
+    Fills ibest[i] = j and best[i] = abs(cos(n1[i], n2[j]) - cs).
+    This is cImageD11.closest(dot(n2, n1[i]), cs) for all i at once.
+    """
+    ncs = cs_sorted.shape[0]
+    for i in numba.prange(n1.shape[0]):
+        a0 = n1[i, 0]
+        a1 = n1[i, 1]
+        a2 = n1[i, 2]
+        b = 99.0
+        jb = 0
+        for j in range(n2.shape[0]):
+            c = n2[j, 0] * a0 + n2[j, 1] * a1 + n2[j, 2] * a2
+            if ncs <= 8:  # few cosines: a scan beats the bisection
+                for k in range(ncs):
+                    d = abs(c - cs_sorted[k])
+                    if d < b:
+                        b = d
+                        jb = j
+                continue
+            k = _cosine_search(c, cs_sorted)
+            if k < ncs and cs_sorted[k] - c < b:
+                b = cs_sorted[k] - c
+                jb = j
+            if k > 0 and c - cs_sorted[k - 1] < b:
+                b = c - cs_sorted[k - 1]
+                jb = j
+        ibest[i] = jb
+        best[i] = b
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def pairs_count(n1, n2, cs_sorted, tol, counts):
+    """
+    counts[i] = number of (j, cosine) with abs(cos(n1[i], n2[j]) - cs) < tol
+    """
+    for i in numba.prange(n1.shape[0]):
+        a0 = n1[i, 0]
+        a1 = n1[i, 1]
+        a2 = n1[i, 2]
+        n = 0
+        for j in range(n2.shape[0]):
+            c = n2[j, 0] * a0 + n2[j, 1] * a1 + n2[j, 2] * a2
+            lo, hi = _cosine_window(c, cs_sorted, tol)
+            n += hi - lo
+        counts[i] = n
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def pairs_fill(n1, n2, cs_sorted, cs_rank, tol, offsets, ii, jj, kk):
+    """
+    Fills the (i, j, cosine rank) triplets counted by pairs_count
+    starting at offsets[i]
+    """
+    for i in numba.prange(n1.shape[0]):
+        a0 = n1[i, 0]
+        a1 = n1[i, 1]
+        a2 = n1[i, 2]
+        p = offsets[i]
+        for j in range(n2.shape[0]):
+            c = n2[j, 0] * a0 + n2[j, 1] * a1 + n2[j, 2] * a2
+            lo, hi = _cosine_window(c, cs_sorted, tol)
+            for k in range(lo, hi):
+                ii[p] = i
+                jj[p] = j
+                kk[p] = cs_rank[k]
+                p += 1
+
+
+def find_pairs(n1, n2, cs, tol):
+    """
+    Finds the pairs of unit vectors from n1 and n2 whose angle matches
+    one of the cosines in cs.
+
+    tol > 0 : for each n1 keep the closest n2 if the error is below tol
+    tol < 0 : keep all pairs with an error below abs(tol)
+
+    Returns an (N, 2) integer array of (row in n1, row in n2). These come
+    in the order of n1, then of cs, then of n2.
+    """
+    n1 = np.ascontiguousarray(n1, float)
+    n2 = np.ascontiguousarray(n2, float)
+    cs = np.asarray(cs, float)
+    order = np.argsort(cs, kind="stable")
+    cs_sorted = np.ascontiguousarray(cs[order])
+    if len(n1) == 0 or len(n2) == 0 or len(cs) == 0:
+        return np.empty((0, 2), np.intp)
+    if tol > 0:
+        ibest = np.empty(len(n1), np.intp)
+        best = np.empty(len(n1), float)
+        pairs_closest(n1, n2, cs_sorted, ibest, best)
+        i = np.flatnonzero(best < tol)
+        return np.stack((i, ibest[i]), axis=1)
+    tol = -tol
+    counts = np.empty(len(n1), np.intp)
+    pairs_count(n1, n2, cs_sorted, tol, counts)
+    offsets = np.concatenate(((0,), np.cumsum(counts)))
+    ntot = offsets[-1]
+    ii = np.empty(ntot, np.intp)
+    jj = np.empty(ntot, np.intp)
+    kk = np.empty(ntot, np.intp)
+    pairs_fill(n1, n2, cs_sorted, order, tol, offsets, ii, jj, kk)
+    srt = np.lexsort((jj, kk, ii))
+    return np.stack((ii[srt], jj[srt]), axis=1)
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def orient_pairs(g1, g2, c2ab, matrs, ubis):
+    """
+    Batched unitcell.orient (closest angle only) for pairs of g-vectors
+    g1[n], g2[n] using the (c2ab, matrs) table from unitcell.getanglehkls.
+    Writes one UBI per pair into ubis[n] as cImageD11.quickorient does.
+    """
+    nc = c2ab.shape[0]
+    for n in numba.prange(g1.shape[0]):
+        a0 = g1[n, 0]
+        a1 = g1[n, 1]
+        a2 = g1[n, 2]
+        b0 = g2[n, 0]
+        b1 = g2[n, 1]
+        b2 = g2[n, 2]
+        costheta = (a0 * b0 + a1 * b1 + a2 * b2) / np.sqrt(
+            (a0 * a0 + a1 * a1 + a2 * a2) * (b0 * b0 + b1 * b1 + b2 * b2)
+        )
+        k = _cosine_search(costheta, c2ab)
+        if k > 0 and (
+            k == nc or abs(costheta - c2ab[k - 1]) < abs(costheta - c2ab[k])
+        ):
+            k = k - 1
+        # quickorient: u0 = g1, u2 = g1 x g2, u1 = u2 x u0
+        m6 = a1 * b2 - a2 * b1
+        m7 = a2 * b0 - a0 * b2
+        m8 = a0 * b1 - a1 * b0
+        t0 = np.sqrt(a0 * a0 + a1 * a1 + a2 * a2)
+        m0 = a0 / t0
+        m1 = a1 / t0
+        m2 = a2 / t0
+        t1 = np.sqrt(m6 * m6 + m7 * m7 + m8 * m8)
+        m6 /= t1
+        m7 /= t1
+        m8 /= t1
+        m3 = m1 * m8 - m2 * m7
+        m4 = m2 * m6 - m0 * m8
+        m5 = m0 * m7 - m1 * m6
+        for r in range(3):
+            bt0 = matrs[k, r, 0]
+            bt1 = matrs[k, r, 1]
+            bt2 = matrs[k, r, 2]
+            ubis[n, r, 0] = bt0 * m0 + bt1 * m3 + bt2 * m6
+            ubis[n, r, 1] = bt0 * m1 + bt1 * m4 + bt2 * m7
+            ubis[n, r, 2] = bt0 * m2 + bt1 * m5 + bt2 * m8
+
+
+@numba.njit(parallel=True, cache=True, nogil=True)
+def score_ubis(ubis, gv, tol, npks):
+    """
+    npks[n] = cImageD11.score(ubis[n], gv, tol) for a stack of (N,3,3) ubis
+    """
+    atol = tol * tol
+    for n in numba.prange(ubis.shape[0]):
+        u00, u01, u02 = ubis[n, 0, 0], ubis[n, 0, 1], ubis[n, 0, 2]
+        u10, u11, u12 = ubis[n, 1, 0], ubis[n, 1, 1], ubis[n, 1, 2]
+        u20, u21, u22 = ubis[n, 2, 0], ubis[n, 2, 1], ubis[n, 2, 2]
+        npk = 0
+        for k in range(gv.shape[0]):
+            h0 = u00 * gv[k, 0] + u01 * gv[k, 1] + u02 * gv[k, 2]
+            h0 -= np.rint(h0)
+            h1 = u10 * gv[k, 0] + u11 * gv[k, 1] + u12 * gv[k, 2]
+            h1 -= np.rint(h1)
+            h2 = u20 * gv[k, 0] + u21 * gv[k, 1] + u22 * gv[k, 2]
+            h2 -= np.rint(h2)
+            if h0 * h0 + h1 * h1 + h2 * h2 < atol:
+                npk += 1
+        npks[n] = npk
+
+
+def numba_threads_safe():
+    """
+    True if the parallel kernels above can be called from several threads
+    at once. The numba workqueue threading layer aborts when they are.
+    """
+    try:
+        layer = numba.threading_layer()
+    except ValueError:  # not started yet
+        score_ubis(np.zeros((0, 3, 3)), np.zeros((1, 3)), 0.1, np.zeros(0, np.intp))
+        layer = numba.threading_layer()
+    return layer != "workqueue"
+
+
 def indexer_from_colfile(colfile, **kwds):
     uc = unitcell.unitcell_from_parameters(colfile.parameters)
     w = float(colfile.parameters.get("wavelength"))
@@ -357,6 +578,18 @@ class indexer:
         self.ds_tol = ds_tol
         self.max_grains = max_grains
         self.eta_range = eta_range
+        self.score_batch = 4096  # trials oriented and scored per call in scorethem
+        # Score on score_sample random peaks first and skip the full score
+        # when even score_sigma above the projected count is below minpks
+        self.score_sample = 0  # 0 = always do the full score
+        self.score_sigma = 3.0
+        self.nscore_full = 0
+        self.nscore_avoided = 0
+        self._score_sample_gv = None
+        self._ringlimit = None  # rings made up to here, see makerings
+        self._ringuse = None  # (nrings, nhkls in the last) for the current gv
+        self._ring_cosines = {}  # cosines between rings, for find_hits
+        self._getind_buffers = None  # drlv2, labels for getind in scorethem
         self.ubis = []
         self.scores = []
         self.hits = []
@@ -408,6 +641,90 @@ class indexer:
         self.__dict__ = copy.deepcopy(self.__pristine_dict)
         self.__pristine_dict = copy.deepcopy(self.__dict__)
 
+    def reset_gv(self, gv):
+        """
+        Start again with new g-vectors (n, 3), keeping the parameters,
+        the hkl rings and the cosine tables. This is much cheaper than
+        making a new indexer when indexing many small sets of peaks.
+        """
+        assert gv.shape[1] == 3
+        self.gv = gv.astype(float)
+        self.ds = np.sqrt((gv * gv).sum(axis=1))
+        self.ga = np.zeros(len(self.ds), np.int32) - 1
+        self.gvflat = np.ascontiguousarray(gv, float)
+        self.ra = None
+        self.ubis = []
+        self.scores = []
+        self.hits = []
+        self._score_sample_gv = None
+
+    def makerings(self, limit):
+        """
+        Makes the hkl rings in self.unitcell up to d* = limit.
+        assigntorings only makes them again for g-vectors beyond limit.
+        """
+        self.unitcell.makerings(limit, tol=self.ds_tol)
+        self._ringlimit = (limit, self.ds_tol)
+        self._ring_cosines = {}
+        self._ringuse = None
+        # d* of each hkl and where each ring starts, for rings_below
+        self._peakds = np.array([p[0] for p in self.unitcell.peaks])
+        self._ringstart = np.cumsum(
+            [0] + [len(self.unitcell.ringhkls[d]) for d in self.unitcell.ringds]
+        )
+
+    def rings_below(self, dsmax):
+        """
+        The number of rings that unitcell.makerings would give for d* < dsmax
+        and the number of hkls in the last of them, using the cached rings
+        """
+        nring = int(np.searchsorted(self.unitcell.ringds, dsmax))
+        if nring == 0:
+            return 0, 0
+        npeak = int(np.searchsorted(self._peakds, dsmax))
+        return nring, npeak - int(self._ringstart[nring - 1])
+
+    def ring_hkls(self, ring):
+        """
+        The hkls of a ring, without any past the d* limit of the g-vectors
+        when the rings were made for a larger limit
+        """
+        hkls = self.unitcell.ringhkls[self.unitcell.ringds[int(ring)]]
+        if self._ringuse is not None and int(ring) == self._ringuse[0] - 1:
+            return hkls[: self._ringuse[1]]
+        return hkls
+
+    def ring_cosines(self, ring_1, ring_2):
+        """
+        Sorted unique cosines of the angles between the hkls of two rings,
+        computed once for each pair of rings
+        """
+        hkls1 = self.ring_hkls(ring_1)
+        hkls2 = self.ring_hkls(ring_2)
+        key = (ring_1, ring_2, len(hkls1), len(hkls2))
+        if key in self._ring_cosines:
+            return self._ring_cosines[key]
+        cosangles = []
+        for h1 in hkls1:
+            for h2 in hkls2:
+                ca = self.unitcell.anglehkls(h1, h2)
+                cosangles.append(ca[1])
+        cosangles.sort()
+        coses = []
+        while len(cosangles) > 0:
+            a = cosangles.pop()
+            if (
+                abs(a - 1.0) < 1e-5 or abs(a + 1.0) < 1e-5
+            ):  # Throw out 180 degree angles
+                continue
+            if len(coses) == 0:
+                coses.append(a)
+                continue
+            if abs(coses[-1] - a) > 1e-5:
+                coses.append(a)
+        self._ring_cosines[key] = coses
+        return coses
+
     def loadpars(self, filename=None):
         if filename is not None:
             self.parameterobj.loadparameters(filename)
@@ -441,8 +758,17 @@ class indexer:
         # rings are in self.unitcell
         limit = np.amax(self.ds)
         logging.info("Assign to rings, maximum d-spacing considered: %f" % (limit))
-        self.unitcell.makerings(limit, tol=self.ds_tol)
-        dsr = self.unitcell.ringds
+        if self._ringlimit is None:
+            self.unitcell.makerings(limit, tol=self.ds_tol)
+            self._ring_cosines = {}
+            dsr = self.unitcell.ringds
+        else:
+            if limit > self._ringlimit[0] or self.ds_tol != self._ringlimit[1]:
+                self.makerings(max(limit, self._ringlimit[0]))
+            # rings made for a larger limit: skip the ones past this limit
+            # so the assignments match rings made for these g-vectors
+            self._ringuse = self.rings_below(limit + self.ds_tol)
+            dsr = self.unitcell.ringds[: self._ringuse[0]]
         # npks
         npks = len(self.ds)
         self.ra = np.zeros(npks, np.int32) - 1
@@ -469,8 +795,8 @@ class indexer:
             n_indexed = np.sum(np.where(self.ga[ind] > -1, 1, 0))
             n_to_index = np.sum(np.where(self.ga[ind] == -1, 1, 0))
             # diffs = abs(take(ds,ind) - dsr[j])
-            h = self.unitcell.ringhkls[dsr[j]][0]
-            Mult = len(self.unitcell.ringhkls[dsr[j]])
+            h = self.ring_hkls(j)[0]
+            Mult = len(self.ring_hkls(j))
             if self.omega_fullrange > 0:
                 expected_orients = int(
                     180.0 / self.omega_fullrange * self.na[j] / float(Mult)
@@ -574,13 +900,18 @@ class indexer:
                     )
                     out.write("\n")
 
-    def score_all_pairs(self, n=None, rmulmax=None, rings_to_use=None):
+    def score_all_pairs(self, n=None, rmulmax=None, rings_to_use=None, workers=None):
         """
         Generate all the potential pairs of rings and go score them too
 
         n = maximum number of pairs to try
         maxmult = max multiplicity of rings to use for generating pairs
         rings_to_use = the rings to use for generating ubis
+        workers = number of threads generating and scoring trials for
+                  the next ring pairs. Grains are still accepted one pair
+                  at a time in the same order, so the result is the same.
+                  Needs the numba tbb or omp threading layer, with the
+                  workqueue layer this runs serially.
         """
         self.assigntorings()
         if rings_to_use is not None:
@@ -589,7 +920,7 @@ class indexer:
             # Which rings have peaks assigned to them?
             rings = [r for r in set(self.ra) if r >= 0]
         # What are the multiplicities of these rings? We will use low multiplicity first
-        mults = {r: len(self.unitcell.ringhkls[self.unitcell.ringds[r]]) for r in rings}
+        mults = {r: len(self.ring_hkls(r)) for r in rings}
         if rmulmax is not None:
             rings = [r for r in rings if mults[r] <= rmulmax]
 
@@ -605,31 +936,121 @@ class indexer:
         self.tried = 0
         self.npairs = len(pairs)
         self.stop = False
-        k = 0
-        for mu, oc, r1, r2 in pairs:
-            k += 1
-            try:
-                self.ring_1 = r1
-                self.ring_2 = r2
-                self.find()
-                if len(self.hits) == 0:  # skip when nothing is found
-                    continue
-                self.scorethem()
-                self.tried += 1
-            except KeyboardInterrupt:
-                break
-            if self.stop:
-                break
-            if n is not None and k > n:
-                break
-            logging.info(
-                "Tried r1=%d r2=%d attempt %d of %d, got %d grains"
-                % (r1, r2, self.tried, len(pairs), len(self.ubis))
+        threaded = workers is not None and workers > 1
+        if threaded and not numba_threads_safe():
+            logging.warning(
+                "numba workqueue threading layer cannot run the kernels in threads,"
+                " scoring the pairs serially"
             )
+            threaded = False
+        if threaded:
+            import concurrent.futures
+
+            self.sample_gv()  # cached before the threads read it
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            trials = self._pair_trials(pool, pairs, 2 * workers)
+        k = 0
+        try:
+            for mu, oc, r1, r2 in pairs:
+                k += 1
+                try:
+                    self.ring_1 = r1
+                    self.ring_2 = r2
+                    scored = None
+                    if threaded:
+                        scored = self._take_pair_trials(next(trials))
+                    else:
+                        self.find()
+                    if len(self.hits) == 0:  # skip when nothing is found
+                        continue
+                    self.scorethem(scored=scored)
+                    self.tried += 1
+                except KeyboardInterrupt:
+                    break
+                if self.stop:
+                    break
+                if n is not None and k > n:
+                    break
+                logging.info(
+                    "Tried r1=%d r2=%d attempt %d of %d, got %d grains"
+                    % (r1, r2, self.tried, len(pairs), len(self.ubis))
+                )
+        finally:
+            if threaded:
+                trials.close()
+                pool.shutdown(wait=True)
         logging.info(
             "\nTested", self.tried, "pairs and found", len(self.ubis), "grains so far"
         )
 
+    def score_pair(self, ring_1, ring_2, ga):
+        """
+        Generates and scores the trials for one pair of rings using
+        the grain assignments in ga.
+        Returns (ga, hits, cosangles, ubis, npks, full), with full marking
+        the trials that needed a score with all the g-vectors.
+        Only reads the indexer, so it can run in a thread.
+        """
+        hits, cosangles = self.find_hits(ring_1, ring_2, ga)
+        if hits is None:
+            return ga, None, None, None, None, None
+        full = np.zeros(len(hits), bool)
+        ubis, npks = self.score_hits(
+            hits, float(self.hkl_tol), ring_1, ring_2, minpks=self.minpks, full=full
+        )
+        return ga, hits, cosangles, ubis, npks, full
+
+    def _pair_trials(self, pool, pairs, depth):
+        """
+        Yields futures of score_pair in pair order, keeping depth in flight.
+        Each one starts from the grain assignments known when it was sent.
+        """
+        import collections
+
+        queue = collections.deque()
+        try:
+            for mu, oc, r1, r2 in pairs:
+                queue.append(pool.submit(self.score_pair, r1, r2, self.ga.copy()))
+                if len(queue) >= depth:
+                    yield queue.popleft()
+            while queue:
+                yield queue.popleft()
+        finally:
+            for future in queue:
+                future.cancel()
+
+    def _take_pair_trials(self, future):
+        """
+        Puts the trials from score_pair for (ring_1, ring_2) into self.hits,
+        as find would have done. Returns the scores if they can be used.
+        The score counts of the ones used are added up here, in the main thread.
+        """
+        ga, hits, cosangles, ubis, npks, full = future.result()
+        if hits is None:
+            self.find()  # no peaks left for those rings
+            return None
+        rings = (self.ra == self.ring_1) | (self.ra == self.ring_2)
+        if (ga[rings] == self.ga[rings]).all():
+            self.cosangles = cosangles
+            self.hits = hits
+            self.count_scores(full)
+            return ubis, npks
+        # A grain was found using some peaks on these rings since then
+        left = self.ga == -1
+        if (
+            float(self.cosine_tol) > 0  # the closest peak may have changed
+            or not (left & (self.ra == self.ring_1)).any()
+            or not (left & (self.ra == self.ring_2)).any()
+        ):
+            self.find()
+            return None
+        # All pairs: find would only drop the ones with assigned peaks
+        keep = left[hits[:, 0]] & left[hits[:, 1]]
+        self.cosangles = cosangles
+        self.hits = hits[keep]
+        self.count_scores(full[keep])
+        return ubis[keep], npks[keep]
+
     def find(self):
         """
         Dig out the potential hits
@@ -639,40 +1060,35 @@ class indexer:
         # Bug out early when there are none
         if self.ra is None:
             self.assigntorings()
+        hits, cosangles = self.find_hits(self.ring_1, self.ring_2, self.ga)
+        if hits is None:
+            return
+        self.cosangles = cosangles
+        self.hits = hits
+
+    def find_hits(self, ring_1, ring_2, ga):
+        """
+        Trial pairs of unassigned peaks (ga == -1) from ring_1 and ring_2
+        Returns (hits, cosangles), or (None, None) when a ring has no peaks.
+        Only reads the indexer, so it can run in a thread.
+        """
         iall = np.arange(self.gv.shape[0])
         i1 = np.compress(
-            np.logical_and(np.equal(self.ra, self.ring_1), self.ga == -1), iall
+            np.logical_and(np.equal(self.ra, ring_1), ga == -1), iall
         ).tolist()
         i2 = np.compress(
-            np.logical_and(np.equal(self.ra, self.ring_2), self.ga == -1), iall
+            np.logical_and(np.equal(self.ra, ring_2), ga == -1), iall
         ).tolist()
         if len(i1) == 0 or len(i2) == 0:
             logging.info("no peaks left for those rings")
-            return
+            return None, None
         # Which are the rings being used for indexing
-        hkls1 = self.unitcell.ringhkls[self.unitcell.ringds[int(self.ring_1)]]
-        hkls2 = self.unitcell.ringhkls[self.unitcell.ringds[int(self.ring_2)]]
+        hkls1 = self.ring_hkls(ring_1)
+        hkls2 = self.ring_hkls(ring_2)
         logging.info("hkls of rings being used for indexing")
         logging.info("Ring 1: %s" % (str(hkls1)))
         logging.info("Ring 2: %s" % (str(hkls2)))
-        cosangles = []
-        for h1 in hkls1:
-            for h2 in hkls2:
-                ca = self.unitcell.anglehkls(h1, h2)
-                cosangles.append(ca[1])
-        cosangles.sort()
-        coses = []
-        while len(cosangles) > 0:
-            a = cosangles.pop()
-            if (
-                abs(a - 1.0) < 1e-5 or abs(a + 1.0) < 1e-5
-            ):  # Throw out 180 degree angles
-                continue
-            if len(coses) == 0:
-                coses.append(a)
-                continue
-            if abs(coses[-1] - a) > 1e-5:
-                coses.append(a)
+        coses = self.ring_cosines(ring_1, ring_2)
         logging.info("Possible angles and cosines between peaks in rings:")
         for c in coses:
             logging.info("%.6f %.6f" % (math.acos(c) * 180 / math.pi, c))
@@ -684,10 +1100,6 @@ class indexer:
         # print self.gv.shape
         # ntry=0
         # nhits=0
-        self.hits = []
-        if len(i1) == 0 or len(i2) == 0:
-            # return without crashing please
-            return
         tol = float(self.cosine_tol)
         # ng=0
         mp = np.sqrt(np.sum(self.gv * self.gv, 1))
@@ -704,28 +1116,17 @@ class indexer:
             n1[:, i] = n1[:, i] / mp1
             n2[:, i] = n2[:, i] / mp2
         cs = np.array(coses, "d")
-        # found=0
-        hits = []
         start = time.time()
-        self.cosangles = cs
-        mtol = -tol  # Ugly interface - set cosine tolerance negative for all
+        # Ugly interface - set cosine tolerance negative for all
         # instead of best
-        for i in range(len(i1)):
-            costheta = np.dot(n2, n1[i])
-            if tol > 0:  # This is the original algorithm - the closest angle
-                best, diff = cImageD11.closest(costheta, cs)
-                if diff < tol:
-                    hits.append([diff, i1[i], i2[best]])
-            else:
-                for cval in cs:
-                    # 1d   scalar  1d
-                    diff = cval - costheta
-                    candidates = np.compress(abs(diff) < mtol, i2)
-                    for c in candidates:
-                        hits.append([0.0, i1[i], c])
+        pairs = find_pairs(n1, n2, cs, tol)
+        hits = np.stack(
+            (np.asarray(i1, np.intp)[pairs[:, 0]], np.asarray(i2, np.intp)[pairs[:, 1]]),
+            axis=1,
+        )
         logging.info("Number of trial orientations generated %d" % (len(hits)))
         logging.info("Time taken %.6f /s" % (time.time() - start))
-        self.hits = hits
+        return hits, cs
 
     def histogram_drlv_fit(self, UBI=None, bins=None):
         """
@@ -759,8 +1160,11 @@ class indexer:
         self.bins = bins
         self.histogram = hist
 
-    def scorethem(self, fitb4=False):
-        """decide which trials listed in hits to keep"""
+    def scorethem(self, fitb4=False, scored=None):
+        """decide which trials listed in hits to keep
+
+        scored = (ubis, npks) from score_hits(self.hits) if already known
+        """
         if self.hits is None or len(self.hits) == 0:  # no idea how this can be None?
             logging.info("No hits to score")
             return
@@ -772,34 +1176,41 @@ class indexer:
         logging.info("Scoring %d potential orientations" % (all))
         progress = 0
         nuniq = 0
-        # for getind mallocs
-        drlv2tmp = np.empty(len(self.gv), float)
-        labelstmp = np.empty(len(self.gv), np.int32)
-        while len(self.hits) > 0 and ng < self.max_grains:
-            diff, i, j = self.hits.pop()
-            if self.ga[i] > -1 or self.ga[j] > -1 or i == j:
-                # skip things which are already assigned or errors
-                continue
-            try:
-                self.unitcell.orient(
-                    self.ring_1, self.gv[i, :], self.ring_2, self.gv[j, :], verbose=0
-                )
-            except:
-                logging.error(
-                    " ".join([str(x) for x in (i, j, self.ring_1, self.ring_2)])
-                )
-                logging.error(str(self.gv[i]))
-                logging.error(str(self.gv[j]))
-                logging.error("Failed to find orientation in unitcell.orient")
-                raise
-            if fitb4:  # FIXME : this does not work
-                self.unitcell.UBI = ubi_fit_2pks(
-                    self.unitell.UBI, self.gv[i, :], self.gv[j, :]
-                )
-            # npk = cImageD11.score(self.unitcell.UBI,gv,tol)
-            npk = self.score(self.unitcell.UBI, tol)
-            UBI = self.unitcell.UBI.copy()
-            if npk > self.minpks:
+        # for getind mallocs, kept for the next call
+        ngv = len(self.gv)
+        if self._getind_buffers is None or len(self._getind_buffers[0]) < ngv:
+            self._getind_buffers = (np.empty(ngv, float), np.empty(ngv, np.int32))
+        drlv2tmp = self._getind_buffers[0][:ngv]
+        labelstmp = self._getind_buffers[1][:ngv]
+        hits = self.hits
+        k = len(hits)
+        nscored = 0
+        nbatch = 64
+        while k > 0 and ng < self.max_grains:
+            # Orient and score a batch of trials at once, last ones first.
+            # The batch grows while nothing is found, as new grains will
+            # remove the later trials sharing their peaks.
+            kb = max(k - nbatch, 0)
+            nbatch = min(nbatch * 2, self.score_batch)
+            batch = hits[kb:k][::-1]
+            i, j = batch[:, 0], batch[:, 1]
+            todo = (self.ga[i] == -1) & (self.ga[j] == -1) & (i != j)
+            trials = batch[todo]
+            if scored is None:
+                ubis, npk_batch = self.score_hits(trials, tol, minpks=self.minpks)
+            else:
+                ubis = scored[0][kb:k][::-1][todo]
+                npk_batch = scored[1][kb:k][::-1][todo]
+            nscored += len(trials)
+            kend, k = k, kb
+            # Only the winners go to the sequential uniqueness check
+            for t in np.flatnonzero(npk_batch > self.minpks):
+                i, j = trials[t]
+                if self.ga[i] > -1 or self.ga[j] > -1:
+                    # assigned by a grain found earlier in this batch
+                    continue
+                npk = int(npk_batch[t])
+                UBI = ubis[t].copy()
                 # Try to get a better orientation if we can...:
                 self.unitcell.orient(
                     self.ring_1,
@@ -810,9 +1221,9 @@ class indexer:
                     crange=abs(self.cosine_tol),
                 )
                 if fitb4:
-                    for k in range(len(self.unitell.UBIlist)):
-                        self.unitell.UBIlist[k] = ubi_fit_2pks(
-                            self.unitell.UBIlist[k], self.gv[i, :], self.gv[j, :]
+                    for n in range(len(self.unitcell.UBIlist)):
+                        self.unitcell.UBIlist[n] = ubi_fit_2pks(
+                            self.unitcell.UBIlist[n], self.gv[i, :], self.gv[j, :]
                         )
                 if len(self.unitcell.UBIlist) > 1:
                     npks = [
@@ -836,15 +1247,32 @@ class indexer:
                         self.ga[ind] = len(self.scores) + 1
                         self.ubis.append(UBI)
                         self.scores.append(npk)
-                        ubistr = (" %.6f" * 9) % tuple(UBI.ravel())
-                        logging.info(
-                            "new grain %d pks, i %d j %d UBI %s" % (npk, i, j, ubistr)
-                        )
+                        if loglevel <= 1:  # formatting is slow
+                            ubistr = (" %.6f" * 9) % tuple(UBI.ravel())
+                            logging.info(
+                                "new grain %d pks, i %d j %d UBI %s" % (npk, i, j, ubistr)
+                            )
                         ng = ng + 1
                     else:
                         nuniq = nuniq + 1
                 except:
                     raise
+                nbatch = 64
+                if ng >= self.max_grains:
+                    # the trials after this one were not tried
+                    k = kend - 1 - np.flatnonzero(todo)[t]
+                    break
+        logging.info("Scored %d trials in batches of %d" % (nscored, self.score_batch))
+        if self.score_sample > 0:
+            logging.info(
+                "Subsample of %d peaks avoided %d of %d full scores so far"
+                % (
+                    self.score_sample,
+                    self.nscore_avoided,
+                    self.nscore_avoided + self.nscore_full,
+                )
+            )
+        self.hits = hits[:k]  # the ones that were not tried
 
         logging.info(
             "Number of orientations with more than %d peaks is %d"
@@ -853,10 +1281,11 @@ class indexer:
         logging.info("Time taken %.3f/s" % (time.time() - start))
         if len(self.ubis) > 0:
             bestfitting = np.argmax(self.scores)
-            logging.info("UBI for best fitting\n%s" % (str(self.ubis[bestfitting])))
-            logging.info(
-                "Unit cell: %s\n" % (str(ubitocellpars(self.ubis[bestfitting])))
-            )
+            if loglevel <= 1:
+                logging.info("UBI for best fitting\n%s" % (str(self.ubis[bestfitting])))
+                logging.info(
+                    "Unit cell: %s\n" % (str(ubitocellpars(self.ubis[bestfitting])))
+                )
             self.refine(self.ubis[bestfitting])
             logging.info(
                 "Indexes %d peaks, with <drlv2>=%f"
@@ -1087,14 +1516,108 @@ class indexer:
             raise
         return labels == 1
 
-    def score(self, UBI, tol=None):
+    def score_hits(self, hits, tol=None, ring_1=None, ring_2=None, minpks=None,
+                   full=None):
         """
-        Decide which are the best orientation matrices
+        Orient and score many trials at once
+        hits = (N, 2) array of peak pairs (i on ring_1, j on ring_2)
+        Returns the (N, 3, 3) UBIs from unitcell.orient and their
+        number of peaks indexed within tol (default hkl_tol)
+
+        With minpks and score_sample set, trials that cannot reach minpks
+        on the subsample get the projected (too low) count instead.
+        The full and avoided scores are counted in self.nscore_full and
+        self.nscore_avoided, or, if a bool array full is given, marked
+        there (True = scored with all the g-vectors) for the caller to count.
         """
         if tol is None:
-            return cImageD11.score(UBI, self.gv, self.hkl_tol)
+            tol = self.hkl_tol
+        if ring_1 is None:
+            ring_1 = self.ring_1
+        if ring_2 is None:
+            ring_2 = self.ring_2
+        hits = np.asarray(hits, np.intp).reshape(-1, 2)
+        hab, c2ab, matrs = self.unitcell.getanglehkls(ring_1, ring_2)
+        ubis = np.zeros((len(hits), 3, 3), float)
+        npks = np.zeros(len(hits), np.intp)
+        if len(hits) == 0 or len(c2ab) == 0:
+            return ubis, npks
+        gv = np.ascontiguousarray(self.gv, float)
+        orient_pairs(
+            gv[hits[:, 0]],
+            gv[hits[:, 1]],
+            np.asarray(c2ab, float),
+            np.asarray(matrs, float).reshape(-1, 3, 3),
+            ubis,
+        )
+        if minpks is None:
+            score_ubis(ubis, gv, float(tol), npks)
+            return ubis, npks
+        # Subsample first, then the full score for the possible ones
+        sample = self.sample_gv()
+        if len(sample) == len(gv):
+            score_ubis(ubis, gv, float(tol), npks)
+            possible = np.ones(len(ubis), bool)
+        else:
+            score_ubis(ubis, sample, float(tol), npks)
+            possible = self.could_reach(npks, len(sample), minpks)
+            npks[~possible] = npks[~possible] * len(gv) // len(sample)
+            nfull = np.zeros(possible.sum(), np.intp)
+            score_ubis(ubis[possible], gv, float(tol), nfull)
+            npks[possible] = nfull
+        if full is None:
+            self.count_scores(possible)
         else:
-            return cImageD11.score(UBI, self.gv, tol)
+            full[:] = possible
+        return ubis, npks
+
+    def count_scores(self, full):
+        """Adds the trials scored in full or not (bool array) to the statistics"""
+        nfull = int(np.count_nonzero(full))
+        self.nscore_full += nfull
+        self.nscore_avoided += len(full) - nfull
+
+    def sample_gv(self):
+        """
+        The random subset of score_sample g-vectors used for a first score
+        (all of them if score_sample is 0 or too big). Cached until gv changes.
+        """
+        ngv = len(self.gv)
+        if self.score_sample <= 0 or self.score_sample >= ngv:
+            return np.ascontiguousarray(self.gv, float)
+        key = (id(self.gv), ngv, self.score_sample)
+        if self._score_sample_gv is None or self._score_sample_gv[0] != key:
+            rng = np.random.RandomState(ngv)  # the same subset every time
+            rows = np.sort(rng.choice(ngv, int(self.score_sample), replace=False))
+            self._score_sample_gv = key, np.ascontiguousarray(self.gv[rows], float)
+        return self._score_sample_gv[1]
+
+    def could_reach(self, nsample, sample_size, minpks):
+        """
+        True where nsample peaks indexed in the subsample might still
+        give more than minpks using all the g-vectors
+        """
+        nsample = np.asarray(nsample)
+        upper = nsample + self.score_sigma * np.sqrt(nsample + 1.0)
+        return upper * len(self.gv) / sample_size > minpks
+
+    def score(self, UBI, tol=None, minpks=None):
+        """
+        Decide which are the best orientation matrices
+
+        With minpks and score_sample set, a UBI which cannot reach minpks
+        on the subsample gets the projected (too low) count instead.
+        """
+        if tol is None:
+            tol = self.hkl_tol
+        if minpks is not None and 0 < self.score_sample < len(self.gv):
+            sample = self.sample_gv()
+            npk = cImageD11.score(UBI, sample, tol)
+            if not self.could_reach(npk, len(sample), minpks):
+                self.nscore_avoided += 1
+                return npk * len(self.gv) // len(sample)
+            self.nscore_full += 1
+        return cImageD11.score(UBI, self.gv, tol)
 
     def refine(self, UBI):
         """
@@ -1,7 +1,7 @@
 import os
 import sys
 import numpy as np
-from ImageD11.sinograms.point_by_point import PBP, initializer
+from ImageD11.sinograms.point_by_point import PBP, initializer, PBPMap, PBPStore, PBPTextFile, merge_pbp_stores
 
 def load_config(config_path):
     """Load the scalar configuration and forgen info."""
@@ -23,7 +23,7 @@ def load_config(config_path):
             config[key] = val
     return config
 
-def run_chunk(config_path, indices_path, grains_file):
+def run_chunk(config_path, indices_path, grains_file, resume=False):
     config = load_config(config_path)
 
     from ImageD11.sinograms.dataset import load
@@ -52,7 +52,7 @@ def run_chunk(config_path, indices_path, grains_file):
     pbp.minpks = config['minpks']
     
     # Load the points for this chunk
-    points = np.loadtxt(indices_path, dtype=int)
+    points = np.loadtxt(indices_path, dtype=int, ndmin=2)
     points = [tuple(row) for row in points]
     
     
@@ -61,13 +61,15 @@ def run_chunk(config_path, indices_path, grains_file):
         grains_filename=grains_file,
         icolf_filename=config['icolf_filename'],
         nprocs=config['nprocs'],
-        debugpoints=points
+        debugpoints=points,
+        resume=resume,
     )
 
 
 def merge_chunk_outputs(files, output_file):
     """
     Merge multiple text files into one, keeping only the first header line.
+    PBPStore (.h5) files from a resumable run are merged into a PBPStore.
     
     Args:
         files (list of str): List of input text file paths.
@@ -77,6 +79,19 @@ def merge_chunk_outputs(files, output_file):
         print("No files found to merge.")
         return
 
+    if files[0].endswith(".h5"):
+        files = [path for path in files if os.path.exists(path)]
+        if output_file.endswith(".h5"):
+            merge_pbp_stores(files, output_file)
+        else:
+            with PBPTextFile(output_file) as gout:
+                for path in files:
+                    pmap = PBPMap(path)
+                    for row in np.column_stack([pmap.getcolumn(t) for t in PBPStore.titles]):
+                        gout.append(row[0], row[1], [(row[2], row[3], row[4:])])
+        print("Merged {} files into {}".format(len(files), output_file))
+        return
+
     with open(output_file, "w") as out_f:
         # Write the header from the first file
         with open(files[0], "r") as f:
@@ -97,8 +112,8 @@ def merge_chunk_outputs(files, output_file):
 
 
 if __name__ == '__main__':
-    if len(sys.argv) != 4:
-        print("Usage: python -m ImageD11.nbGui.S3DXRD.run_pbp_recon_chunk <config.txt> <indices.txt> <output.txt>")
+    if len(sys.argv) not in (4, 5) or sys.argv[4:] not in ([], ["resume"]):
+        print("Usage: python -m ImageD11.nbGui.S3DXRD.run_pbp_recon_chunk <config.txt> <indices.txt> <output.txt|output.h5> [resume]")
         sys.exit(1)
 
-    run_chunk(sys.argv[1], sys.argv[2], sys.argv[3])
\ No newline at end of file
+    run_chunk(sys.argv[1], sys.argv[2], sys.argv[3], resume=len(sys.argv) == 5)
\ No newline at end of file
@@ -884,19 +884,22 @@ class DataSet:
         cf.parameters.loadparameters(self.parfile, phase_name=phase_name)
         cf.updateGeometry()
 
-    def get_cf_2d(self, ignore_existing=False):
+    def get_cf_2d(self, ignore_existing=False, lazy=False):
         if os.path.exists(self.col2dfile) and not ignore_existing:
             print("Loading existing colfile from", self.col2dfile)
-            return self.get_cf_2d_from_disk()
+            return self.get_cf_2d_from_disk(lazy=lazy)
         return self.get_colfile_from_peaks_dict()
 
-    def get_cf_4d(self, ignore_existing=False):
+    def get_cf_4d(self, ignore_existing=False, lazy=False):
         if os.path.exists(self.col4dfile) and not ignore_existing:
             print("Loading existing colfile from", self.col4dfile)
-            return self.get_cf_4d_from_disk()
+            return self.get_cf_4d_from_disk(lazy=lazy)
         return self.get_colfile_from_peaks_dict(peaks_dict=self.pk4d)
 
-    def get_cf_2d_from_disk(self):
+    def get_cf_2d_from_disk(self, lazy=False):
+        """lazy=True only reads columns from the file when they are used"""
+        if lazy:
+            return ImageD11.columnfile.lazy_colfile_from_hdf(self.col2dfile)
         cf_2d = ImageD11.columnfile.columnfile(self.col2dfile)
         return cf_2d
 
@@ -904,7 +907,10 @@ class DataSet:
         cf_3d = ImageD11.columnfile.columnfile(self.col3dfile)
         return cf_3d
 
-    def get_cf_4d_from_disk(self):
+    def get_cf_4d_from_disk(self, lazy=False):
+        """lazy=True only reads columns from the file when they are used"""
+        if lazy:
+            return ImageD11.columnfile.lazy_colfile_from_hdf(self.col4dfile)
         cf_4d = ImageD11.columnfile.columnfile(self.col4dfile)
         return cf_4d
 
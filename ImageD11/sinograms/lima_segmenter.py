@@ -15,6 +15,10 @@ os.environ["HDF5_USE_FILE_LOCKING"] = "FALSE"
 import sys
 import time
 import math
+import queue
+import socket
+import subprocess
+import threading
 import logging
 import numpy as np
 import h5py
@@ -23,7 +27,7 @@ import fabio
 import numba
 import warnings
 
-from ImageD11 import sparseframe
+from ImageD11 import sparseframe, parameters, transform
 from ImageD11.sinograms import dataset
 import ImageD11.cImageD11
 
@@ -33,6 +37,10 @@ try:
 except ImportError:
     chunk2sparse = None
 
+# Chunk size (pixels) of the datasets in the sparse files
+CHUNK = 10000
+
+
 # Code to clean the 2D image and reduce it to a sparse array:
 # things we might edit
 class SegmenterOptions:
@@ -46,6 +54,12 @@ class SegmenterOptions:
         "bgfile",
         "cores_per_job",
         "files_per_core",
+        "flush_pixels",
+        "segment_threads",
+        "nsigma",
+        "parfile",
+        "radial_bins",
+        "bg_decay",
     )
 
     # There are things that DO NOT belong to us
@@ -60,6 +74,12 @@ class SegmenterOptions:
         bgfile="",
         cores_per_job=16,
         files_per_core=4,
+        flush_pixels=CHUNK * 16,  # pixels staged in memory before writing
+        segment_threads=0,  # > 0 : read, segment and write in parallel threads
+        nsigma=0,  # > 0 : cut each frame at running background + nsigma * noise
+        parfile="",  # geometry for radial background bins, else per pixel
+        radial_bins=1000,  # number of 2theta bins for the background
+        bg_decay=0.05,  # weight of each new frame in the running background
     ):
         self.cut = cut
         self.howmany = howmany
@@ -70,6 +90,14 @@ class SegmenterOptions:
         self.bg = None
         self.files_per_core = files_per_core
         self.cores_per_job = cores_per_job
+        self.flush_pixels = flush_pixels
+        self.segment_threads = segment_threads
+        self.nsigma = nsigma
+        self.parfile = parfile
+        self.pars = None
+        self.tth = None
+        self.radial_bins = radial_bins
+        self.bg_decay = bg_decay
 
     def __repr__(self):
         return "\n".join(
@@ -91,6 +119,16 @@ class SegmenterOptions:
             assert self.mask.max() >= 0
         if len(self.bgfile):
             self.bg = fabio.open(self.bgfile).data
+        if self.nsigma > 0 and len(self.parfile):
+            self.pars = parameters.read_par_file(self.parfile).parameters
+
+    def twotheta(self, shape):
+        """2theta map for the radial background bins (None without a parfile)"""
+        if self.pars is not None and (self.tth is None or self.tth.shape != shape):
+            pars = dict(self.pars)
+            pars["shape"] = shape
+            self.tth = transform.PixelLUT(pars).tth
+        return self.tth
 
     def load(self, h5name, h5group):
 
@@ -133,7 +171,7 @@ class SegmenterOptions:
                     grp.attrs[name] = value
 
 
-@numba.njit
+@numba.njit(nogil=True)
 def select(img, mask, row, col, val, cut):
     # TODO: This is in now cImageD11.tosparse_{u16|f32}
     # Choose the pixels that are > cut and put into sparse arrays
@@ -148,7 +186,7 @@ def select(img, mask, row, col, val, cut):
     return k
 
 
-@numba.njit
+@numba.njit(nogil=True)
 def top_pixels(nnz, row, col, val, howmany, thresholds):
     """
     selects the strongest pixels from a sparse collection
@@ -186,6 +224,147 @@ def top_pixels(nnz, row, col, val, howmany, thresholds):
     return n
 
 
+@numba.njit(nogil=True)
+def select_adaptive(img, mask, bins, bincut, bg, row, col, val, s1, s2, cnt, vmin):
+    """
+    Choose the pixels above the cut for their bin and put into sparse arrays.
+    The others are background: their sum, sum of squared deviation from bg
+    and count are added into s1, s2, cnt for each bin.
+    vmin gets the lowest pixel above the cut in each bin.
+    """
+    k = 0
+    for s in range(img.shape[0]):
+        for f in range(img.shape[1]):
+            if mask[s, f] == 0:
+                continue
+            b = bins[s, f]
+            v = img[s, f]
+            if v > bincut[b]:
+                row[k] = s
+                col[k] = f
+                val[k] = v
+                k += 1
+                if v < vmin[b]:
+                    vmin[b] = v
+            else:
+                d = v - bg[b]
+                s1[b] += v
+                s2[b] += d * d
+                cnt[b] += 1
+    return k
+
+
+@numba.njit(nogil=True)
+def update_background(bg, var, s1, s2, cnt, vmin, decay, bincut, cut, nsigma):
+    """
+    Running average of the background and noise in each bin from one frame.
+    Bins with no background pixels in this frame (all above the cut) move
+    towards their lowest pixel instead, so the cut can catch up with a
+    background that went up.
+    Computes the cut to use for the next frame.
+    """
+    for b in range(bg.shape[0]):
+        if cnt[b] > 0:
+            bg[b] += decay * (s1[b] / cnt[b] - bg[b])
+            var[b] += decay * (s2[b] / cnt[b] - var[b])
+        elif vmin[b] < np.inf:
+            bg[b] += decay * (vmin[b] - bg[b])
+        bincut[b] = max(cut, bg[b] + nsigma * math.sqrt(var[b]))
+        s1[b] = 0
+        s2[b] = 0
+        cnt[b] = 0
+        vmin[b] = np.inf
+
+
+class adaptivecut:
+    """
+    Segments frames with a cut that follows the background. A running
+    background and noise level is kept for each 2theta bin (or each pixel
+    without a 2theta map) and pixels above background + nsigma * noise are
+    kept. The cut is never below the fixed cut.
+    Frames must be given in order, one at a time.
+    """
+
+    def __init__(self, mask, dtype, nsigma, cut=0, tth=None, nbins=1000, decay=0.05, minpx=16):
+        self.mask = mask
+        self.nsigma = float(nsigma)
+        self.cut = float(cut)
+        self.decay = float(decay)
+        self.minpx = minpx
+        if tth is None:
+            self.bins = np.arange(mask.size, dtype=np.int32).reshape(mask.shape)
+        else:
+            active = tth[mask != 0]
+            edges = np.linspace(active.min(), active.max(), nbins + 1)[1:-1]
+            self.bins = np.searchsorted(edges, tth).astype(np.int32)
+        nb = self.bins.max() + 1
+        self.bg = np.zeros(nb, np.float64)
+        self.var = np.zeros(nb, np.float64)
+        self.bincut = np.full(nb, np.inf)
+        self.s1 = np.zeros(nb, np.float64)
+        self.s2 = np.zeros(nb, np.float64)
+        self.cnt = np.zeros(nb, np.int64)
+        self.vmin = np.full(nb, np.inf)
+        self.row = np.empty(mask.size, np.uint16)
+        self.col = np.empty(mask.size, np.uint16)
+        self.val = np.empty(mask.size, dtype)
+        self.nframes = 0
+
+    def _select(self, frm, bg):
+        return select_adaptive(
+            frm, self.mask, self.bins, self.bincut, bg,
+            self.row, self.col, self.val, self.s1, self.s2, self.cnt, self.vmin,
+        )
+
+    def _first(self, frm):
+        """Starting estimate from the first frame with a few rounds of clipping.
+        Bins with too few pixels get the value for the whole frame."""
+        zero = np.zeros_like(self.bg)
+        for _ in range(4):
+            self.s1[:] = 0
+            self.s2[:] = 0
+            self.cnt[:] = 0
+            self._select(frm, zero)  # sums of v and v*v
+            n = max(self.cnt.sum(), 1)
+            m = self.s1.sum() / n
+            v = self.s2.sum() / n - m * m
+            ok = self.cnt >= self.minpx
+            c = np.where(ok, self.cnt, 1)
+            self.bg[:] = np.where(ok, self.s1 / c, m)
+            self.var[:] = np.maximum(np.where(ok, self.s2 / c - self.bg ** 2, v), 0)
+            self.bincut[:] = np.maximum(self.cut, self.bg + self.nsigma * np.sqrt(self.var))
+        self.s1[:] = 0
+        self.s2[:] = 0
+        self.cnt[:] = 0
+        self.vmin[:] = np.inf
+
+    def __call__(self, frm):
+        if self.nframes == 0:
+            self._first(frm)
+        nnz = self._select(frm, self.bg)
+        update_background(
+            self.bg, self.var, self.s1, self.s2, self.cnt, self.vmin,
+            self.decay, self.bincut, self.cut, self.nsigma,
+        )
+        self.nframes += 1
+        return nnz, self.row[:nnz], self.col[:nnz], self.val[:nnz]
+
+
+def make_adaptive(options, dtype):
+    """adaptivecut for the current options or None if nsigma is not set"""
+    if not options.nsigma > 0:
+        return None
+    return adaptivecut(
+        options.mask,
+        dtype,
+        options.nsigma,
+        cut=options.cut,
+        tth=options.twotheta(options.mask.shape),
+        nbins=int(options.radial_bins),
+        decay=options.bg_decay,
+    )
+
+
 OPTIONS = None  # global. Nasty.
 
 
@@ -243,18 +422,25 @@ def clean(nnz, row, col, val, config_options= None):
     return sf
 
 
-def reader(frms, mask, cut, start=0):
+def use_chunks(frms):
+    """True if we can decompress the bitshuffle-lz4 chunks ourselves"""
+    return (
+        (chunk2sparse is not None)
+        and ("32008" in frms._filters)
+        and (not frms.is_virtual)
+        and (OPTIONS.bg is None)
+        and not (getattr(OPTIONS, "nsigma", 0) > 0)
+    )
+
+
+def reader(frms, mask, cut, start=0, adaptive=None):
     """
     iterator to read chunks or frames and segment them
     returns sparseframes
+    adaptive = adaptivecut to use instead of the fixed cut
     """
     assert start < len(frms)
-    if (
-        (chunk2sparse is not None)
-        and ("32008" in frms._filters)
-        and (not frms.is_virtual)
-        and (OPTIONS.bg is None)
-    ):
+    if adaptive is None and use_chunks(frms):
         print("# reading compressed chunks")
         fun = chunk2sparse(mask, dtype=frms.dtype)
         for i in range(start, frms.shape[0]):
@@ -268,11 +454,240 @@ def reader(frms, mask, cut, start=0):
             frm = frms[i]
             if OPTIONS.bg is not None:
                 frm = frm.astype(np.float32) - OPTIONS.bg
-            npx, row, col, val = fun(frm, cut)
+            if adaptive is None:
+                npx, row, col, val = fun(frm, cut)
+            else:
+                npx, row, col, val = adaptive(frm)
             spf = clean(npx, row, col, val)
             yield spf
 
 
+class sparsewriter:
+    """
+    Collects sparse frames in memory and writes the row/col/intensity
+    datasets of a scan group in large writes aligned to the chunks,
+    instead of resizing and writing for every frame.
+    """
+
+    def __init__(self, g, nframes, dtype, flush_pixels=CHUNK * 16, chunk=CHUNK, opts=None):
+        """
+        g = hdf5 group to write into
+        nframes = number of frames in the scan
+        dtype = dtype of the intensity
+        flush_pixels = write out when this many pixels are staged
+        opts = dataset creation options (chunks, compression...)
+        """
+        if opts is None:
+            opts = {"chunks": (chunk,), "maxshape": (None,)}
+        self.chunk = chunk
+        self.flush_pixels = max(int(flush_pixels), chunk)
+        self.row = g.create_dataset("row", (0,), dtype=np.uint16, **opts)
+        self.col = g.create_dataset("col", (0,), dtype=np.uint16, **opts)
+        self.sig = g.create_dataset("intensity", (0,), dtype=dtype, **opts)
+        self.nnz_ds = g.create_dataset("nnz", (nframes,), dtype=np.uint32)
+        self.nnz = np.zeros(nframes, np.uint32)
+        self.g = g
+        # staging buffers, grown as needed
+        self.brow = np.empty(self.flush_pixels + chunk, np.uint16)
+        self.bcol = np.empty(self.flush_pixels + chunk, np.uint16)
+        self.bsig = np.empty(self.flush_pixels + chunk, dtype)
+        self.nstaged = 0
+        self.npx = 0  # pixels written to the file
+        self.nfr = 0  # frames appended
+        self.nfr_written = 0  # frames with their nnz in the file
+        self.npx_framed = 0  # pixels of those frames
+        self.nbytes = 0
+        self.nflush = 0
+        self.twrite = 0.0
+
+    def _grow(self, n):
+        for name in ("brow", "bcol", "bsig"):
+            old = getattr(self, name)
+            new = np.empty(n, old.dtype)
+            new[: self.nstaged] = old[: self.nstaged]
+            setattr(self, name, new)
+
+    def append(self, i, spf):
+        """Adds sparse frame spf (or None for an empty frame) as frame i"""
+        self.nfr = max(self.nfr, i + 1)
+        if spf is None:
+            self.nnz[i] = 0
+            return
+        n = spf.nnz
+        if self.nstaged + n > len(self.brow):
+            self._grow(self.nstaged + n + self.chunk)
+        self.brow[self.nstaged : self.nstaged + n] = spf.row
+        self.bcol[self.nstaged : self.nstaged + n] = spf.col
+        self.bsig[self.nstaged : self.nstaged + n] = spf.pixels["intensity"]
+        self.nstaged += n
+        self.nnz[i] = n
+        if self.nstaged >= self.flush_pixels:
+            self.flush(aligned=True)
+
+    def flush(self, aligned=False):
+        """Writes the staged pixels. With aligned, only whole chunks are
+        written and the remainder stays in the buffer"""
+        n = self.nstaged
+        if aligned:
+            # next chunk boundary in the file
+            n = ((self.npx + n) // self.chunk) * self.chunk - self.npx
+        if n <= 0:
+            return
+        t0 = time.time()
+        e = self.npx + n
+        for ds, buf in ((self.row, self.brow), (self.col, self.bcol), (self.sig, self.bsig)):
+            ds.resize(e, axis=0)
+            ds[self.npx : e] = buf[:n]
+            self.nbytes += n * buf.itemsize
+        self.twrite += time.time() - t0
+        # move the remainder to the front
+        left = self.nstaged - n
+        for buf in (self.brow, self.bcol, self.bsig):
+            buf[:left] = buf[n : self.nstaged]
+        self.nstaged = left
+        self.npx = e
+        self.nflush += 1
+        self.write_nnz()
+
+    def write_nnz(self):
+        """Writes nnz for the frames whose pixels are all in the file, so that
+        a job killed later leaves nnz matching the pixels written"""
+        k, px = self.nfr_written, self.npx_framed
+        while k < self.nfr and px + int(self.nnz[k]) <= self.npx:
+            px += int(self.nnz[k])
+            k += 1
+        if k > self.nfr_written:
+            self.nnz_ds[self.nfr_written : k] = self.nnz[self.nfr_written : k]
+            self.nfr_written, self.npx_framed = k, px
+
+    def close(self):
+        """Writes everything and the nnz. Returns the number of pixels"""
+        self.flush()
+        self.nnz_ds[:] = self.nnz
+        self.g.attrs["npx"] = self.npx
+        return self.npx
+
+    def speed(self):
+        """MB/s for the dataset writes"""
+        return self.nbytes / 1e6 / max(self.twrite, 1e-9)
+
+    def report(self):
+        return "# wrote %.1f MB in %d flushes of <= %d pixels, %.1f MB/s" % (
+            self.nbytes / 1e6,
+            self.nflush,
+            self.flush_pixels,
+            self.speed(),
+        )
+
+
+def pipelined_reader(frms, mask, cut, start=0, nthreads=2, depth=32, adaptive=None):
+    """
+    Gives the same sparseframes as reader, in order, but a thread reads
+    the frames (or compressed chunks) ahead, nthreads threads segment them
+    and the caller (e.g. writing) runs at the same time.
+    depth = size of the queues between the stages
+    adaptive = adaptivecut to use instead of the fixed cut. The running
+       background needs the frames in order, so the reading thread applies
+       the cut and the other threads only clean the pixels.
+    """
+    assert start < len(frms)
+    direct = adaptive is None and use_chunks(frms)
+    if direct:
+        print("# reading compressed chunks")
+    nframes = frms.shape[0]
+    todo = queue.Queue(maxsize=depth)
+    done = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def read():
+        try:
+            for i in range(start, nframes):
+                if stop.is_set():
+                    break
+                if direct:
+                    item = frms.id.read_direct_chunk((i, 0, 0))[1]
+                else:
+                    item = frms[i]
+                if adaptive is not None:
+                    if OPTIONS.bg is not None:
+                        item = item.astype(np.float32) - OPTIONS.bg
+                    npx, row, col, val = adaptive(item)
+                    item = npx, row.copy(), col.copy(), val.copy()
+                todo.put((i, item, None))
+        except Exception as err:
+            todo.put((None, None, err))
+        finally:
+            for _ in range(nthreads):
+                todo.put(None)
+
+    def segment():
+        # each thread has its own buffers
+        if direct:
+            fun = chunk2sparse(mask, dtype=frms.dtype).coo
+        else:
+            fun = frmtosparse(mask, frms.dtype)
+        while True:
+            job = todo.get()
+            if job is None:
+                done.put(None)
+                break
+            i, item, err = job
+            if err is None and not stop.is_set():
+                try:
+                    if adaptive is not None:
+                        item = clean(*item)
+                    else:
+                        if OPTIONS.bg is not None:
+                            item = item.astype(np.float32) - OPTIONS.bg
+                        npx, row, col, val = fun(item, cut)
+                        # copy as the buffers are re-used for the next frame
+                        item = clean(npx, row.copy(), col.copy(), val.copy())
+                except Exception as e:
+                    err = e
+            done.put((i, item, err))
+
+    threads = [threading.Thread(target=read)]
+    threads += [threading.Thread(target=segment) for _ in range(nthreads)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    try:
+        pending = {}
+        nfinished = 0
+        for i in range(start, nframes):
+            while i not in pending:
+                result = done.get()
+                if result is None:
+                    nfinished += 1
+                    if nfinished == nthreads:
+                        raise Exception("Segmenting threads stopped at frame %d" % (i))
+                    continue
+                j, spf, err = result
+                if err is not None:
+                    raise err
+                pending[j] = spf
+            yield pending.pop(i)
+    finally:
+        # unblock and collect the threads
+        stop.set()
+        for t in threads:
+            while t.is_alive():
+                for q in (todo, done):
+                    try:
+                        while True:
+                            q.get_nowait()
+                    except queue.Empty:
+                        pass
+                if not threads[0].is_alive():
+                    # reader is done, but we may have taken the end markers
+                    for _ in range(nthreads):
+                        try:
+                            todo.put_nowait(None)
+                        except queue.Full:
+                            break
+                t.join(0.01)
+
+
 def segment_lima(args):
     """Does segmentation on a single hdf5
     srcname,
@@ -282,7 +697,7 @@ def segment_lima(args):
     srcname, destname, dataset = args
     # saving compression style:
     opts = {
-        "chunks": (10000,),
+        "chunks": (CHUNK,),
         "maxshape": (None,),
         "compression": "lzf",
         "shuffle": True,
@@ -298,44 +713,44 @@ def segment_lima(args):
             print("# time now", time.ctime(), "\n#", end=" ")
             frms = hin[dataset]
             g = hout.require_group(dataset)
-            row = g.create_dataset("row", (0,), dtype=np.uint16, **opts)
-            col = g.create_dataset("col", (0,), dtype=np.uint16, **opts)
             # can go over 65535 frames in a scan
-            # num = g.create_dataset("frame", (1,), dtype=np.uint32, **opts)
-            sig = g.create_dataset("intensity", (0,), dtype=frms.dtype, **opts)
-            nnz = g.create_dataset("nnz", (frms.shape[0],), dtype=np.uint32)
+            writer = sparsewriter(
+                g,
+                frms.shape[0],
+                frms.dtype,
+                flush_pixels=getattr(OPTIONS, "flush_pixels", CHUNK * 16),
+                opts=opts,
+            )
             g.attrs["itype"] = np.dtype(np.uint16).name
             g.attrs["nframes"] = frms.shape[0]
             g.attrs["shape0"] = frms.shape[1]
             g.attrs["shape1"] = frms.shape[2]
-            npx = 0
             nframes = frms.shape[0]
             if OPTIONS.mask is None:
                 # put in a dummy now that we have the frame shape
                 OPTIONS.mask = np.ones((frms.shape[1], frms.shape[2]), dtype=np.uint8)
-            for i, spf in enumerate(reader(frms, OPTIONS.mask, OPTIONS.cut)):
+            adaptive = make_adaptive(OPTIONS, frms.dtype)
+            if adaptive is not None:
+                g.attrs["nsigma"] = OPTIONS.nsigma
+            nthreads = int(getattr(OPTIONS, "segment_threads", 0) or 0)
+            if nthreads > 0:
+                frames = pipelined_reader(
+                    frms, OPTIONS.mask, OPTIONS.cut, nthreads=nthreads, adaptive=adaptive
+                )
+            else:
+                frames = reader(frms, OPTIONS.mask, OPTIONS.cut, adaptive=adaptive)
+            for i, spf in enumerate(frames):
                 if i % 100 == 0:
                     if spf is None:
                         print("%4d 0" % (i), end=",")
                     else:
                         print("%4d %d" % (i, spf.nnz), end=",")
                     sys.stdout.flush()
-                if spf is None:
-                    nnz[i] = 0
-                    continue
-                if spf.nnz + npx > len(row):
-                    row.resize(spf.nnz + npx, axis=0)
-                    col.resize(spf.nnz + npx, axis=0)
-                    sig.resize(spf.nnz + npx, axis=0)
-                row[npx:] = spf.row[:]
-                col[npx:] = spf.col[:]
-                sig[npx:] = spf.pixels["intensity"]
-                # num[npx:] = i
-                nnz[i] = spf.nnz
-                npx += spf.nnz
-            g.attrs["npx"] = npx
+                writer.append(i, spf)
+            npx = writer.close()
     end = time.time()
     print("\n# Done", nframes, "frames", npx, "pixels  fps", nframes / (end - start))
+    print(writer.report())
     return destname
 
     # the output file should be flushed and closed when this returns
@@ -351,12 +766,8 @@ def initOptions(h5name, jobid):
     OPTIONS.jobid = jobid
 
 
-def main(h5name, jobid):
-    #flake8: global OPTIONS
-    initOptions(h5name, jobid)
-    options = OPTIONS
-    assert options is not None
-    assert OPTIONS is not None
+def job_args(options):
+    """(src, dest, dataset) for the files of options.jobid"""
     args = []
     files_per_job = options.cores_per_job * options.files_per_core  # 64 files per job
     start = options.jobid * files_per_job
@@ -369,48 +780,230 @@ def main(h5name, jobid):
                 options.limapath,
             )
         )
-    if options.cores_per_job > 1:
-        import multiprocessing
-        # Gemini suggested fork to suppress the multiprocessing context errors
-        # We must ensure that hdf5 has not got any files open when doing this
-        # Both spawn and forkserver run into problems reproducibly.
-        ctx_type = 'spawn' # windows/mac
-        if 'linux' in sys.platform:
-            ctx_type = 'fork' 
-        # Long term: this is going to break. We need a better model for the 
-        # nested parallel processing of running many slurm jobs and each job
-        # running a bunch of processes. Or we need to fix /dev/shm at ESRF.
-        # The SemLocks are not multi-multi-process safe.
-        ctx = multiprocessing.get_context(ctx_type)
-        num_processes = min(options.cores_per_job, len(args))
-        print("# Starting pool with", num_processes, " workers...", flush=True)
-
-        mypool = ctx.Pool(
-            processes=num_processes,
-            initializer=initOptions,
-            initargs=(h5name, jobid),
-        )
+    return args
+
+
+def is_done(destname, dataset):
+    """A sparse file is complete once segment_lima wrote npx at the end"""
+    if not os.path.exists(destname):
+        return False
+    try:
+        with h5py.File(destname, "r") as hin:
+            return dataset in hin and "npx" in hin[dataset].attrs
+    except (OSError, KeyError):
+        return False  # truncated by a killed job
+
+
+class filequeue:
+    """
+    Hands out files to worker processes using a lock file next to each
+    output (created with O_EXCL), so there are no shared memory semaphores.
+    Completed outputs are skipped, so a killed job can just be run again.
+    Failures are counted in a .failed file and retried up to retries times.
+    Locks left by dead processes on this host are taken over. The owner
+    touches its lock every timeout / 4 seconds, so a lock from another host
+    (e.g. a slurm job that was killed and resubmitted elsewhere) is taken
+    over once it is older than timeout. Each lock holds the host and pid of
+    its owner, which only touches and removes a lock that still holds them.
+    """
+
+    def __init__(self, args, retries=2, timeout=600.0):
+        self.args = args
+        self.retries = retries
+        self.timeout = timeout
+        self.host = socket.gethostname()
+        self.queue = None  # files left to try, found on the first claim
+        self.beats = {}
+
+    def lockname(self, arg):
+        return arg[1] + ".lock"
+
+    def failname(self, arg):
+        return arg[1] + ".failed"
+
+    def nfailed(self, arg):
         try:
-            donefile = sys.stdout
-            for fname in mypool.imap_unordered(segment_lima, args, chunksize=1):
-                donefile.write(str(fname) + "\n")
-                donefile.flush()
-        except Exception as e:
-            print("Main loop error: ", e, file=sys.stderr)
-            # If the main loop dies, we must kill the pool to stop things hanging
-            mypool.terminate()        
-        finally:
-            # 4. Clean shutdown
-            print("# Closing pool...", flush=True)
-            mypool.close()
-            mypool.join()
-            print("# Pool closed.", flush=True)
-    else:
-        for arg in args:
+            with open(self.failname(arg), "r") as fin:
+                return int(fin.read().strip() or 0)
+        except (IOError, OSError, ValueError):
+            return 0
+
+    def todo(self):
+        """The files which are not done and can still be tried"""
+        return [
+            arg
+            for arg in self.args
+            if not is_done(arg[1], arg[2]) and self.nfailed(arg) <= self.retries
+        ]
+
+    def _lock(self, arg):
+        try:
+            fd = os.open(self.lockname(arg), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            return False
+        with os.fdopen(fd, "w") as fout:
+            fout.write(self.token())
+        return True
+
+    def token(self):
+        """What this process writes in its locks"""
+        return "%s %d\n" % (self.host, os.getpid())
+
+    def _owned(self, arg):
+        """True if the lock of arg still holds our token"""
+        try:
+            with open(self.lockname(arg), "r") as fin:
+                return fin.read() == self.token()
+        except (IOError, OSError):
+            return False
+
+    def _stale(self, arg):
+        """True if the lock belongs to a process on this host that is gone,
+        or to another host and was not touched for timeout seconds"""
+        try:
+            with open(self.lockname(arg), "r") as fin:
+                host, pid = fin.read().split()
+            pid = int(pid)
+            age = time.time() - os.path.getmtime(self.lockname(arg))
+        except (IOError, OSError, ValueError):
+            return False
+        if host != self.host:
+            return age > self.timeout
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            return False
+        return False
+
+    def _heartbeat(self, arg, stop):
+        """Touches the lock of arg until stop is set"""
+        while not stop.wait(self.timeout / 4):
+            if not self._owned(arg):
+                return  # taken over while we stalled
+            try:
+                os.utime(self.lockname(arg), None)
+            except OSError:
+                pass
+
+    def _claimed(self, arg):
+        """Checks the file we just locked and starts the heartbeat"""
+        if is_done(arg[1], arg[2]) or self.nfailed(arg) > self.retries:
+            os.remove(self.lockname(arg))  # finished while we looked
+            return False
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(arg, stop))
+        beat.daemon = True
+        beat.start()
+        self.beats[arg] = stop, beat
+        return True
+
+    def claim(self):
+        """Locks and returns the next file to do, or None when finished"""
+        if self.queue is None:
+            self.queue = self.todo()
+        while self.queue:
+            arg = self.queue.pop(0)
+            if self._lock(arg):
+                if self._claimed(arg):
+                    return arg
+                continue
+            if self._stale(arg):
+                stale = self.lockname(arg) + ".%d" % (os.getpid())
+                try:  # only one process wins the rename
+                    os.rename(self.lockname(arg), stale)
+                except OSError:
+                    continue
+                os.remove(stale)
+                if self._lock(arg) and self._claimed(arg):
+                    return arg
+        return None
+
+    def release(self, arg, ok):
+        """Marks a claimed file as done (ok) or failed, and unlocks it"""
+        if arg in self.beats:
+            stop, beat = self.beats.pop(arg)
+            stop.set()
+            beat.join()
+        if ok:
+            if os.path.exists(self.failname(arg)):
+                os.remove(self.failname(arg))
+        else:
+            n = self.nfailed(arg) + 1
+            with open(self.failname(arg), "w") as fout:
+                fout.write("%d\n" % (n))
+            if n <= self.retries and self.queue is not None:
+                self.queue.append(arg)  # try again later
+        if self._owned(arg):
+            os.remove(self.lockname(arg))
+        else:
+            logging.warning("Lock %s was taken over, not removed" % (self.lockname(arg)))
+
+
+def remove_partial(destname, dataset):
+    """Removes what a killed job left of dataset in destname"""
+    if not os.path.exists(destname):
+        return
+    try:
+        with h5py.File(destname, "a") as hout:
+            if dataset in hout:
+                del hout[dataset]
+    except OSError:
+        os.remove(destname)  # not even readable
+
+
+def worker(h5name, jobid, retries=2):
+    """Segments files from the job queue until there are none left"""
+    initOptions(h5name, jobid)
+    todo = filequeue(job_args(OPTIONS), retries=retries)
+    while True:
+        arg = todo.claim()
+        if arg is None:
+            break
+        try:
+            remove_partial(arg[1], arg[2])
             fname = segment_lima(arg)
+            ok = True
+        except Exception as e:
+            print("# Failed on", arg[0], e, file=sys.stderr)
+            ok = False
+        todo.release(arg, ok)
+        if ok:
             print(fname)
             sys.stdout.flush()
+
+
+def main(h5name, jobid, retries=2):
+    #flake8: global OPTIONS
+    initOptions(h5name, jobid)
+    options = OPTIONS
+    assert options is not None
+    assert OPTIONS is not None
+    todo = filequeue(job_args(options), retries=retries)
+    ntodo = len(todo.todo())
+    print("# Files in job", len(todo.args), "to do", ntodo, flush=True)
+    nproc = min(options.cores_per_job, ntodo)
+    if nproc > 1:
+        # Separate worker processes sharing the file queue. No fork and
+        # no multiprocessing semaphores in /dev/shm
+        cmd = [sys.executable, "-m", "ImageD11.sinograms.lima_segmenter"]
+        cmd += ["worker", h5name, str(jobid), str(retries)]
+        print("# Starting", nproc, "workers", flush=True)
+        workers = [subprocess.Popen(cmd) for _ in range(nproc)]
+        for w in workers:
+            w.wait()
+        # anything left from workers that died
+        worker(h5name, jobid, retries)
+    elif ntodo > 0:
+        worker(h5name, jobid, retries)
+    failed = [arg[0] for arg in todo.args if not is_done(arg[1], arg[2])]
+    for fname in failed:
+        print("# Failed", fname, file=sys.stderr)
     print("# All done")
+    return failed
 
 
 def setup_slurm_array(dsname, dsgroup="/", pythonpath=None):
@@ -420,7 +1013,7 @@ def setup_slurm_array(dsname, dsgroup="/", pythonpath=None):
     dstlima = [os.path.join(dso.analysispath, name) for name in dso.sparsefiles]
     done = 0
     for d in dstlima:
-        if os.path.exists(d):
+        if is_done(d, dso.limapath):
             done += 1
     print("total files to process", nfiles, "done", done)
     if done == nfiles:
@@ -507,11 +1100,25 @@ def setup(
     cores_per_job=16,
     files_per_core=4,
     pythonpath=None,
+    flush_pixels=CHUNK * 16,
+    segment_threads=0,
+    nsigma=0,
+    parfile=None,
+    radial_bins=1000,
+    bg_decay=0.05,
 ):
     """
     Writes options into the dataset file
     cut=None is replaced by 1 for eiger, 25 otherwise
     pythonpath -> point to a non-default install
+    flush_pixels -> pixels collected in memory before writing
+    segment_threads -> > 0 to overlap reading, segmenting and writing
+                       (use fewer cores_per_job)
+    nsigma -> > 0 to cut each frame at a running background + nsigma * noise
+              (cut is then the lowest cut allowed)
+    parfile -> geometry to average the background in radial_bins 2theta bins,
+               None uses the dataset parfile, "" for a per pixel background
+    bg_decay -> weight of each new frame in the running background
     """
     dso = dataset.load(dsname)
     if cut is None:
@@ -527,6 +1134,8 @@ def setup(
     # Use background file from dataset if no bgfile provided and dataset has one
     if len(bgfile) == 0 and hasattr(dso, "bgfile"):
         bgfile = dso.bgfile
+    if parfile is None:
+        parfile = getattr(dso, "parfile", None) or ""
     options = SegmenterOptions(
         cut=cut,
         howmany=howmany,
@@ -535,6 +1144,12 @@ def setup(
         bgfile=bgfile,
         cores_per_job=cores_per_job,
         files_per_core=files_per_core,
+        flush_pixels=flush_pixels,
+        segment_threads=segment_threads,
+        nsigma=nsigma,
+        parfile=parfile,
+        radial_bins=radial_bins,
+        bg_decay=bg_decay,
     )
     options.save(dsname, "lima_segmenter")
     return setup_slurm_array(dsname, pythonpath=pythonpath)
@@ -556,3 +1171,6 @@ if __name__ == "__main__":
 
     if sys.argv[1] == "segment":
         segment()
+
+    if sys.argv[1] == "worker":
+        worker(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
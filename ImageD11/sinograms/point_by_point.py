@@ -19,6 +19,8 @@ except ImportError:
     threadpoolctl = None
 
 import multiprocessing
+import glob
+import shutil
 import time, random
 import numpy as np
 import subprocess
@@ -41,6 +43,7 @@ import ImageD11.sinograms.dataset
 import ImageD11.indexing
 from ImageD11.columnfile import columnfile
 from ImageD11.sinograms import geometry
+from ImageD11.sinograms.voxel_mask import VoxelSinoMasker
 from ImageD11.sinograms.roi_iradon import run_iradon
 from ImageD11.sinograms.tensor_map import unitcell_to_b
 from ImageD11.sinograms.sinogram import save_array
@@ -648,6 +651,231 @@ class PBPMap(columnfile):
         plt.show()
 
 
+class PBPStore:
+    """Append only HDF5 file for the results of PBP.point_by_point.
+    There is one row per UBI, with the columns of the text output:
+
+    #  i  j  ntotal  nuniq  ubi00  ubi01  ubi02  ubi10  ubi11  ubi12  ubi20  ubi21  ubi22
+
+    These go in the group "pbpmap", as PBPRefine.savemap would write them,
+    so PBPMap(filename) and PBPRefine.loadmap(filename) can read the file.
+
+    The HDF5 file is never modified in place, as a job killed in the middle
+    of an HDF5 write can leave the whole file unreadable. Every flush_points
+    points the rows are saved as a new numbered .npy file in the folder
+    filename + ".segments" (written to a temporary name and then renamed).
+    close(), or opening the store again after a crash, writes the HDF5 file
+    with all the rows to a temporary file, renames it over filename and
+    removes the segments. A job that is killed loses at most the last
+    flush_points points.
+    """
+
+    titles = ["i", "j", "ntotal", "nuniq"] + ["ubi%d%d" % (a, b) for a in range(3) for b in range(3)]
+
+    def __init__(self, filename, name="pbpmap", flush_points=1000, overwrite=False):
+        self.filename = filename
+        self.name = name
+        self.flush_points = flush_points
+        self.segdir = pbp_store_segdir(filename)
+        self._rows = []
+        self._npoints = 0
+        if overwrite and os.path.exists(self.segdir):
+            shutil.rmtree(self.segdir)
+        self.consolidate(overwrite=overwrite)
+
+    def consolidate(self, overwrite=False):
+        """Writes the rows of the segments into the HDF5 file (via a new file)
+        and removes the segments. overwrite = drop the rows already there"""
+        rows, merged = _read_store(self.filename, self.name)
+        if overwrite:
+            rows = rows[:0]
+        segments = _store_segments(self.filename, merged)
+        exists = rows.shape[0] > 0 or _has_group(self.filename, self.name)
+        if len(segments) or overwrite or not exists:
+            rows = np.concatenate([rows] + [np.load(path) for _, path in segments])
+            if len(segments):
+                merged = segments[-1][0]
+            _write_store(self.filename, self.name, rows, merged)
+        self.nrows = len(rows)
+        self.merged = merged
+        self.nseg = merged
+        if os.path.exists(self.segdir):
+            for fname in os.listdir(self.segdir):
+                # merged already (killed before removing them) or temporary
+                if not fname.endswith(".npy") or int(fname.split(".")[0]) <= merged:
+                    os.remove(os.path.join(self.segdir, fname))
+
+    def done_points(self):
+        """The (i, j) points already written to the file"""
+        return pbp_done_points([self.filename], name=self.name)
+
+    def append(self, i, j, grains):
+        """Adds the grains [(ntotal, nuniq, ubi), ...] found at point (i, j)"""
+        rows = np.empty((len(grains), len(self.titles)), float)
+        for k, (n, u, ubi) in enumerate(grains):
+            rows[k, :4] = i, j, n, u
+            rows[k, 4:] = np.ravel(ubi)
+        self._rows.append(rows)
+        self._npoints += 1
+        if self._npoints >= self.flush_points:
+            self.flush()
+
+    def append_rows(self, rows):
+        """Adds rows (n, 13) in the order of self.titles"""
+        self._rows.append(np.asarray(rows, float).reshape(-1, len(self.titles)))
+
+    def flush(self):
+        """Writes the rows held in memory to a new segment"""
+        rows = np.concatenate(self._rows) if len(self._rows) else np.empty((0, len(self.titles)))
+        if len(rows):
+            if not os.path.exists(self.segdir):
+                os.makedirs(self.segdir)
+            self.nseg += 1
+            segname = os.path.join(self.segdir, "%06d.npy" % (self.nseg))
+            tmpname = segname + ".tmp"
+            with open(tmpname, "wb") as fout:
+                np.save(fout, rows)
+                fout.flush()
+                os.fsync(fout.fileno())
+            os.replace(tmpname, segname)
+            self.nrows += len(rows)
+        self._rows = []
+        self._npoints = 0
+
+    def close(self):
+        self.flush()
+        self.consolidate()
+        if os.path.exists(self.segdir) and not os.listdir(self.segdir):
+            os.rmdir(self.segdir)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def pbp_store_segdir(filename):
+    """Folder of the segments of a PBPStore not yet merged into filename"""
+    return filename + ".segments"
+
+
+def _has_group(filename, name):
+    if not os.path.exists(filename):
+        return False
+    with h5py.File(filename, "r") as hin:
+        return name in hin
+
+
+def _read_store(filename, name):
+    """rows (n, 13) in the HDF5 file of a PBPStore and the last segment merged"""
+    rows = np.empty((0, len(PBPStore.titles)))
+    merged = 0
+    if _has_group(filename, name):
+        with h5py.File(filename, "r") as hin:
+            g = hin[name]
+            nrows = int(g.attrs.get("nrows", len(g["i"])))
+            merged = int(g.attrs.get("segments_merged", 0))
+            rows = np.column_stack([g[t][:nrows] for t in PBPStore.titles])
+    return rows, merged
+
+
+def _store_segments(filename, merged):
+    """[(number, path), ...] of the complete segments after merged"""
+    segdir = pbp_store_segdir(filename)
+    if not os.path.exists(segdir):
+        return []
+    segments = []
+    for fname in os.listdir(segdir):
+        if fname.endswith(".npy") and int(fname.split(".")[0]) > merged:
+            segments.append((int(fname.split(".")[0]), os.path.join(segdir, fname)))
+    return sorted(segments)
+
+
+def _write_store(filename, name, rows, merged):
+    """Writes a new file with the rows in group name (and the other groups
+    of filename) and renames it over filename"""
+    tmpname = filename + ".tmp"
+    with h5py.File(tmpname, "w") as hout:
+        if os.path.exists(filename):
+            with h5py.File(filename, "r") as hin:
+                for key, value in hin.attrs.items():
+                    hout.attrs[key] = value
+                for key in hin:
+                    if key != name:
+                        hin.copy(key, hout)
+        g = hout.create_group(name)
+        g.attrs["ImageD11_type"] = "peaks"
+        g.attrs["nrows"] = len(rows)
+        g.attrs["segments_merged"] = merged
+        for k, t in enumerate(PBPStore.titles):
+            g.create_dataset(t, data=rows[:, k], maxshape=(None,), chunks=(4096,))
+    os.replace(tmpname, filename)
+
+
+def pbp_store_rows(filename, name="pbpmap"):
+    """All the rows (n, 13) of a PBPStore, including segments not merged yet"""
+    rows, merged = _read_store(filename, name)
+    segments = [np.load(path) for _, path in _store_segments(filename, merged)]
+    return np.concatenate([rows] + segments)
+
+
+class PBPTextFile:
+    """The text output of PBP.point_by_point, written as it comes, for PBPMap"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.gout = open(filename, "w")
+        self.gout.write(
+            "#  i  j  ntotal  nuniq  ubi00  ubi01  ubi02  ubi10  ubi11  ubi12  ubi20  ubi21  ubi22\n"
+        )
+
+    def append(self, i, j, grains):
+        """Adds the grains [(ntotal, nuniq, ubi), ...] found at point (i, j)"""
+        for n, u, ubi in grains:
+            self.gout.write("%d  %d  %d  %d  " % (i, j, n, u))
+            self.gout.write(("%f " * 9) % tuple(ubi.ravel()) + "\n")
+            self.gout.flush()
+
+    def close(self):
+        self.gout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def pbp_text_to_hdf(txtfile, h5file, name="pbpmap"):
+    """Converts a text grains file from PBP.point_by_point into a PBPStore"""
+    pmap = PBPMap(txtfile)
+    with PBPStore(h5file, name=name, overwrite=True) as store:
+        store.append_rows(np.column_stack([pmap.getcolumn(t) for t in PBPStore.titles]))
+    return h5file
+
+
+def pbp_done_points(filenames, name="pbpmap"):
+    """Set of the (i, j) points found in the PBPStore files (missing files are skipped).
+    idxpoint always gives at least one row per point, so these are the finished points.
+    """
+    done = set()
+    for fname in filenames:
+        if not os.path.exists(fname) and not os.path.exists(pbp_store_segdir(fname)):
+            continue
+        rows = pbp_store_rows(fname, name)
+        done.update(zip(rows[:, 0].astype(int).tolist(), rows[:, 1].astype(int).tolist()))
+    return done
+
+
+def merge_pbp_stores(filenames, h5file, name="pbpmap"):
+    """Copies the rows of several PBPStore files (e.g. slurm chunks) into one"""
+    with PBPStore(h5file, name=name, overwrite=True) as store:
+        for fname in filenames:
+            store.append_rows(pbp_store_rows(fname, name))
+    return h5file
+
+
 class PBPRefine:
     """Class to manage point-by-point refinement.
     The maps in this class are set up on a grid that matches the PBPMap reference frame
@@ -715,7 +943,8 @@ class PBPRefine:
         self.sx_grid, self.sy_grid = np.meshgrid(sx, sy, indexing='ij')
 
     def loadmap(self, filename=None, refined=False):
-        """Load an existing input/refined PBPMap from h5. If you only have a .txt file, you want self.setmap()"""
+        """Load an existing input/refined PBPMap from h5, such as a PBPStore from PBP.point_by_point.
+        If you only have a .txt file, you want self.setmap() or pbp_text_to_hdf()"""
         if filename is None:
             # use the default from the init
             if refined:
@@ -1709,6 +1938,63 @@ def get_local_gv(si, sj, ystep, omega, sinomega, cosomega, xl, yl, zl):
     return gv, gx, gy, gz
 
 
+def voxel_masker(omega, dtyi, ystep, ymin):
+    """
+    Partitions the peaks by omega and dtyi for masker_peaks.
+    Made once, then used for all the points.
+    """
+    dty = geometry.dtyi_to_dty(dtyi, ystep, ymin)  # on the grid
+    masker = VoxelSinoMasker(np.array(omega, float), dty, ystep)
+    binsize = masker._heuristic_omega_binsize()
+    if not np.isfinite(binsize):  # all peaks at dty == 0
+        binsize = 360.0
+    masker.partition(binsize)
+    return masker
+
+
+def masker_peaks(masker, si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin):
+    """
+    Same peaks as geometry.dtyimask_from_step_sincos(si, sj, ...) but as
+    sorted indices. The masker gives the peaks within ystep of the point and
+    only those are checked, instead of all the peaks.
+    """
+    sx, sy = geometry.step_to_sample(si, sj, ystep)
+    idx, _ = masker.mask(sx, sy, ystep, y0)
+    ip = np.sort(masker.peak_ordering[idx])
+    m = geometry.dtyimask_from_sample_sincos(
+        sx, sy, sinomega[ip], cosomega[ip], dtyi[ip], y0, ystep, ymin
+    )
+    return ip[m]
+
+
+def step_tiles(points, tilesize):
+    """
+    Groups the (si, sj) points into square tiles of tilesize x tilesize steps.
+    Neighbouring points see mostly the same peaks, so they are indexed together.
+    Returns a list of lists of points
+    """
+    tiles = {}
+    for si, sj in points:
+        si, sj = int(si), int(sj)
+        tiles.setdefault((si // tilesize, sj // tilesize), []).append((si, sj))
+    return list(tiles.values())
+
+
+def tile_peaks(masker, points, ystep, y0):
+    """
+    Sorted indices of the peaks that any of the points (si, sj) can select.
+    A point selects peaks with dty within ystep/2 of its own dty_calc, and
+    dty_calc changes by no more than the distance from the tile centre.
+    """
+    si, sj = np.array(points, float).T
+    sx, sy = geometry.step_to_sample(si, sj, ystep)
+    cx = (sx.min() + sx.max()) / 2
+    cy = (sy.min() + sy.max()) / 2
+    r = np.sqrt(((sx - cx) ** 2 + (sy - cy) ** 2).max())
+    idx, _ = masker.mask(cx, cy, ystep, y0, ytol=ystep * (0.5 + 1e-6) + r)
+    return np.sort(masker.peak_ordering[idx])
+
+
 def idxpoint(
         si,
         sj,
@@ -1731,6 +2017,8 @@ def idxpoint(
         forgen=None,
         hmax=-1,  # auto
         uniqcut=0.75,
+        masker=None,
+        indexer=None,
 ):
     """
     Indexing function called at one point in space.
@@ -1756,6 +2044,10 @@ def idxpoint(
 
     uniqcut = unique peaks cutoff (uniq> ucut * max are returned)
 
+    masker = voxel_masker for the peaks, to avoid looking at all of them
+
+    indexer = ImageD11.indexing.indexer to reuse (see get_indexer)
+
     returns a list of :
         (npks, nuniq, ubi)
     """
@@ -1765,9 +2057,11 @@ def idxpoint(
     mr = isel
     # mask all the peaks by dtyi and omega (for scoring)
 
-    m = geometry.dtyimask_from_step_sincos(si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin)
-    # combine masks together (for indexing)
-    local_mask = m & mr
+    if masker is None:
+        m = geometry.dtyimask_from_step_sincos(si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin)
+    else:
+        # the same peaks, as indices
+        m = masker_peaks(masker, si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin)
 
     # we need to index using peaks[m & mr]
     # then score with peaks[m]
@@ -1779,14 +2073,19 @@ def idxpoint(
     eta_local = eta[m]
 
     # mask g-vectors to [m & mr]
-    gv_local_mask = gv[local_mask[m], :]
+    gv_local_mask = gv[mr[m], :]
 
     # index with masked g-vectors
-    ind = ImageD11.indexing.indexer(
-        unitcell=ucglobal,
-        wavelength=parglobal.get("wavelength"),
-        gv=gv_local_mask,
-    )
+    if indexer is None:
+        ind = ImageD11.indexing.indexer(
+            unitcell=ucglobal,
+            wavelength=parglobal.get("wavelength"),
+            gv=gv_local_mask,
+        )
+    else:
+        # keeps the rings and tables from the previous points
+        ind = indexer
+        ind.reset_gv(gv_local_mask)
     ind.minpks = minpks
     ind.hkl_tol = hkl_tol
     ind.cosine_tol = cosine_tol  # degrees
@@ -1839,6 +2138,8 @@ def proxy(args):
     """Wrapper function for multiprocessing"""
     i, j, idxopts = args
     sm = colglobal
+    masker = get_masker(idxopts["ystep"], idxopts["ymin"])
+    indexer = get_indexer(idxopts["ds_tol"])
     g = idxpoint(
         i,
         j,
@@ -1851,20 +2152,69 @@ def proxy(args):
         sm["yl"],
         sm["zl"],
         sm["eta"],
+        masker=masker,
+        indexer=indexer,
         **idxopts
     )
     return i, j, g
 
 
 # one of these per process:
+def proxy_tile(args):
+    """Wrapper function for multiprocessing, for a tile of points"""
+    points, idxopts = args
+    sm = colglobal
+    masker = get_masker(idxopts["ystep"], idxopts["ymin"])
+    indexer = get_indexer(idxopts["ds_tol"])
+    ip = tile_peaks(masker, points, idxopts["ystep"], idxopts["y0"])
+    # the peaks for the whole tile, each point then masks these
+    cols = [
+        sm[name][ip]
+        for name in ("isel", "omega", "sinomega", "cosomega", "dtyi", "xl", "yl", "zl", "eta")
+    ]
+    results = []
+    for i, j in points:
+        g = idxpoint(i, j, *cols, indexer=indexer, **idxopts)
+        results.append((i, j, g))
+    return results
+
+
 ucglobal = None
 symglobal = None
 parglobal = None
 colglobal = None
+maskerglobal = None
+indexerglobal = None
+
+
+def get_masker(ystep, ymin):
+    """The voxel_masker for colglobal, made on the first call"""
+    global maskerglobal
+    if maskerglobal is None:
+        maskerglobal = voxel_masker(colglobal["omega"], colglobal["dtyi"], ystep, ymin)
+    return maskerglobal
+
+
+def get_indexer(ds_tol):
+    """
+    The indexer used for all the points in this worker, made on the first call.
+    The hkl rings are made once for all the peaks in colglobal and the
+    cosines between rings are kept. idxpoint only gives it new g-vectors.
+    """
+    global indexerglobal
+    if indexerglobal is None:
+        ind = ImageD11.indexing.indexer(
+            unitcell=unitcell.unitcell_from_parameters(parglobal),  # not shared
+            wavelength=parglobal.get("wavelength"),
+        )
+        ind.ds_tol = ds_tol
+        ind.makerings(colglobal["ds"].max())
+        indexerglobal = ind
+    return indexerglobal
 
 
 def initializer(parfile, phase_name, symmetry, colfile, loglevel=3):
-    global ucglobal, symglobal, parglobal, colglobal
+    global ucglobal, symglobal, parglobal, colglobal, maskerglobal, indexerglobal
     if threadpoolctl is not None:
         threadpoolctl.threadpool_limits(limits=1)
     parglobal = parameters.read_par_file(parfile, phase_name=phase_name)
@@ -1872,6 +2222,8 @@ def initializer(parfile, phase_name, symmetry, colfile, loglevel=3):
     symglobal = sym_u.getgroup(symmetry)()
     colglobal = ImageD11.columnfile.mmap_h5colf(colfile)
     colglobal.isel = colglobal.isel.astype(bool)
+    maskerglobal = None
+    indexerglobal = None
     ImageD11.indexing.loglevel = loglevel
 
 
@@ -2051,7 +2403,15 @@ class PBP:
             f.write("uniqcut={}\n".format(self.uniqcut))
             f.write("nprocs={}\n".format(cpus_per_chunk))
 
-    def submit_slurm_chunks(self, grains_prefix, id11_code_path, gridstep=1, n_chunks=4, cpus_per_chunk=64, time_h=48, partition="nice-long", mem_G=32, debugpoints=None):
+    def submit_slurm_chunks(self, grains_prefix, id11_code_path, gridstep=1, n_chunks=4, cpus_per_chunk=64, time_h=48, partition="nice-long", mem_G=32, debugpoints=None, resume=False):
+        """
+        Writes a slurm job array running point_by_point on n_chunks chunks of the points.
+        Returns the path of the sbatch script and the list of the grains files it writes.
+
+        resume = the chunks write PBPStore files ({grains_prefix}N.h5) and append to them.
+                 Points found in any of these files are left out of the chunks, so a map
+                 that ran out of time can be finished by calling this again and resubmitting.
+        """
         ds = self.dset
         slurm_pbp_path = os.path.join(ds.analysispath, "slurm_pbp")
 
@@ -2071,6 +2431,15 @@ class PBP:
             all_points = geometry.step_grid_from_ybincens(self.ybincens, self.ystep, gridstep, self.y0)
         else:
             all_points = np.array(debugpoints)
+
+        grains_suffix = ".h5" if resume else ".txt"
+        grains_files = ['{}{}{}'.format(grains_prefix, chunk, grains_suffix) for chunk in range(n_chunks)]
+        if resume:
+            # previous submissions may have used other chunks
+            stores = glob.glob(grains_prefix + "*.h5")
+            done = pbp_done_points(sorted(set(stores + grains_files)))
+            all_points = np.array([p for p in all_points if (int(p[0]), int(p[1])) not in done], int).reshape(-1, 2)
+            print("Resuming: %d points done, %d to do" % (len(done), len(all_points)))
         
         # Split into chunks, one per array task
         chunks = np.array_split(all_points, n_chunks)
@@ -2096,7 +2465,7 @@ class PBP:
 #SBATCH --mem={mem_G}G
 CHUNK_FILE={chunk_prefix}${{SLURM_ARRAY_TASK_ID}}{chunk_suffix}
 OMP_NUM_THREADS=1 PYTHONPATH={id11_code_path} python {python_script_path} \
-{config_path} $CHUNK_FILE {grains_prefix}${{SLURM_ARRAY_TASK_ID}}.txt
+{config_path} $CHUNK_FILE {grains_prefix}${{SLURM_ARRAY_TASK_ID}}{grains_suffix}{resume}
 """.format(
             outfile_path=outfile_path,
             errfile_path=errfile_path,
@@ -2110,15 +2479,14 @@ OMP_NUM_THREADS=1 PYTHONPATH={id11_code_path} python {python_script_path} \
             id11_code_path=id11_code_path,
             python_script_path=python_script_path,
             config_path=config_path,
-            grains_prefix=grains_prefix
+            grains_prefix=grains_prefix,
+            grains_suffix=grains_suffix,
+            resume=" resume" if resume else "",
         )
         
         with open(bash_script_path, 'w') as f:
             f.write(sbatch_content)
 
-        # output file paths
-        grains_files = ['{}{}.txt'.format(grains_prefix, chunk) for chunk in range(n_chunks)]
-        
         return bash_script_path, grains_files
     
     def point_by_point(
@@ -2129,11 +2497,22 @@ OMP_NUM_THREADS=1 PYTHONPATH={id11_code_path} python {python_script_path} \
             gridstep=1,
             debugpoints=None,
             loglevel=3,
+            tilesize=4,
+            flush_points=1000,
+            resume=False,
     ):
         """
-        grains_filename = output file
+        grains_filename = output file. Names ending .h5/.hdf/.hdf5 give a PBPStore,
+                          anything else the text format.
         icolf_filename = hdf5file to write. Allows mmap to be used.
+        tilesize = points are sent to the workers in tiles of tilesize x tilesize
+        flush_points = how often a PBPStore is written to disk
+        resume = append to an existing PBPStore and skip the points already in it,
+                 e.g. to restart a job that was killed
         """
+        is_hdf = str(grains_filename).lower().endswith(ImageD11.columnfile.colfile_writer.HDF_EXTENSIONS)
+        if resume and not is_hdf:
+            raise ValueError("resume needs a PBPStore (.h5) grains_filename")
         if icolf_filename is not None:
             self.icolf_filename = icolf_filename
         
@@ -2159,17 +2538,29 @@ OMP_NUM_THREADS=1 PYTHONPATH={id11_code_path} python {python_script_path} \
         pprint.pprint(idxopt)
 
         if debugpoints is None:
-            args = [(i, j, idxopt) for (i, j) in geometry.step_grid_from_ybincens(self.ybincens, self.ystep, gridstep, self.y0)]
-            random.shuffle(args)
+            points = geometry.step_grid_from_ybincens(self.ybincens, self.ystep, gridstep, self.y0)
         else:
-            args = [(i, j, idxopt) for i, j in debugpoints]
+            points = debugpoints
+        if resume:
+            done = pbp_done_points([grains_filename])
+            points = [p for p in points if (int(p[0]), int(p[1])) not in done]
+            print("Resuming: %d points already in %s" % (len(done), grains_filename))
+        tiles = step_tiles(points, tilesize)
+        if debugpoints is None:
+            random.shuffle(tiles)
+        args = [(tile, idxopt) for tile in tiles]
+        npoints = sum(len(tile) for tile in tiles)
+        if npoints == 0:
+            print("No points to do")
+            return
         gmap = {}
         t0 = time.time()
         # main process is writing
-        with open(grains_filename, "w") as gout:
-            gout.write(
-                "#  i  j  ntotal  nuniq  ubi00  ubi01  ubi02  ubi10  ubi11  ubi12  ubi20  ubi21  ubi22\n"
-            )
+        if is_hdf:
+            gout = PBPStore(grains_filename, flush_points=flush_points, overwrite=not resume)
+        else:
+            gout = PBPTextFile(grains_filename)
+        with gout:
             done = 0
             ng = 0
             with multiprocessing.Pool(
@@ -2183,35 +2574,31 @@ OMP_NUM_THREADS=1 PYTHONPATH={id11_code_path} python {python_script_path} \
                             self.loglevel,
                     ),
             ) as p:
-                for i, j, g in p.imap_unordered(proxy, args):
-                    gmap[i, j] = g
-                    done += 1
-                    ng += len(g)
-                    if done % nprocs == 0:
-                        sys.stdout.flush()  # before!
-                        dt = time.time() - t0
-                        print(
-                            "Done %7.3f %%, average grains/point %6.2f, %.3f /s/point, total %.1f /s"
-                            % (
-                                100.0 * done / len(args),
-                                float(ng) / done,
-                                dt / done,
-                                dt,
-                            ),
-                            end="\r",
-                        )
-                    sys.stdout.flush()
-                    for k in range(min(self.gmax, len(g))):
+                for tile in p.imap_unordered(proxy_tile, args):
+                    for i, j, g in tile:
+                        gmap[i, j] = g
+                        done += 1
+                        ng += len(g)
+                        if done % nprocs == 0:
+                            sys.stdout.flush()  # before!
+                            dt = time.time() - t0
+                            print(
+                                "Done %7.3f %%, average grains/point %6.2f, %.3f /s/point, total %.1f /s"
+                                % (
+                                    100.0 * done / npoints,
+                                    float(ng) / done,
+                                    dt / done,
+                                    dt,
+                                ),
+                                end="\r",
+                            )
+                        sys.stdout.flush()
                         # only output gmax grains per point max
-                        n, u, ubi = g[k]
-                        # print(g[k])
-                        gout.write("%d  %d  %d  %d  " % (i, j, n, u))
-                        gout.write(("%f " * 9) % tuple(ubi.ravel()) + "\n")
-                        gout.flush()
+                        gout.append(i, j, g[: self.gmax])
 
         end = time.time()
-        print(end - start, "seconds", (end - start) / len(args), "s per point")
-        print(end - t0, "seconds", (end - t0) / len(args), "s per point without setup")
+        print(end - start, "seconds", (end - start) / npoints, "s per point")
+        print(end - t0, "seconds", (end - t0) / npoints, "s per point without setup")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from __future__ import print_function
 
 
 import os
+import glob
 import logging
 import sys
 import time
@@ -11,6 +12,7 @@ import numpy as np
 import h5py
 import scipy.sparse
 import scipy.sparse.csgraph
+import ImageD11.columnfile
 import ImageD11.sinograms.dataset
 import ImageD11.sparseframe
 import numba
@@ -192,18 +194,145 @@ def pairscans(s1, s2, omegatol=0.051):
     return pairs
 
 
-def props(scan, i, algorithm="lmlabel", wtmax=None):
+@numba.njit(nogil=True)
+def overlap_coo(
+    row1, col1, lab1, ipt1, pk1, row2, col2, lab2, ipt2, pk2, frames1, frames2, start, out, keys
+):
+    """
+    Finds the overlapping peaks for the frame pairs (frames1[p], frames2[p])
+    of two labelled scans, for p starting from start.
+
+    rowN, colN, labN = pixels and labels (1 to nlabels per frame)
+    iptN = pointers to the pixels of each frame
+    pkN = pointers to the first peak of each frame
+    out = (3, n) array to receive (peak1, peak2, npixels) with peaks
+          numbered pk[frame] + label - 1. Ordered by frame pair, peak1, peak2
+    keys = workspace, >= pixels in a frame
+
+    returns (next p to do, number written) : stops early if out is full
+    """
+    n = 0
+    for p in range(start, frames1.shape[0]):
+        f1 = frames1[p]
+        f2 = frames2[p]
+        a, e1 = ipt1[f1], ipt1[f1 + 1]
+        b, e2 = ipt2[f2], ipt2[f2 + 1]
+        if n + min(e1 - a, e2 - b) > out.shape[1]:
+            return p, n
+        nk = 0
+        while a < e1 and b < e2:
+            if row1[a] > row2[b]:
+                b += 1
+            elif row1[a] < row2[b]:
+                a += 1
+            elif col1[a] > col2[b]:
+                b += 1
+            elif col1[a] < col2[b]:
+                a += 1
+            else:
+                if lab1[a] > 0 and lab2[b] > 0:
+                    keys[nk] = (np.int64(lab1[a]) << 32) + lab2[b]
+                    nk += 1
+                a += 1
+                b += 1
+        if nk == 0:
+            continue
+        k = np.sort(keys[:nk])
+        t = 1
+        for q in range(1, nk + 1):
+            if q < nk and k[q] == k[q - 1]:
+                t += 1
+                continue
+            out[0, n] = pk1[f1] + (k[q - 1] >> 32) - 1
+            out[1, n] = pk2[f2] + (k[q - 1] & 0xFFFFFFFF) - 1
+            out[2, n] = t
+            n += 1
+            t = 1
+    return frames1.shape[0], n
+
+
+def scan_overlaps(s1, s2, frames1, frames2):
+    """
+    s1, s2 = labelled SparseScans (can be the same scan)
+    frames1, frames2 = frames to compare in each
+
+    returns array (3, nedge) of (peak in s1, peak in s2, npixels)
+    with the peaks numbered from 0 in each scan.
+    All frame pairs are done in a single compiled call, the output
+    only grows if the first guess at the size was too small.
+    """
+    frames1 = np.asarray(frames1, np.intp)
+    frames2 = np.asarray(frames2, np.intp)
+    pk1 = ImageD11.sparseframe.nnz_to_pointer(s1.nlabels)
+    pk2 = ImageD11.sparseframe.nnz_to_pointer(s2.nlabels)
+    keys = np.empty(max(s1.nnz.max(), s2.nnz.max(), 1), np.int64)
+    nnzmax = keys.shape[0]
+    out = np.empty((3, max(pk1[-1] + pk2[-1], nnzmax)), np.int64)
+    p, n = 0, 0
+    while True:
+        p, m = overlap_coo(
+            s1.row, s1.col, s1.labels, s1.ipt, pk1,
+            s2.row, s2.col, s2.labels, s2.ipt, pk2,
+            frames1, frames2, p, out[:, n:], keys,
+        )
+        n += m
+        if p == len(frames1):
+            return out[:, :n].copy()
+        grown = np.empty((3, max(2 * out.shape[1], n + nnzmax)), np.int64)
+        grown[:, :n] = out[:, :n]
+        out = grown
+
+
+def pairrow_coo(s):
+    """
+    s = labelled SparseScan
+
+    Same overlaps as pairrow, between frames that are next to each other
+    in omega, as an array (3, nedge) of (peak, peak, npixels). See scan_overlaps.
+    """
+    order = np.argsort(s.motors["omega"])  # not mod 360 here
+    f0, f1 = order[:-1], order[1:]
+    keep = (s.nnz[f0] > 0) & (s.nnz[f1] > 0)
+    return scan_overlaps(s, s, f0[keep], f1[keep])
+
+
+def pairscans_coo(s1, s2, omegatol=0.051):
+    """
+    s1, s2 = labelled SparseScans
+
+    Same overlaps as pairscans, between frames at the same omega, as an
+    array (3, nedge) of (peak in s1, peak in s2, npixels). See scan_overlaps.
+    """
+    assert len(s1.nnz) == len(s2.nnz)
+    omega_1 = s1.motors["omega"] % 360
+    omega_2 = s2.motors["omega"] % 360
+    frames1, frames2 = [], []
+    for i in range(len(s1.nnz)):
+        j = np.argmin(abs(omega_2 - omega_1[i]))
+        if abs(omega_1[i] - omega_2[j]) > omegatol:
+            continue
+        if (s1.nnz[i] == 0) or (s2.nnz[j] == 0):
+            continue
+        frames1.append(i)
+        frames2.append(j)
+    return scan_overlaps(s1, s2, frames1, frames2)
+
+
+def props(scan, i, algorithm="lmlabel", wtmax=None, nthreads=1, coo=False):
     """
     scan = sparseframe.SparseScan object
     i = sinogram row id : used for tagging pairs
     algorithm = 'lmlabel' | 'cplabel'
+    nthreads = threads used for labelling the frames
+    coo = return the pairs from pairrow_coo instead of pairrow
 
     Labels the peaks with lmlabel
     Assumes a regular scan for labelling frames
     returns ( row, properties[(s1,sI,sRow,sCol,frame),:], pairs, scan )
     """
     scan.sinorow = i
-    getattr(scan, algorithm)(countall=False)  # labels all the pixels in the scan.
+    # labels all the pixels in the scan.
+    getattr(scan, algorithm)(countall=False, nthreads=nthreads)
     npks = scan.total_labels
     r = np.empty((5, npks), np.int64)
     s = 0
@@ -241,6 +370,9 @@ def props(scan, i, algorithm="lmlabel", wtmax=None):
         r[4, s:e] = j + j0
         s = e
     # Matrix entries for this scan with itself:
+    if coo:
+        scan.sinorow = i
+        return r, pairrow_coo(scan)
     pairs = pairrow(scan, i)
     return r, pairs
 
@@ -351,12 +483,14 @@ class pks_table:
         glabel=None,
         nlabel=0,
         use_shm=False,
+        with_rc=True,
     ):
         """
         Cases:
            Create from npks counting -> here
            Read from a file          -> classmethod pks_table.load( h5name )
            Read from shared memory   -> classmethod pks_table.fromSHM( h5name )
+        with_rc = False to not allocate the overlaps matrix (streamed instead)
         """
         self.npk = npk
         self.ipk = ipk
@@ -366,6 +500,7 @@ class pks_table:
         self.glabel = glabel
         self.nlabel = nlabel
         self.use_shm = use_shm
+        self.with_rc = with_rc
         self.shared = {}
         # otherwise create
         if self.npk is not None:
@@ -396,7 +531,8 @@ class pks_table:
         rpk[1:] = np.cumsum(npk[:, 1] + npk[:, 2])
         self.rpk = self.share("rpk", rpk)
         self.pk_props = self.share("pk_props", shape=(5, s[0]), dtype=np.int64)
-        self.rc = self.share("rc", shape=(3, s[1] + s[2]), dtype=np.int64)
+        if self.with_rc:
+            self.rc = self.share("rc", shape=(3, s[1] + s[2]), dtype=np.int64)
 
     def export(self):
         return {name: self.shared[name].export() for name in self.shared}
@@ -511,7 +647,7 @@ class pks_table:
         obj.npk = npk  # this is ugly. Sending as arg causes allocate.
         return obj
 
-    def find_uniq(self, outputfile=None, use_scipy=False):
+    def find_uniq(self, outputfile=None, use_scipy=False, use_unionfind=False):
         """find the unique labels from the rc array"""
         t = tictoc()
         n = self.ipk[-1]
@@ -533,6 +669,10 @@ class pks_table:
                 coo, directed=False, return_labels=True
             )
             t("find connected components")
+        elif use_unionfind:
+            uf = uniq_labels(n)
+            uf.add(self.rc[0], self.rc[1])
+            cc = uf.labels()
         else:
             cc = find_ND_labels(self.rc[0], self.rc[1], n)
         self.cc = cc
@@ -731,6 +871,67 @@ def find_ND_labels(i, j, npks, verbose=1):
     return n, labels
 
 
+@numba.njit(nogil=True)
+def union_edges(parent, i, j):
+    """
+    parent = union-find forest of the peaks, parent[k] <= k
+    i, j = pairs of overlapping peaks to merge
+
+    The root of each group is the lowest peak number in it
+    """
+    for k in range(len(i)):
+        a = i[k]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]  # path halving
+            a = parent[a]
+        b = j[k]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a < b:
+            parent[b] = a
+        elif b < a:
+            parent[a] = b
+
+
+@numba.njit(nogil=True)
+def union_labels(parent):
+    """
+    Replaces the union-find forest in place with the labels numbered
+    in order of the lowest peak, as in get_clean_labels
+    """
+    n = 0
+    for k in range(len(parent)):
+        if parent[k] == k:
+            parent[k] = n
+            n += 1
+        else:
+            # parent is lower, so already holds the label
+            parent[k] = parent[parent[k]]
+    return n
+
+
+class uniq_labels:
+    """
+    Incremental connected components of the peak overlaps.
+    The overlaps can be added in any order and in as many pieces as
+    you like, only the parent array of the peaks is kept.
+    Gives the same labels as find_ND_labels.
+    """
+
+    def __init__(self, npks):
+        self.parent = np.arange(npks, dtype=int)
+
+    def add(self, i, j):
+        """i, j = overlapping peak numbers"""
+        union_edges(self.parent, i, j)
+
+    def labels(self):
+        """returns nlabels, labels. The parent array is re-used for labels"""
+        n = union_labels(self.parent)
+        return n, self.parent
+
+
 def pks_table_from_scan(sparsefilename, ds, row, algorithm='lmlabel', wtmax=None):
     """
     Labels one rotation scan to a peaks table
@@ -746,10 +947,12 @@ def pks_table_from_scan(sparsefilename, ds, row, algorithm='lmlabel', wtmax=None
     """
     sps = ImageD11.sparseframe.SparseScan(sparsefilename, ds.scans[row])
     sps.motors["omega"] = ds.omega[row]
-    peaks, pairs = ImageD11.sinograms.properties.props(sps, row, algorithm=algorithm, wtmax=wtmax)
+    peaks, pairs = ImageD11.sinograms.properties.props(
+        sps, row, algorithm=algorithm, wtmax=wtmax, coo=True
+    )
     # which frame/peak is which in the peaks array
     # For the 3D merging
-    n1 = sum(pairs[k][0] for k in pairs)  # how many overlaps were found:
+    n1 = pairs.shape[1]  # how many overlaps were found:
     npk = np.array(
         [
             (peaks.shape[1], n1, 0),
@@ -757,25 +960,8 @@ def pks_table_from_scan(sparsefilename, ds, row, algorithm='lmlabel', wtmax=None
     )
     pkst = ImageD11.sinograms.properties.pks_table(npk=npk, use_shm=False)
     pkst.pk_props = peaks
-    rc = pkst.rc
-    s = 0
-    pkid = ImageD11.sparseframe.nnz_to_pointer( sps.nlabels )
-    for (row1, frame1, row2, frame2), (npairs, ijn) in pairs.items():
-        # add entries into a sparse matrix
-        # key:   (500, 2, 501, 2893)
-        # value: (41, array([[  1,   1,   5],
-        #                    [  1,   2,   2], ...
-        if npairs == 0:
-            continue
-        # assert (row1 == i) and (row2 == i), (row1,row2,i)
-        e = s + npairs
-        assert e <= rc.shape[1]
-        # rc[ 0, s : e ] = ip[row1] + pkid[row1][frame1] + ijn[:,0] - 1       # col
-        # rc[ 1, s : e ] = ip[row2] + pkid[row2][frame2] + ijn[:,1] - 1       # row
-        rc[0, s:e] = pkid[frame1] + ijn[:, 0] - 1  # col
-        rc[1, s:e] = pkid[frame2] + ijn[:, 1] - 1  # row
-        rc[2, s:e] = ijn[:, 2]  # num pixels
-        s = e
+    # entries in the sparse matrix: (col, row, num pixels)
+    pkst.rc[:] = pairs
     uni = pkst.find_uniq()
     """
     if 0:  # future TODO : scoring overlaps better.
@@ -794,47 +980,162 @@ def pks_table_from_scan(sparsefilename, ds, row, algorithm='lmlabel', wtmax=None
     return pkst
 
 
-def process(qin, qshm, qout, hname, dsfilename, options):
+def label_block(hname, dset, start, end, options, qout=None):
     """
-    Worker process.
-        qin : gives a block of scans from qin to label (start, end)
-        qshm : gives us shared memory to store/return results
-        qout : numbers of overlaps
+    Labels the scans start to end (inclusive) of a dataset
         hname = sparse pixels
-        dsfilename = load omega
-        options (passed through)
+        dset = dataset (for scans and omega)
+        qout : receives numbers of overlaps for each row as they are done
+
+    returns dicts of row -> (5, npks) peaks, (3, n) pairs in the row,
+       (3, n) pairs with the previous row (rows > start)
     """
-    dset = ImageD11.sinograms.dataset.load(dsfilename)
-    scans = dset.scans
-    remove_shm_from_resource_tracker()
-    start, end = qin.get()
     n2 = 0
     # allocate lists to hold results
     pii = {}
     pij = {}
     mypks = {}
-    pkid = {}
     prev = None  # suppress flake8 idiocy
     # This is the 1D scan within the same row
     for i in range(start, end + 1):
-        scan = ImageD11.sparseframe.SparseScan(hname, scans[i])
+        scan = ImageD11.sparseframe.SparseScan(hname, dset.scans[i])
         scan.motors["omega"] = dset.omega[i]
+        # pairs are held as (3, n) arrays of (peak, peak, npixels)
         mypks[i], pii[i] = props(
-            scan, i, algorithm=options["algorithm"], wtmax=options["wtmax"]
+            scan, i, algorithm=options["algorithm"], wtmax=options["wtmax"], coo=True
         )
-        pkid[i] = ImageD11.sparseframe.nnz_to_pointer( scan.nlabels )
-        n1 = sum(pii[i][k][0] for k in pii[i])
+        n1 = pii[i].shape[1]
         if i > start:
-            pij[i] = pairscans(scan, prev)
-            n2 = sum(pij[i][k][0] for k in pij[i])
+            pij[i] = pairscans_coo(scan, prev)
+            n2 = pij[i].shape[1]
         # number of pair overlaps required for the big matrix
-        qout.put((i, len(mypks[i][0]), n1, n2))
+        if qout is not None:
+            qout.put((i, len(mypks[i][0]), n1, n2))
         prev = scan
+    return mypks, pii, pij
+
+
+def block_name(folder, start, end):
+    """file holding the results for rows start to end"""
+    return os.path.join(folder, "pks_%05d_%05d.h5" % (start, end))
+
+
+def block_signature(sparsefile, options):
+    """
+    What the labelled blocks depend on: the sparse file (name, size and
+    modification time) and the labelling options. Saved with each block.
+    """
+    st = os.stat(sparsefile)
+    return {
+        "sparsefile": os.path.basename(sparsefile),
+        "sparsefile_size": str(st.st_size),
+        "sparsefile_mtime": repr(st.st_mtime),
+        "algorithm": str(options["algorithm"]),
+        "wtmax": str(options["wtmax"]),
+    }
+
+
+def read_signature(fname):
+    """The block_signature saved in the block file fname"""
+    with h5py.File(fname, "r") as hin:
+        sig = {}
+        for name in ("sparsefile", "sparsefile_size", "sparsefile_mtime", "algorithm", "wtmax"):
+            value = hin.attrs.get(name, None)
+            if isinstance(value, bytes):
+                value = value.decode()
+            sig[name] = value
+    return sig
+
+
+def block_ok(fname, signature):
+    """
+    True if the block file exists and was made from the same sparse file
+    and options. Other blocks are left from a different run, so they are
+    ignored (and overwritten).
+    """
+    if not os.path.exists(fname):
+        return False
+    try:
+        found = read_signature(fname)
+    except (OSError, KeyError):
+        return False
+    if found != signature:
+        logging.warning("Ignoring %s, made from %s and not %s" % (fname, found, signature))
+        return False
+    return True
+
+
+def save_block(fname, start, end, mypks, pii, pij, signature=None):
+    """
+    Writes the label_block results for one block of rows.
+    The file only appears (by renaming) once it is complete, so a file
+    that exists can be used.
+    signature = block_signature of the sparse file and options used
+    """
+    tmpname = fname + ".tmp"
+    with h5py.File(tmpname, "w") as hout:
+        hout.attrs["start"] = start
+        hout.attrs["end"] = end
+        if signature is not None:
+            for name, value in signature.items():
+                hout.attrs[name] = value
+        for i in range(start, end + 1):
+            grp = hout.create_group("%d" % (i))
+            grp["pk_props"] = mypks[i]
+            grp["pii"] = pii[i]
+            if i > start:
+                grp["pij"] = pij[i]
+    ImageD11.columnfile.replace_file(tmpname, fname)
+
+
+def load_block(fname):
+    """reads back save_block: returns start, end, mypks, pii, pij"""
+    mypks, pii, pij = {}, {}, {}
+    with h5py.File(fname, "r") as hin:
+        start = int(hin.attrs["start"])
+        end = int(hin.attrs["end"])
+        for i in range(start, end + 1):
+            grp = hin["%d" % (i)]
+            mypks[i] = grp["pk_props"][()]
+            pii[i] = grp["pii"][()]
+            if i > start:
+                pij[i] = grp["pij"][()]
+    return start, end, mypks, pii, pij
+
+
+def process(qin, qshm, qout, hname, dsfilename, options):
+    """
+    Worker process.
+        qin : gives a block of scans from qin to label (start, end)
+        qshm : gives us shared memory to store/return results
+        qout : numbers of overlaps
+        hname = sparse pixels
+        dsfilename = load omega
+        options (passed through)
+    With options["checkpoint_dir"] the results for the block are saved
+    there, or read back if a previous run already finished the block
+    with the same sparse file and options.
+    """
+    dset = ImageD11.sinograms.dataset.load(dsfilename)
+    remove_shm_from_resource_tracker()
+    start, end = qin.get()
+    folder = options.get("checkpoint_dir", None)
+    fname = None if folder is None else block_name(folder, start, end)
+    signature = None if folder is None else block_signature(hname, options)
+    if fname is not None and block_ok(fname, signature):
+        _, _, mypks, pii, pij = load_block(fname)
+        for i in range(start, end + 1):
+            n2 = pij[i].shape[1] if i > start else 0
+            qout.put((i, len(mypks[i][0]), pii[i].shape[1], n2))
+    else:
+        mypks, pii, pij = label_block(hname, dset, start, end, options, qout)
+        if fname is not None:
+            save_block(fname, start, end, mypks, pii, pij, signature)
     # Now we are waiting for the shared memory to save the results
     shm = qshm.get()
     pkst = pks_table.fromSHM(shm)
     ip = pkst.ipk
-    rc = pkst.rc
+    rc = pkst.rc  # None : send the overlaps back to be labelled
     # For each row, save our local results
     for i in range(start, end + 1):
         if (i == start) and (i > 0):
@@ -848,42 +1149,26 @@ def process(qin, qshm, qout, hname, dsfilename, options):
         s = ipstart = pkst.rpk[i]
         ipend = pkst.rpk[i + 1]
         #
-        if 0:  # debugging
-            n1 = sum(pii[i][k][0] for k in pii[i])
-            if i > start:
-                n2 = sum(pij[i][k][0] for k in pij[i])
-            else:
-                n2 = 0
-            # # will be done by the previous worker
-            # print('Debugging:',i, ipstart, ipend, n1, n2, ipend-ipstart, n1+n2)
-            assert (ipend - ipstart) == (n1 + n2)
-        #
-        for (row1, frame1, row2, frame2), (npairs, ijn) in pii[i].items():
-            # add entries into a sparse matrix
-            # key:   (500, 2, 501, 2893)
-            # value: (41, array([[  1,   1,   5],
-            #                    [  1,   2,   2], ...
-            if npairs == 0:
-                continue
-            assert (row1 == i) and (row2 == i)
-            e = s + npairs
-            assert e <= ipend
-            rc[0, s:e] = ip[row1] + pkid[row1][frame1] + ijn[:, 0] - 1  # col
-            rc[1, s:e] = ip[row2] + pkid[row2][frame2] + ijn[:, 1] - 1  # row
-            rc[2, s:e] = ijn[:, 2]  # num pixels
-            s = e
+        if rc is None:
+            qout.put(("edges", ip[i] + pii[i][0], ip[i] + pii[i][1]))
+            if i > 0:
+                qout.put(("edges", ip[i] + pij[i][0], ip[i - 1] + pij[i][1]))
+            continue
+        # add entries into the sparse matrix: (col, row, num pixels)
+        e = s + pii[i].shape[1]
+        assert e <= ipend
+        rc[0, s:e] = ip[i] + pii[i][0]
+        rc[1, s:e] = ip[i] + pii[i][1]
+        rc[2, s:e] = pii[i][2]
+        s = e
         if i == 0:
             continue  # no pairs to previous row exit
-        for (row1, frame1, row2, frame2), (npairs, ijn) in pij[i].items():
-            if npairs == 0:
-                continue
-            assert (row1 == i) and (row2 == i - 1)
-            e = s + npairs
-            assert e <= ipend
-            rc[0, s:e] = ip[row1] + pkid[row1][frame1] + ijn[:, 0] - 1  # col
-            rc[1, s:e] = ip[row2] + pkid[row2][frame2] + ijn[:, 1] - 1  # row
-            rc[2, s:e] = ijn[:, 2]  # num pixels
-            s = e
+        e = s + pij[i].shape[1]
+        assert e <= ipend
+        rc[0, s:e] = ip[i] + pij[i][0]
+        rc[1, s:e] = ip[i - 1] + pij[i][1]
+        rc[2, s:e] = pij[i][2]
+        s = e
     qout.put(start)
 
 
@@ -912,18 +1197,28 @@ def goforit(ds, sparsename, options):
             out.append(ans)
         ks, P = compute_storage(out)
         assert len(ks) == len(ds.scans)
-        mem = pks_table(P)
+        stream = options.get("stream_overlaps", False)
+        mem = pks_table(P, with_rc=not stream)
+        if stream:
+            # overlaps come back on the queue and are labelled as they arrive
+            mem.rc = None
+            uf = uniq_labels(mem.ipk[-1])
         shm = mem.export()
         # workers fill the shared memory
         for i in range(options["nproc"]):
             qshm.put(shm)
         dones = set()
-        for i in tqdm.tqdm(range(options["nproc"])):
-            # check done
-            f = qresult.get()
-            dones.add(f)
-            if len(dones) == options["nproc"]:
-                break
+        with tqdm.tqdm(total=options["nproc"]) as pbar:
+            while len(dones) < options["nproc"]:
+                # check done
+                f = qresult.get()
+                if isinstance(f, tuple):
+                    uf.add(f[1], f[2])
+                    continue
+                dones.add(f)
+                pbar.update(1)
+        if stream:
+            mem.nlabel, mem.glabel = mem.cc = uf.labels()
     return out, ks, P, mem
 
 
@@ -932,30 +1227,186 @@ default_options = {
     "wtmax": None,  # value to replace saturated pixels
     "save_overlaps": False,
     "nproc": None,
+    "stream_overlaps": False,
+    "checkpoint_dir": None,
 }
 
 
-def main(dsfilename, sparsefile=None, pksfile=None, options={}):
-    """
-    dsname = ImageD11.sinograms.dataset file
-    sparsename = File containing sparse pixels (None = use dsname.sparsefile)
-    pkname = File to receive output peaks (None = use dsname.pksfile)
-
-    options : dictionary of options, to override
-
-    """
+def check_options(options):
+    """returns default options updated by options"""
     default_options = {
         "algorithm": "lmlabel",  # | cplabel ]
         "wtmax": None,  # value to replace saturated pixels
         "save_overlaps": False,  # for debug
         "nproc": None,  # None == guess
+        "stream_overlaps": False,  # label overlaps as they arrive, no rc matrix
+        "checkpoint_dir": None,  # folder to save each block of rows, for restarts
     }
     for k in options:
         if k in default_options:
             default_options[k] = options[k]
         else:
             raise Exception("I do not understand %s in options" % (str(k)))
-    options = default_options
+    if default_options["stream_overlaps"] and default_options["save_overlaps"]:
+        raise Exception("save_overlaps needs the overlap matrix, "
+                        "which stream_overlaps does not make")
+    return default_options
+
+
+def guess_nproc():
+    if "SLURM_CPUS_PER_TASK" in os.environ:
+        return max(1, int(os.environ["SLURM_CPUS_PER_TASK"]) - 1)
+    return ImageD11.cImageD11.cores_available()
+
+
+######################################################################################
+# Distributed over several machines : each job labels some rows into files in
+# a folder on a shared filesystem (label_node), then merge_blocks joins them.
+
+
+def node_blocks(nscans, jobid, njobs, nproc):
+    """
+    Blocks of rows for job jobid of njobs. The rows are split over the jobs
+    by get_start_end and then split again for nproc processes in the job.
+    Neighbouring blocks share one row to get the overlaps between rows.
+    """
+    start, end = get_start_end(nscans, njobs)[jobid]
+    nproc = min(nproc, end - start)
+    if nproc <= 1:
+        return [(start, end)]
+    return [(s + start, e + start) for s, e in get_start_end(end - start + 1, nproc)]
+
+
+def label_block_file(args):
+    """Labels one block into its file (unless the same block is already there)"""
+    dsfilename, sparsefile, folder, start, end, options = args
+    fname = block_name(folder, start, end)
+    signature = block_signature(sparsefile, options)
+    if not block_ok(fname, signature):
+        dset = ImageD11.sinograms.dataset.load(dsfilename)
+        mypks, pii, pij = label_block(sparsefile, dset, start, end, options)
+        save_block(fname, start, end, mypks, pii, pij, signature)
+    return fname
+
+
+def label_node(dsfilename, folder, jobid, njobs, sparsefile=None, options={}):
+    """
+    Distributed labelling, first step. Run jobid = 0 .. njobs-1 anywhere
+    that sees the same filesystem.
+
+    dsfilename = ImageD11.sinograms.dataset file
+    folder = where to write the labelled blocks (shared by all jobs)
+    jobid, njobs = which part of the rows to do
+    sparsefile = pixels (None = use ds.sparsefile)
+
+    Blocks already in the folder are not redone. Returns the block files.
+    """
+    options = check_options(options)
+    ds = ImageD11.sinograms.dataset.load(dsfilename)
+    if sparsefile is None:
+        sparsefile = ds.sparsefile
+    if options["nproc"] is None:
+        options["nproc"] = guess_nproc()
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    blocks = node_blocks(len(ds.scans), jobid, njobs, options["nproc"])
+    args = [(dsfilename, sparsefile, folder, s, e, options) for s, e in blocks]
+    if len(blocks) == 1:
+        return [label_block_file(args[0])]
+    with mp.Pool(len(blocks)) as pool:
+        return list(pool.map(label_block_file, args))
+
+
+def merge_blocks(dsfilename, folder, pksfile=None, sparsefile=None):
+    """
+    Distributed labelling, last step. Reads the blocks from label_node,
+    labels the connected peaks and saves the pks_table to pksfile
+    (None = use ds.pksfile).
+    The blocks must all come from the same options and from sparsefile
+    (None = use ds.sparsefile) as it is now.
+    The overlaps are read row by row into uniq_labels, so only the
+    peaks and one parent array are held in memory.
+    """
+    t = tictoc()
+    ds = ImageD11.sinograms.dataset.load(dsfilename)
+    if pksfile is None:
+        pksfile = ds.pksfile
+    if sparsefile is None:
+        sparsefile = ds.sparsefile
+    nscans = len(ds.scans)
+    # which file has each row : [ npeaks, nii, nij ] for each row
+    pkfile = {}
+    ijfile = {}
+    npk = np.zeros((nscans, 3), int)
+    blockfiles = sorted(glob.glob(os.path.join(folder, "pks_*_*.h5")))
+    signatures = set(tuple(sorted(read_signature(fname).items())) for fname in blockfiles)
+    if len(signatures) > 1:
+        raise Exception(
+            "Blocks in %s come from different sparse files or options: %s"
+            % (folder, str(signatures))
+        )
+    if len(signatures) == 1:
+        found = dict(signatures.pop())
+        now = block_signature(sparsefile, {"algorithm": None, "wtmax": None})
+        if any(found[k] != now[k] for k in ("sparsefile", "sparsefile_size", "sparsefile_mtime")):
+            raise Exception(
+                "Blocks in %s were made from %s, not %s"
+                % (folder, str(found), str(now))
+            )
+    for fname in blockfiles:
+        with h5py.File(fname, "r") as hin:
+            start = int(hin.attrs["start"])
+            end = int(hin.attrs["end"])
+            for i in range(start, end + 1):
+                grp = hin["%d" % (i)]
+                if i not in pkfile:
+                    pkfile[i] = fname
+                    npk[i, 0] = grp["pk_props"].shape[1]
+                    npk[i, 1] = grp["pii"].shape[1]
+                if i > start:
+                    ijfile[i] = fname
+                    npk[i, 2] = grp["pij"].shape[1]
+    missing = [i for i in range(nscans) if i not in pkfile]
+    missing += [i for i in range(1, nscans) if i not in ijfile]
+    if len(missing):
+        raise Exception(
+            "Rows %s are missing in %s, some label_node jobs did not finish"
+            % (str(sorted(set(missing))), folder)
+        )
+    t("read %d blocks" % (len(blockfiles)))
+    ipk = np.zeros(nscans + 1, int)
+    ipk[1:] = np.cumsum(npk[:, 0])
+    pk_props = np.empty((5, ipk[-1]), np.int64)
+    uf = uniq_labels(ipk[-1])
+    for i in range(nscans):
+        with h5py.File(pkfile[i], "r") as hin:
+            grp = hin["%d" % (i)]
+            pk_props[:, ipk[i] : ipk[i + 1]] = grp["pk_props"][()]
+            pii = grp["pii"][()]
+            uf.add(ipk[i] + pii[0], ipk[i] + pii[1])
+        if i > 0:
+            with h5py.File(ijfile[i], "r") as hin:
+                pij = hin["%d/pij" % (i)][()]
+                uf.add(ipk[i] + pij[0], ipk[i - 1] + pij[1])
+    nlabel, glabel = uf.labels()
+    t("%d connected components" % (nlabel))
+    pkst = pks_table(ipk=ipk, pk_props=pk_props, glabel=glabel, nlabel=nlabel)
+    pkst.npk = npk
+    pkst.save(pksfile)
+    t("write hdf5")
+    return pkst
+
+
+def main(dsfilename, sparsefile=None, pksfile=None, options={}):
+    """
+    dsname = ImageD11.sinograms.dataset file
+    sparsename = File containing sparse pixels (None = use dsname.sparsefile)
+    pkname = File to receive output peaks (None = use dsname.pksfile)
+
+    options : dictionary of options, to override
+
+    """
+    options = check_options(options)
 
     t = tictoc()
     ds = ImageD11.sinograms.dataset.load(dsfilename)
@@ -974,21 +1425,32 @@ def main(dsfilename, sparsefile=None, pksfile=None, options={}):
         t("read ds %s" % (dsfilename))
         nscans = len(ds.scans)
         if options["nproc"] is None:
-            if "SLURM_CPUS_PER_TASK" in os.environ:
-                options["nproc"] = max(1, int(os.environ["SLURM_CPUS_PER_TASK"]) - 1)
-            else:
-                options["nproc"] = ImageD11.cImageD11.cores_available()
+            options["nproc"] = guess_nproc()
         if options["nproc"] > nscans - 1:
             options["nproc"] = max(1, nscans - 1)
         print("Nscans", nscans)
         print("Options", options)
+        folder = options["checkpoint_dir"]
+        if folder is not None and nscans > 1:
+            # blocks come from get_start_end : restart with the same nproc
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+            signature = block_signature(sparsefile, options)
+            done = [
+                se for se in get_start_end(nscans, options["nproc"])
+                if block_ok(block_name(folder, *se), signature)
+            ]
+            print("Blocks done already", len(done))
         if nscans > 1:
             peaks, ks, P, rmem = goforit(ds, sparsefile, options)  # ds.omega is passed here
             t("%d label and pair" % (len(rmem.pk_props[0])))
-            if "save_overlaps" in options and options["save_overlaps"]:
-                rmem.save(pksfile + "_mat.h5", rc=True)
-                t("cache")
-            cc = rmem.find_uniq()
+            if options["stream_overlaps"]:
+                cc = rmem.cc
+            else:
+                if "save_overlaps" in options and options["save_overlaps"]:
+                    rmem.save(pksfile + "_mat.h5", rc=True)
+                    t("cache")
+                cc = rmem.find_uniq()
             t("%s connected components" % (str(cc[0])))
         else:
             # single scan. Skips a lot of hassle.
@@ -997,6 +1459,10 @@ def main(dsfilename, sparsefile=None, pksfile=None, options={}):
                                        wtmax=options['wtmax'])
         rmem.save(pksfile)
         t("write hdf5")
+        if folder is not None and nscans > 1:
+            # finished, the blocks are not needed for a restart
+            for se in get_start_end(nscans, options["nproc"]):
+                os.remove(block_name(folder, *se))
     except Exception as e:
         print("Unhandled exception:", e)
         raise
@@ -1008,6 +1474,19 @@ def main(dsfilename, sparsefile=None, pksfile=None, options={}):
 
 
 if __name__ == "__main__":
+    if sys.argv[1] == "label":
+        # label dsname folder jobid njobs [sparsefile [nproc]]
+        sparsefile = sys.argv[6] if len(sys.argv) > 6 else None
+        options = {}
+        if len(sys.argv) > 7:
+            options["nproc"] = int(sys.argv[7])
+        label_node(sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5]),
+                   sparsefile=sparsefile, options=options)
+        sys.exit(0)
+    if sys.argv[1] == "merge":
+        # merge dsname folder [pksfile [sparsefile]]
+        merge_blocks(sys.argv[2], sys.argv[3], *sys.argv[4:6])
+        sys.exit(0)
     dsname = sys.argv[1]
     sparsename = sys.argv[2]
     pkname = sys.argv[3]
@@ -20,6 +20,7 @@ def get_voxel_idx(
     cos_omega_bins,
     idx_buffer,  # you will want to reuse these for all voxels!
     ydist_buffer,  # you will want to reuse these for all voxels
+    ytol=-1.0,
 ):
     """Get the voxel indices and y-distances for a given voxel centroid position.
 
@@ -48,13 +49,15 @@ def get_voxel_idx(
         idx_buffer (:obj:`np.ndarray`): The buffer for the voxel indices. This is intended to be reused when masking
             voxels over a grid. The buffer size is user-defined allowing for optimizations. Setting it to dty_sorted.size
             is 100% safe, but likely very very overkill.
+        ytol (:obj:`float`): Keep the peaks within ytol of the beam instead of ystep, for example to collect the
+            peaks of a block of voxels. Negative values (the default) mean ystep.
 
     Returns:
         :obj:`tuple`: A tuple containing the voxel indices and y distances.
         The voxel indices are the indices of the peaks that are within the voxela and
         refers to peaks that follow the same ordering as dty_sorted.
         The y distances are the absolute distances of the peaks from the voxel centroid position. These are guaranteed to be
-        less than or equal to ystep.
+        less than or equal to ystep (or ytol).
 
     Raises:
         :obj:`ValueError`: If the buffer arrays are too small. Then simply try to set your buffer size larger.
@@ -67,6 +70,12 @@ def get_voxel_idx(
     # figure out a safe dty padding for each omega bin such that no peak is forgotten.
     y_bins_diff = np.empty(n_bins, dtype=np.int64)
     inv_ystep = 1.0 / ystep
+    if ytol < 0.0:
+        ytol = ystep
+    # extra padding for a tolerance larger than ystep
+    ytol_padding = 0
+    if ytol > ystep:
+        ytol_padding = int((ytol - ystep) * inv_ystep) + 1
 
     y_prev = y0 - xi0 * sin_omega_bins[0] - yi0 * cos_omega_bins[0]
 
@@ -101,7 +110,7 @@ def get_voxel_idx(
         # get the dty padding for this omega bin, i.e we will not
         # just grab the y_index in the bin but some amount of neighboring
         # dty values on either side of the y_index must be considered.
-        dty_partition_padding = y_bins_diff[i]
+        dty_partition_padding = y_bins_diff[i] + ytol_padding
 
         padded_low = y_index - dty_partition_padding
         if padded_low < 0:
@@ -136,9 +145,9 @@ def get_voxel_idx(
             c = cos_omega_sorted[j]
             ydist = abs(y0 - xi0 * s - yi0 * c - dty_val)
 
-            # Check if the peak is within ystep of the voxel centroid
+            # Check if the peak is within ytol of the voxel centroid
             # if so, then keep it.
-            if ydist <= ystep:
+            if ydist <= ytol:
                 if m >= buffer_size:
                     raise ValueError("Buffer is too small")
                 idx_buffer[m] = j  # these now refer to the sorted peaks!
@@ -316,7 +325,7 @@ class VoxelSinoMasker:
 
         # we default to a 5% buffer, this should be very safe, altough
         # we have fallbacks in case of a sharp corner.
-        self._build_buffers(self.n_peaks // 20)
+        self._build_buffers(max(self.n_peaks // 20, 1))
 
     def sort_by_partitions(self, peaks):
         """In place sorting of peak columns, such as sc, fc, sum_intensity, etc. by partitions
@@ -350,7 +359,7 @@ class VoxelSinoMasker:
         self.idx_buffer = np.empty(buffer_size, dtype=np.int64)
         self.ydist_buffer = np.empty(buffer_size, dtype=np.float64)
 
-    def _mask(self, xi0, yi0, ystep, y0):
+    def _mask(self, xi0, yi0, ystep, y0, ytol=-1.0):
         return get_voxel_idx(
             xi0,
             yi0,
@@ -366,19 +375,23 @@ class VoxelSinoMasker:
             self.cosomega_bins,
             self.idx_buffer,
             self.ydist_buffer,
+            ytol,
         )
 
-    def mask(self, xi0, yi0, ystep, y0):
+    def mask(self, xi0, yi0, ystep, y0, ytol=None):
+        """Peaks within ystep (or ytol, if given) of the beam for the voxel at (xi0, yi0)"""
+        if ytol is None:
+            ytol = -1.0
         while self.buffer_size < self.n_peaks:
             try:
-                idx, ydist = self._mask(xi0, yi0, ystep, y0)
+                idx, ydist = self._mask(xi0, yi0, ystep, y0, ytol)
                 return idx, ydist
             except ValueError:
                 # Increasing buffer size dynamically, this is overhead on first call,
                 # if the buffer is too small.
                 self._build_buffers(2 * self.buffer_size)
                 continue
-        idx, ydist = self._mask(xi0, yi0, ystep, y0)
+        idx, ydist = self._mask(xi0, yi0, ystep, y0, ytol)
         return idx, ydist
 
 
@@ -525,4 +538,37 @@ if __name__ == "__main__":
 
     print("Speedup: {:.1f} x".format(time_per_call_pbp / time_per_call_voxel_mask))
 
+    # the peak selection as used in pbp.idxpoint
+    import ImageD11.sinograms.geometry as geometry
+
+    ymin = unique_dty.min()
+    dtyi = geometry.dty_to_dtyi(dty, ystep, ymin)
+    sinomega = np.sin(np.radians(omega))
+    cosomega = np.cos(np.radians(omega))
+    t1 = time.perf_counter()
+    masker = pbp.voxel_masker(omega, dtyi, ystep, ymin)
+    t2 = time.perf_counter()
+    print("Time for pbp.voxel_masker: {}".format(t2 - t1))
+    steps = [int(round(y / ystep)) for y in ys]
+    t1 = time.perf_counter()
+    for si in steps:
+        for sj in steps:
+            ip = pbp.masker_peaks(
+                masker, si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin
+            )
+    t2 = time.perf_counter()
+    time_per_call_masker = (t2 - t1) / (len(ys) * len(ys))
+    print("Time per pbp.masker_peaks call: {}".format(time_per_call_masker))
+    t1 = time.perf_counter()
+    for si in steps:
+        for sj in steps:
+            m = geometry.dtyimask_from_step_sincos(
+                si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin
+            )
+    t2 = time.perf_counter()
+    time_per_call_dtyimask = (t2 - t1) / (len(ys) * len(ys))
+    print("Time per dtyimask_from_step_sincos call: {}".format(time_per_call_dtyimask))
+    print("Speedup: {:.1f} x".format(time_per_call_dtyimask / time_per_call_masker))
+    assert (ip == np.flatnonzero(m)).all()
+
     plt.show()
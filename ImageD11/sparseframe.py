@@ -1,6 +1,6 @@
 from __future__ import print_function, division
 
-import time, sys
+import time, sys, threading, concurrent.futures
 import h5py, scipy.sparse, numpy as np  # , pylab as pl
 from ImageD11 import cImageD11
 
@@ -274,11 +274,13 @@ class SparseScan(object):
             s = ipt[start]
             e = ipt[end]
             for name in self.names:
-                if name in grp:
+                if name == "intensity" and name in grp:
+                    # converted while reading: no second copy of the pixels
+                    self.intensity_input_dtype = grp[name].dtype
+                    self.intensity = np.empty(e - s, np.float32)
+                    grp[name].read_direct(self.intensity, np.s_[s:e])
+                elif name in grp:
                     setattr(self, name, grp[name][s:e])
-            if "intensity" in self.names:
-                self.intensity_input_dtype = self.intensity.dtype
-                self.intensity = self.intensity.astype(np.float32)
             # pointers into this scan
             self.nnz = nnz[start:end]
             self.ipt = nnz_to_pointer(self.nnz)
@@ -309,7 +311,7 @@ class SparseScan(object):
             SAFE=SAFE,
         )
 
-    def cplabel(self, threshold=0, countall=True):
+    def cplabel(self, threshold=0, countall=True, nthreads=1):
         """Label pixels using the connectedpixels assigment code
         Fills in:
            self.nlabels = number of peaks per frame
@@ -318,35 +320,24 @@ class SparseScan(object):
 
         if countall == True : labels all peaks from zero
                     == False : labels from 1 on each frame
+        nthreads : label blocks of frames in this many threads
         """
-        self.nlabels = np.zeros(len(self.nnz), np.int32)
         self.labels = np.zeros(len(self.row), "i")
         if "labels" not in self.names:
             self.names.append("labels")
-        nl = 0
-        # TODO: run this in parallel with threads?
-        for i, npx in enumerate(self.nnz):
-            s = self.ipt[i]
-            e = self.ipt[i + 1]
-            if npx > 0:
-                self.nlabels[i] = cImageD11.sparse_connectedpixels(
-                    self.intensity[s:e],
-                    self.row[s:e],
-                    self.col[s:e],
-                    threshold,
-                    self.labels[s:e],
-                )
-                # zero label is the background!
-                self.labels[s:e] = np.where(
-                    self.labels[s:e] > 0, self.labels[s:e] + nl, 0
-                )
-            else:
-                self.nlabels[i] = 0
-            if countall:
-                nl += self.nlabels[i]
-        self.total_labels = self.nlabels.sum()
 
-    def lmlabel(self, threshold=0, countall=True, smooth=True):
+        def label_frame(s, e, work):
+            return cImageD11.sparse_connectedpixels(
+                self.intensity[s:e],
+                self.row[s:e],
+                self.col[s:e],
+                threshold,
+                self.labels[s:e],
+            )
+
+        self._label_frames(label_frame, countall, nthreads)
+
+    def lmlabel(self, threshold=0, countall=True, smooth=True, nthreads=1):
         """Label pixels using the localmax assigment code
         Fills in:
            self.nlabels = number of peaks per frame
@@ -354,8 +345,8 @@ class SparseScan(object):
            self.total_labels = total number of peaks
         if countall == True : labels all peaks from zero
                     == False : labels from 1 on each frame
+        nthreads : label blocks of frames in this many threads
         """
-        self.nlabels = np.zeros(len(self.nnz), np.int32)
         self.labels = np.zeros(len(self.row), "i")
         if "labels" not in self.names:
             self.names.append("labels")
@@ -363,37 +354,87 @@ class SparseScan(object):
             self.signal = np.empty(self.intensity.shape, np.float32)
         else:
             self.signal = self.intensity.astype(np.float32)
-        # temporary workspaces
-        npxmax = self.nnz.max()
-        vmx = np.zeros(npxmax, np.float32)
-        imx = np.zeros(npxmax, "i")
-        nl = 0
-        # TODO: run this in parallel with threads?
-        for i, npx in enumerate(self.nnz):
-            s = self.ipt[i]
-            e = self.ipt[i + 1]
-            if npx > 0:
-                if smooth:
-                    cImageD11.sparse_smooth(
-                        self.intensity[s:e],
-                        self.row[s:e],
-                        self.col[s:e],
-                        self.signal[s:e],
-                    )
-                self.nlabels[i] = cImageD11.sparse_localmaxlabel(
-                    self.signal[s:e],
+        npxmax = self.nnz.max() if len(self.nnz) else 0
+
+        def label_frame(s, e, work):
+            if "vmx" not in work:  # temporary workspaces for each thread
+                work["vmx"] = np.zeros(npxmax, np.float32)
+                work["imx"] = np.zeros(npxmax, "i")
+            npx = e - s
+            if smooth:
+                cImageD11.sparse_smooth(
+                    self.intensity[s:e],
                     self.row[s:e],
                     self.col[s:e],
-                    vmx[:npx],
-                    imx[:npx],
-                    self.labels[s:e],
+                    self.signal[s:e],
                 )
-                assert (self.labels[s:e] > 0).all()
-                self.labels[s:e] += nl
+            n = cImageD11.sparse_localmaxlabel(
+                self.signal[s:e],
+                self.row[s:e],
+                self.col[s:e],
+                work["vmx"][:npx],
+                work["imx"][:npx],
+                self.labels[s:e],
+            )
+            assert (self.labels[s:e] > 0).all()
+            return n
+
+        self._label_frames(label_frame, countall, nthreads)
+
+    def _label_frames(self, label_frame, countall, nthreads):
+        """
+        Calls label_frame(s, e, work) for each frame with pixels to fill
+        self.labels[s:e] from 1 and return the number of labels.
+        Frames are shared out in blocks of about equal numbers of pixels
+        to nthreads threads, each with its own work dict. The labels are
+        then offset by the prefix sum of nlabels (for countall).
+        """
+        self.nlabels = np.zeros(len(self.nnz), np.int32)
+        nthreads = max(1, min(int(nthreads), len(self.nnz)))
+        # block edges at equal pixel counts, ~4 blocks per thread
+        nblock = 1 if nthreads == 1 else nthreads * 4
+        targets = np.linspace(0, self.ipt[-1], nblock + 1)[1:-1]
+        edges = np.unique(
+            np.concatenate(((0,), np.searchsorted(self.ipt, targets), (len(self.nnz),)))
+        )
+        local = threading.local()
+
+        def label_block(f0, f1):
+            if not hasattr(local, "work"):
+                local.work = {}
+            for i in range(f0, f1):
+                if self.nnz[i] > 0:
+                    self.nlabels[i] = label_frame(
+                        self.ipt[i], self.ipt[i + 1], local.work
+                    )
+
+        def offset_block(f0, f1, offsets):
+            for i in range(f0, f1):
+                if offsets[i] != 0 and self.nnz[i] > 0:
+                    lab = self.labels[self.ipt[i] : self.ipt[i + 1]]
+                    # zero label is the background!
+                    np.add(lab, offsets[i], out=lab, where=lab > 0)
+
+        blocks = list(zip(edges[:-1], edges[1:]))
+        if nthreads == 1:
+            for f0, f1 in blocks:
+                label_block(f0, f1)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=nthreads) as pool:
+                for _ in pool.map(lambda b: label_block(*b), blocks):
+                    pass
+        if countall:
+            offsets = np.zeros(len(self.nnz), self.labels.dtype)
+            np.cumsum(self.nlabels[:-1], out=offsets[1:])
+            if nthreads == 1:
+                for f0, f1 in blocks:
+                    offset_block(f0, f1, offsets)
             else:
-                self.nlabels[i] = 0
-            if countall:
-                nl += self.nlabels[i]
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=nthreads
+                ) as pool:
+                    for _ in pool.map(lambda b: offset_block(b[0], b[1], offsets), blocks):
+                        pass
         self.total_labels = self.nlabels.sum()
 
     def moments(self):
@@ -428,6 +469,102 @@ class SparseScan(object):
         return pks
 
 
+class SparseScanBlocks(object):
+    """
+    Reads a sparse scan as consecutive blocks of frames, each one a
+    SparseScan holding at most about max_pixels pixels, so that memory
+    does not grow with the length of the scan.
+    """
+
+    def __init__(
+        self,
+        hname,
+        scan,
+        max_pixels=1 << 26,
+        start=0,
+        n=None,
+        overlap=0,
+        names=("row", "col", "intensity"),
+    ):
+        """
+        hname, scan, start, n : as for SparseScan
+        max_pixels : pixels per block (a block has at least one new frame)
+        overlap : number of frames from the end of each block which are
+                  repeated at the start of the next one (block.noverlap)
+        """
+        self.hname = hname
+        self.scan = scan
+        self.max_pixels = max_pixels
+        self.overlap = overlap
+        self.names = list(names)
+        with h5py.File(hname, "r") as hin:
+            nnz = hin[scan]["nnz"][:]
+        if n is None:
+            n = len(nnz) - start
+        self.start = start
+        self.nnz = nnz[start : start + n]
+        self.edges = self.block_edges(self.nnz, max_pixels)
+
+    @staticmethod
+    def block_edges(nnz, max_pixels):
+        """frame numbers where blocks start (and the end)"""
+        edges = [0]
+        npx = 0
+        for i, npx_frame in enumerate(nnz):
+            if npx + npx_frame > max_pixels and i > edges[-1]:
+                edges.append(i)
+                npx = 0
+            npx += npx_frame
+        edges.append(len(nnz))
+        return edges
+
+    def __len__(self):
+        return len(self.edges) - 1
+
+    def __iter__(self):
+        """Yields a SparseScan for each block, with the hyperslab read
+        from the file. block.start is the first frame (from the start of
+        this scan) and block.noverlap the number of repeated frames."""
+        for b in range(len(self)):
+            f0 = max(self.edges[b] - self.overlap, 0)
+            f1 = self.edges[b + 1]
+            block = SparseScan(
+                self.hname, self.scan, start=self.start + f0, n=f1 - f0, names=self.names
+            )
+            block.start = f0
+            block.noverlap = self.edges[b] - f0
+            yield block
+
+    def label(self, algorithm="lmlabel", countall=True, **kwds):
+        """
+        Yields the blocks labelled with algorithm (cplabel|lmlabel).
+        With countall the labels in each block run from 1 and
+        block.label_offset + block.labels is unique over the whole scan.
+        Frames repeated in the overlap get the same labels in both blocks.
+        """
+        total = 0
+        for block in self:
+            getattr(block, algorithm)(countall=countall, **kwds)
+            if countall:
+                block.label_offset = total - block.nlabels[: block.noverlap].sum()
+                total = block.label_offset + block.total_labels
+            else:
+                block.label_offset = 0
+            yield block
+
+    def moments(self, algorithm="lmlabel", **kwds):
+        """
+        Computes SparseScan.moments block by block and joins them,
+        skipping the peaks on frames repeated in the overlaps
+        """
+        pks = {}
+        for block in self.label(algorithm, countall=True, **kwds):
+            skip = block.nlabels[: block.noverlap].sum()
+            for name, values in block.moments().items():
+                pks.setdefault(name, []).append(values[skip:])
+        return {name: np.concatenate(values) for name, values in pks.items()}
+
+
 def from_data_mask(mask, data, header):
     """
     Create a sparse from a dense array
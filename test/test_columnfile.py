@@ -6,6 +6,7 @@ import unittest
 from ImageD11 import columnfile
 import ImageD11.columnfile
 import numpy as np
+import os
 
 class testgeom( unittest.TestCase ):
     def setUp( self ):
@@ -167,7 +168,281 @@ class test1( unittest.TestCase ):
         assert( e )
 
 
-class test_issue289( unittest.TestCase ):  
+class testcache( unittest.TestCase ):
+    def setUp( self ):
+        self.fname = "testcache.flt"
+        self.cname = columnfile.cache_filename( self.fname )
+        if os.path.exists( self.cname ):
+            os.remove( self.cname )
+        with open(self.fname, "w") as f:
+            f.write("# distance = 5881.1\n#  sc  fc  omega  spot3d_id\n")
+            for i in range(10):
+                f.write("%f %f %f %d\n"%(i/3., i*7.1, i*0.25, i))
+        self.cache = columnfile.CACHE
+        columnfile.CACHE = True
+
+    def tearDown( self ):
+        columnfile.CACHE = self.cache
+        for name in ( self.fname, self.cname ):
+            if os.path.exists( name ):
+                os.remove( name )
+
+    def testcache( self ):
+        c = columnfile.columnfile( self.fname )
+        self.assertTrue( os.path.exists( self.cname ) )
+        d = columnfile.columnfile( self.fname )
+        self.assertEqual( c.titles, d.titles )
+        self.assertEqual( d.parameters.get("distance"), 5881.1 )
+        for t in c.titles:
+            self.assertTrue( (c[t] == d[t]).all() )
+        # cached columns can still be modified in memory
+        d.reorder( np.arange(d.nrows)[::-1] )
+        d.filter( d.sc > 1 )
+        self.assertEqual( d.nrows, 6 )
+        e = columnfile.columnfile( self.fname )
+        self.assertTrue( (c.sc == e.sc).all() )
+
+    def teststale( self ):
+        columnfile.columnfile( self.fname )
+        with open(self.fname, "a") as f:
+            f.write("%f %f %f %d\n"%(1,2,3,4))
+        c = columnfile.columnfile( self.fname )
+        self.assertEqual( c.nrows, 11 )
+        c = columnfile.columnfile( self.fname )
+        self.assertEqual( c.nrows, 11 )
+
+    def testnocache( self ):
+        c = columnfile.columnfile( self.fname, new=True )
+        c.readfile( self.fname, cache=False )
+        self.assertFalse( os.path.exists( self.cname ) )
+        self.assertEqual( c.nrows, 10 )
+
+    def testdefault( self ):
+        columnfile.CACHE = self.cache
+        c = columnfile.columnfile( self.fname )
+        self.assertFalse( os.path.exists( self.cname ) )
+        self.assertEqual( c.nrows, 10 )
+
+    def testkeyword( self ):
+        columnfile.CACHE = False
+        c = columnfile.columnfile( self.fname, cache=True )
+        self.assertTrue( os.path.exists( self.cname ) )
+        d = columnfile.columnfile( self.fname, cache=True )
+        self.assertTrue( (c.sc == d.sc).all() )
+        os.remove( self.cname )
+        columnfile.CACHE = True
+        columnfile.columnfile( self.fname, cache=False )
+        self.assertFalse( os.path.exists( self.cname ) )
+
+    def testnocols( self ):
+        columnfile.write_colfile_cache( self.fname, [], [], [] )
+        c = columnfile.columnfile( self.fname )
+        self.assertEqual( ( c.titles, c.ncols, c.nrows ), ( [], 0, 0 ) )
+
+    def testreplace( self ):
+        with open( self.cname, "w" ) as f:
+            f.write( "old" )
+        with open( self.cname + ".tmp", "w" ) as f:
+            f.write( "new" )
+        columnfile.replace_file( self.cname + ".tmp", self.cname )
+        self.assertFalse( os.path.exists( self.cname + ".tmp" ) )
+        with open( self.cname ) as f:
+            self.assertEqual( f.read(), "new" )
+
+
+class testlazy( unittest.TestCase ):
+    def setUp( self ):
+        n = 100000
+        self.c = columnfile.colfile_from_dict( {
+            'sc' : np.random.random( n ) * 2048,
+            'fc' : np.random.random( n ) * 2048,
+            'omega' : np.linspace( -180, 180, n ),
+            'spot3d_id' : np.arange( n ) } )
+        self.hname = "testlazy.h5"
+        if os.path.exists( self.hname ):
+            os.remove( self.hname )
+        columnfile.colfile_to_hdf( self.c, self.hname, name='peaks',
+                                   compression='gzip' )
+        columnfile.colfile_to_hdf( self.c, self.hname, name='plain' )
+
+    def tearDown( self ):
+        if os.path.exists( self.hname ):
+            os.remove( self.hname )
+
+    def testlazyread( self ):
+        for name in ('peaks', 'plain'):
+            h = columnfile.lazy_colfile_from_hdf( self.hname, name=name )
+            self.assertEqual( h.nrows, self.c.nrows )
+            self.assertFalse( h.isloaded( 'sc' ) )
+            self.assertTrue( (h.sc == self.c.sc).all() )
+            self.assertTrue( h.isloaded( 'sc' ) )
+            self.assertFalse( h.isloaded( 'fc' ) )
+
+    def testlazyfilter( self ):
+        for name in ('peaks', 'plain'):
+            h = columnfile.lazy_colfile_from_hdf( self.hname, name=name )
+            c = self.c.copy()
+            m = c.sc > 1000
+            h.filter( h.sc > 1000 )
+            c.filter( m )
+            self.assertFalse( h.isloaded( 'fc' ) )
+            h.filter( h.omega > 0 )
+            c.filter( c.omega > 0 )
+            order = np.argsort( c.fc )
+            h.reorder( order )
+            c.reorder( order )
+            r = h.copyrows( np.arange( 0, h.nrows, 3 ) )
+            self.assertFalse( r.isloaded( 'spot3d_id' ) )
+            for t in c.titles:
+                self.assertTrue( (h[t] == c[t]).all() )
+                self.assertTrue( (r[t] == c[t][::3]).all() )
+            m = h.materialise()
+            self.assertTrue( isinstance( m.bigarray, np.ndarray ) )
+
+    def testgeometry( self ):
+        h = columnfile.lazy_colfile_from_hdf( self.hname, name='peaks' )
+        for name, value in ( ('chi', 0.), ('distance', 5881.1), ('o11', 1),
+                             ('o12', 0), ('o21', 0), ('o22', 1),
+                             ('omegasign', 1.), ('t_x', 31.9), ('t_y', -28.6),
+                             ('t_z', 0.), ('tilt_x', -0.003), ('tilt_y', -0.002),
+                             ('tilt_z', 0.017), ('wavelength', 0.247),
+                             ('wedge', 0.076), ('y_center', 1080.2),
+                             ('y_size', 1.5), ('z_center', 978.2),
+                             ('z_size', 1.5) ):
+            h.parameters.set( name, value )
+        h.updateGeometry()
+        self.c.parameters = h.parameters
+        self.c.updateGeometry()
+        self.assertTrue( (h.ds == self.c.ds).all() )
+        self.assertFalse( h.isloaded( 'spot3d_id' ) )
+
+
+class testview( unittest.TestCase ):
+    def setUp( self ):
+        n = 1000
+        self.c = columnfile.colfile_from_dict( {
+            'sc' : np.random.random( n ) * 2048,
+            'fc' : np.random.random( n ) * 2048,
+            'omega' : np.linspace( -180, 180, n ),
+            'spot3d_id' : np.arange( n ) } )
+
+    def testview( self ):
+        c = self.c
+        v = c.view( c.sc > 1024 )
+        self.assertFalse( v.isloaded( 'sc' ) )
+        w = v.view( v.omega > 0 )
+        self.assertFalse( v.isloaded( 'fc' ) )
+        self.assertFalse( w.isloaded( 'fc' ) )
+        m = (c.sc > 1024) & (c.omega > 0)
+        for t in c.titles:
+            self.assertTrue( (w[t] == c[t][m]).all() )
+        w.filter( w.fc < 1000 )
+        m &= c.fc < 1000
+        self.assertEqual( w.nrows, m.sum() )
+        self.assertTrue( (w.materialise().spot3d_id == c.spot3d_id[m]).all() )
+        self.assertEqual( c.nrows, 1000 )
+
+    def testviewloaded( self ):
+        c = self.c
+        v = c.view( np.arange( 0, c.nrows, 2 ) )
+        v.addcolumn( v.sc * 2, 'sc2' )
+        v.fc = 3
+        w = v.view( slice( 0, 10 ) )
+        self.assertTrue( (w.sc2 == c.sc[:20:2] * 2).all() )
+        self.assertTrue( (w.fc == 3).all() )
+        self.assertTrue( (c.fc != 3).all() )
+        r = v.copyrows( [1, 3] )
+        v.sc2[:] = 0
+        self.assertTrue( (r.sc2 == c.sc[[2, 6]] * 2).all() )
+
+
+class testindex( unittest.TestCase ):
+    def setUp( self ):
+        n = 10000
+        self.c = columnfile.colfile_from_dict( {
+            'ds' : np.random.random( n ),
+            'dty' : np.round( np.random.random( n ) * 100 - 50 ),
+            'omega' : np.random.random( n ) * 360 - 180 } )
+
+    def testrange( self ):
+        c = self.c
+        r = c.select_range( 'ds', 0.2, 0.3 )
+        self.assertTrue( c.has_index( 'ds' ) )
+        self.assertTrue( (r == np.flatnonzero( (c.ds >= 0.2) & (c.ds < 0.3) )).all() )
+        r = c.select_range( 'dty', -3, 3 )
+        self.assertTrue( (r == np.flatnonzero( (c.dty >= -3) & (c.dty < 3) )).all() )
+        self.assertEqual( len( c.select_range( 'dty', 3, -3 ) ), 0 )
+
+    def testbox( self ):
+        c = self.c
+        c.build_index( 'omega', 'dty' )
+        r = c.select_box( omega=(-10, 10), dty=(-5, 5), ds=(0, 0.5) )
+        m = (c.omega >= -10) & (c.omega < 10) & (c.dty >= -5) & (c.dty < 5) & \
+            (c.ds < 0.5)
+        self.assertTrue( (r == np.flatnonzero( m )).all() )
+
+    def testinvalidate( self ):
+        c = self.c
+        c.build_index( 'omega', 'ds' )
+        c.ds = c.ds * 2
+        self.assertFalse( c.has_index( 'ds' ) )
+        self.assertTrue( c.has_index( 'omega' ) )
+        c.filter( c.dty > 0 )
+        self.assertFalse( c.has_index( 'omega' ) )
+        r = c.select_range( 'omega', 0, 90 )
+        self.assertTrue( (r == np.flatnonzero( (c.omega >= 0) & (c.omega < 90) )).all() )
+        c.sortby( 'ds' )
+        self.assertFalse( c.has_index( 'omega' ) )
+        c.build_index( 'omega' )
+        c['omega'] = 0
+        self.assertFalse( c.has_index( 'omega' ) )
+
+
+class testwriter( unittest.TestCase ):
+    def setUp( self ):
+        n = 1000
+        self.c = columnfile.colfile_from_dict( {
+            'sc' : np.random.random( n ) * 2048,
+            'omega' : np.linspace( -180, 180, n ),
+            'spot3d_id' : np.arange( n ),
+            'U11' : np.random.random( n ),
+            'other' : np.random.random( n ) } )
+        self.c.parameters.set( 'distance', 123.4 )
+
+    def tearDown( self ):
+        for fname in ( "testwriter.h5", "testwriter.flt" ):
+            if os.path.exists( fname ):
+                os.remove( fname )
+
+    def testwritefile( self ):
+        c = self.c
+        c.writefile( "testwriter.flt" )
+        fmt = "  %.4f  %.4f  %.0f  %.12f  %f\n"
+        with open( "testwriter.flt" ) as f:
+            lines = f.readlines()
+        self.assertEqual( lines[0], "# distance = 123.4\n" )
+        self.assertEqual( lines[1], "#  sc  omega  spot3d_id  U11  other\n" )
+        for i in range( c.nrows ):
+            self.assertEqual( lines[i+2], fmt % tuple( [ c[t][i] for t in c.titles ] ) )
+
+    def testblocks( self ):
+        c = self.c
+        for fname in ( "testwriter.h5", "testwriter.flt" ):
+            if os.path.exists( fname ):
+                os.remove( fname )
+            with columnfile.colfile_writer( fname, chunks = 64,
+                                            parameters = c.parameters ) as w:
+                for i in range( 0, c.nrows, 100 ):
+                    w.append( { t : c[t][i:i+100] for t in c.titles } )
+                    self.assertTrue( w.nrows <= i + 100 )
+            self.assertEqual( w.nrows, c.nrows )
+            r = columnfile.columnfile( fname )
+            self.assertEqual( r.nrows, c.nrows )
+            self.assertTrue( (r.spot3d_id == c.spot3d_id).all() )
+            self.assertTrue( np.allclose( r.omega, c.omega, atol=1e-4 ) )
+
+
+class test_issue289( unittest.TestCase ):
     """
     https://github.com/FABLE-3DXRD/ImageD11/issues/289
     @AxelHenningsson
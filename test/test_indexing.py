@@ -1,9 +1,10 @@
 
 from __future__ import print_function
 
-from ImageD11.indexing import ubi_fit_2pks
+from ImageD11.indexing import ubi_fit_2pks, find_pairs, indexer
 from ImageD11.unitcell import unitcell
 import numpy as np
+import os, subprocess, sys, threading
 import time
 import unittest, cProfile, pstats
 
@@ -74,8 +75,210 @@ class test_2pks( unittest.TestCase ):
             self.assertTrue( drlvold > 0 )
             self.assertAlmostEqual( drlvnew, 0 )
 
-        
-        
+
+class test_find_pairs( unittest.TestCase ):
+    def setUp(self):
+        np.random.seed(42)
+        n1 = np.random.standard_normal( (200, 3) )
+        n2 = np.random.standard_normal( (300, 3) )
+        self.n1 = n1 / np.sqrt( (n1*n1).sum( axis=1 ) )[:,None]
+        self.n2 = n2 / np.sqrt( (n2*n2).sum( axis=1 ) )[:,None]
+        self.cs = np.array( [ 0.5, -0.3, 0.1, 0.9 ] )
+
+    def test_closest(self):
+        tol = 0.002
+        expected = []
+        for i in range( len( self.n1 ) ):
+            diff = abs( np.dot( self.n2, self.n1[i] )[:,None] - self.cs ).min( axis=1 )
+            j = np.argmin( diff )
+            if diff[j] < tol:
+                expected.append( (i, j) )
+        got = find_pairs( self.n1, self.n2, self.cs, tol )
+        self.assertTrue( len(expected) > 0 )
+        self.assertTrue( np.array_equal( got, np.array( expected ) ) )
+
+    def test_all(self):
+        tol = 0.002
+        expected = []
+        for i in range( len( self.n1 ) ):
+            costheta = np.dot( self.n2, self.n1[i] )
+            for cval in self.cs:
+                for j in np.flatnonzero( abs( cval - costheta ) < tol ):
+                    expected.append( (i, j) )
+        got = find_pairs( self.n1, self.n2, self.cs, -tol )
+        self.assertTrue( len(expected) > 0 )
+        self.assertTrue( np.array_equal( got, np.array( expected ) ) )
+
+
+def make_gvectors( cell, ngrains, seed=42 ):
+    """
+    Some random grains with most of their peaks and a bit of noise
+    """
+    np.random.seed( seed )
+    cell.makerings( 1.0 )
+    hkls = np.array( [ h for ds in cell.ringds for h in cell.ringhkls[ds] ] ).T
+    gv = []
+    for U in make_random_orientations( ngrains ):
+        g = np.dot( np.dot( U, cell.B ), hkls ).T
+        gv.append( g[ np.random.random( len(g) ) < 0.8 ] )
+    gv = np.concatenate( gv )
+    return gv + np.random.standard_normal( gv.shape ) * 1e-4
+
+class test_score_hits( unittest.TestCase ):
+    def setUp(self):
+        self.cell = unitcell( [ 4.05, 4.05, 4.05, 90., 90., 90. ], "F" )
+        self.gv = make_gvectors( self.cell, 10 )
+
+    def test_same_as_orient(self):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=0.002,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.assigntorings()
+        ind.ring_1 = 0
+        ind.ring_2 = 1
+        ind.find()
+        self.assertTrue( len(ind.hits) > 0 )
+        ubis, npks = ind.score_hits( ind.hits )
+        for (i, j), ubi, npk in zip( ind.hits, ubis, npks ):
+            self.cell.orient( 0, ind.gv[i], 1, ind.gv[j] )
+            self.assertTrue( np.array_equal( self.cell.UBI, ubi ) )
+            self.assertEqual( ind.score( ubi ), npk )
+
+    def test_subsample(self):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=-0.02,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.assigntorings()
+        ind.ring_1 = 0
+        ind.ring_2 = 1
+        ind.find()
+        ubis, full = ind.score_hits( ind.hits )
+        ind.score_sample = 100
+        ubis, npks = ind.score_hits( ind.hits, minpks=20 )
+        self.assertTrue( ind.nscore_avoided > 0 )
+        self.assertEqual( ind.nscore_avoided + ind.nscore_full, len(ind.hits) )
+        self.assertTrue( np.array_equal( full > 20, npks > 20 ) )
+        self.assertTrue( np.array_equal( full[ npks > 20 ], npks[ npks > 20 ] ) )
+        for ubi, npk in zip( ubis, npks ):
+            self.assertEqual( ind.score( ubi, minpks=20 ) > 20, npk > 20 )
+
+    def test_scorethem(self):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=0.002,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.score_batch = 16
+        ind.assigntorings()
+        ind.ring_1 = 0
+        ind.ring_2 = 1
+        ind.find()
+        ind.scorethem()
+        self.assertEqual( len(ind.ubis), 10 )
+        self.assertTrue( min( ind.scores ) > 20 )
+
+    def test_scorethem_fitb4(self):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=0.002,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.score_batch = 16
+        ind.assigntorings()
+        ind.ring_1 = 0
+        ind.ring_2 = 1
+        ind.find()
+        ind.scorethem( fitb4=True )
+        self.assertEqual( len(ind.ubis), 10 )
+        self.assertTrue( min( ind.scores ) > 20 )
+
+
+class test_score_all_pairs( unittest.TestCase ):
+    def setUp(self):
+        self.cell = unitcell( [ 4.05, 4.05, 4.05, 90., 90., 90. ], "F" )
+        self.gv = make_gvectors( self.cell, 10 )
+
+    def run_pairs(self, cosine_tol, workers):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=cosine_tol,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.score_all_pairs( n=6, workers=workers )
+        return np.array( ind.ubis ), ind.scores, ind.ga
+
+    def test_threads_same_as_serial(self):
+        for cosine_tol in ( 0.002, -0.002 ):
+            serial = self.run_pairs( cosine_tol, None )
+            threaded = self.run_pairs( cosine_tol, 3 )
+            self.assertEqual( len(serial[0]), 10 )
+            self.assertTrue( np.array_equal( serial[0], threaded[0] ) )
+            self.assertEqual( serial[1], threaded[1] )
+            self.assertTrue( np.array_equal( serial[2], threaded[2] ) )
+
+    def count_scores(self, workers):
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=-0.002,
+                       minpks=52, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        ind.score_sample = 50
+        ind.score_all_pairs( n=6, workers=workers )
+        return ind.nscore_full, ind.nscore_avoided
+
+    def test_threads_score_counts(self):
+        serial = self.count_scores( None )
+        threaded = self.count_scores( 3 )
+        self.assertTrue( serial[1] > 0 )
+        # counted in the main thread, so the same every time
+        for _ in range( 3 ):
+            self.assertEqual( self.count_scores( 3 ), threaded )
+        # the threads may score a few trials that serial skips
+        self.assertEqual( serial[1], threaded[1] )
+        self.assertTrue( serial[0] <= threaded[0] )
+
+    def test_threads_stop_on_error(self):
+        nthreads = threading.active_count()
+        ind = indexer( unitcell=self.cell, gv=self.gv, cosine_tol=0.002,
+                       minpks=20, hkl_tol=0.05, ds_tol=0.01, wavelength=0.3 )
+        def scorethem( scored=None ):
+            raise ValueError( "scoring failed" )
+        ind.scorethem = scorethem
+        with self.assertRaises( ValueError ):
+            ind.score_all_pairs( n=6, workers=3 )
+        self.assertEqual( threading.active_count(), nthreads )
+
+    def test_workqueue_serial(self):
+        # several threads in the workqueue layer abort python
+        script = ( "import sys; sys.path.insert(0, %r)\n"
+                   "from test_indexing import *\n"
+                   "t = test_score_all_pairs()\n"
+                   "t.setUp()\n"
+                   "print(len(t.run_pairs(0.002, 3)[0]))\n" ) % ( os.path.dirname( os.path.abspath( __file__ ) ), )
+        env = dict( os.environ, NUMBA_THREADING_LAYER="workqueue" )
+        out = subprocess.check_output( [ sys.executable, "-c", script ], env=env,
+                                       stderr=subprocess.STDOUT )
+        self.assertTrue( b"scoring the pairs serially" in out )
+        self.assertEqual( out.split()[-1], b"10" )
+
+
+class test_reset_gv( unittest.TestCase ):
+    def setUp(self):
+        self.cell = unitcell( [ 4.05, 4.05, 4.05, 90., 90., 90. ], "F" )
+        self.gvs = [ make_gvectors( self.cell, n, seed=n ) for n in ( 3, 1, 5 ) ]
+
+    def run_index(self, ind):
+        ind.assigntorings()
+        for ind.ring_1 in range(3):
+            for ind.ring_2 in range(3):
+                ind.find()
+                ind.scorethem()
+        return np.array( ind.ubis ), ind.scores, ind.ga
+
+    def test_same_as_new(self):
+        pars = dict( cosine_tol=0.002, minpks=20, hkl_tol=0.05, ds_tol=0.01,
+                     wavelength=0.3 )
+        reused = indexer( unitcell=unitcell( self.cell.lattice_parameters, "F" ),
+                          **pars )
+        reused.makerings( 1.1 )
+        rings = reused.unitcell.ringds
+        for gv in self.gvs:
+            new = self.run_index( indexer( unitcell=self.cell, gv=gv, **pars ) )
+            reused.reset_gv( gv )
+            again = self.run_index( reused )
+            self.assertTrue( len(new[0]) > 0 )
+            self.assertTrue( np.array_equal( new[0], again[0] ) )
+            self.assertEqual( new[1], again[1] )
+            self.assertTrue( np.array_equal( new[2], again[2] ) )
+        # rings and cosines were only computed once
+        self.assertTrue( reused.unitcell.ringds is rings )
+        self.assertTrue( any( k[:2] == ( 0, 0 ) for k in reused._ring_cosines ) )
 
 
 if __name__=="__main__":
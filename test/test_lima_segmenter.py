@@ -0,0 +1,377 @@
+
+import os
+import time
+import unittest
+import numpy as np
+import h5py
+from ImageD11.sinograms import lima_segmenter
+from ImageD11 import sparseframe, parameters, transform
+
+LIMAPATH = "entry_0000/measurement/data"
+PARFILE = """distance 100000.0
+wavelength 0.3
+y_center 25.0
+z_center 20.0
+y_size 75.0
+z_size 75.0
+o11 1
+o12 0
+o21 0
+o22 -1
+tilt_x 0.0
+tilt_y 0.0
+tilt_z 0.0
+"""
+
+
+def make_lima_file(hname, nframes=30, shape=(50, 60), seed=11):
+    """Frames with some spots on a noisy background, like a lima file"""
+    rng = np.random.RandomState(seed)
+    i, j = np.mgrid[0 : shape[0], 0 : shape[1]]
+    frames = np.empty((nframes,) + shape, np.uint16)
+    for f in range(nframes):
+        img = rng.poisson(2.0, shape).astype(float)
+        for _ in range(rng.randint(0, 8)):
+            ci, cj = rng.random_sample(2) * shape
+            img += 300 * np.exp(-((i - ci) ** 2 + (j - cj) ** 2) / 3.0)
+        frames[f] = img
+    with h5py.File(hname, "w") as hout:
+        hout.create_dataset(LIMAPATH, data=frames, chunks=(1,) + shape)
+    return frames
+
+
+def set_options(**kwds):
+    lima_segmenter.OPTIONS = lima_segmenter.SegmenterOptions(
+        cut=10, howmany=500, pixels_in_spot=3, **kwds
+    )
+    lima_segmenter.OPTIONS.setup()
+
+
+class test_segment_lima(unittest.TestCase):
+    src = "testlimasrc.h5"
+
+    def setUp(self):
+        self.frames = make_lima_file(self.src)
+        self.dests = []
+
+    def tearDown(self):
+        for name in [self.src] + self.dests:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def segment(self, name, **kwds):
+        set_options(**kwds)
+        self.dests.append(name)
+        lima_segmenter.segment_lima((self.src, name, LIMAPATH))
+        return sparseframe.SparseScan(name, LIMAPATH)
+
+    def expected(self):
+        set_options()
+        mask = np.ones(self.frames.shape[1:], np.uint8)
+        lima_segmenter.OPTIONS.mask = mask
+        with h5py.File(self.src, "r") as hin:
+            return list(lima_segmenter.reader(hin[LIMAPATH], mask, 10))
+
+    def test_flush_sizes(self):
+        spfs = self.expected()
+        nnz = [0 if spf is None else spf.nnz for spf in spfs]
+        self.assertTrue(sum(nnz) > 3 * lima_segmenter.CHUNK // 100)
+        for flush_pixels in (1, 777, 10**7):
+            scan = self.segment("testlimadst%d.h5" % (flush_pixels), flush_pixels=flush_pixels)
+            self.assertTrue((scan.nnz == nnz).all())
+            for i, spf in enumerate(spfs):
+                if spf is None:
+                    continue
+                s, e = scan.ipt[i], scan.ipt[i + 1]
+                self.assertTrue((scan.row[s:e] == spf.row).all())
+                self.assertTrue((scan.col[s:e] == spf.col).all())
+                self.assertTrue((scan.intensity[s:e] == spf.pixels["intensity"]).all())
+
+    def test_pipelined(self):
+        serial = self.segment("testlimaserial.h5")
+        for nthreads in (1, 3):
+            piped = self.segment("testlimapiped%d.h5" % (nthreads), segment_threads=nthreads)
+            self.assertTrue((serial.nnz == piped.nnz).all())
+            self.assertTrue((serial.row == piped.row).all())
+            self.assertTrue((serial.col == piped.col).all())
+            self.assertTrue((serial.intensity == piped.intensity).all())
+
+    def test_pipelined_stops(self):
+        set_options()
+        mask = np.ones(self.frames.shape[1:], np.uint8)
+        lima_segmenter.OPTIONS.mask = mask
+        with h5py.File(self.src, "r") as hin:
+            frames = lima_segmenter.pipelined_reader(hin[LIMAPATH], mask, 10, depth=2)
+            for i, spf in enumerate(frames):
+                if i == 3:
+                    break
+            frames.close()  # threads are collected
+        self.assertEqual(i, 3)
+
+    def test_writer_aligned(self):
+        with h5py.File("testlimawriter.h5", "w") as hout:
+            self.dests.append("testlimawriter.h5")
+            w = lima_segmenter.sparsewriter(
+                hout.create_group("scan"), 20, np.uint16, flush_pixels=25, chunk=10
+            )
+            writes = []
+            w.append(0, None)
+            for i in range(1, 20):
+                spf = sparseframe.sparse_frame(
+                    np.arange(i, dtype=np.uint16), np.arange(i, dtype=np.uint16), (100, 100)
+                )
+                spf.set_pixels("intensity", np.full(i, i, np.uint16))
+                w.append(i, spf)
+                writes.append(w.npx)
+            self.assertTrue(all(n % 10 == 0 for n in writes))
+            self.assertEqual(w.close(), sum(range(20)))
+            self.assertTrue(w.speed() > 0)
+            self.assertTrue((hout["scan/nnz"][:] == np.arange(20)).all())
+            self.assertTrue(
+                (hout["scan/intensity"][:] == np.repeat(np.arange(20), np.arange(20))).all()
+            )
+
+    def test_writer_nnz_flushed(self):
+        with h5py.File("testlimawriter.h5", "w") as hout:
+            self.dests.append("testlimawriter.h5")
+            w = lima_segmenter.sparsewriter(
+                hout.create_group("scan"), 20, np.uint16, flush_pixels=25, chunk=10
+            )
+            w.append(0, None)
+            for i in range(1, 12):
+                spf = sparseframe.sparse_frame(
+                    np.arange(i, dtype=np.uint16), np.arange(i, dtype=np.uint16), (100, 100)
+                )
+                spf.set_pixels("intensity", np.full(i, i, np.uint16))
+                w.append(i, spf)
+            # not closed: like a job that was killed
+            nnz = hout["scan/nnz"][:]
+            self.assertTrue(w.nflush > 0)
+            self.assertTrue(0 < nnz.sum() <= w.npx)
+            k = w.nfr_written
+            self.assertTrue(k > 1)
+            self.assertTrue((nnz[:k] == np.arange(k)).all())
+            self.assertTrue((nnz[k:] == 0).all())
+            self.assertTrue((hout["scan/row"][: nnz.sum()] == np.concatenate(
+                [np.arange(i) for i in range(k)])).all())
+
+
+class test_main(unittest.TestCase):
+    dsname = "testlimads.h5"
+    names = ["testlimaq%d.h5" % (i) for i in range(4)]
+
+    def setUp(self):
+        for name in self.names[:3]:
+            make_lima_file(name, nframes=5)
+        with open(self.names[3], "w") as fout:
+            fout.write("not an hdf file")
+        with h5py.File(self.dsname, "w") as hout:
+            hout.attrs["limapath"] = LIMAPATH
+            hout.attrs["analysispath"] = "."
+            hout.attrs["datapath"] = "."
+            hout["imagefiles"] = [n.encode() for n in self.names]
+            hout["sparsefiles"] = [("sparse_" + n).encode() for n in self.names]
+            g = hout.create_group("lima_segmenter")
+            g.attrs["cut"] = 10
+            g.attrs["cores_per_job"] = 1
+            g.attrs["files_per_core"] = 8
+
+    def tearDown(self):
+        for name in self.names + [self.dsname]:
+            for n in (name, "sparse_" + name, "sparse_" + name + ".failed"):
+                if os.path.exists(n):
+                    os.remove(n)
+
+    def test_resume_and_retry(self):
+        failed = lima_segmenter.main(self.dsname, 0, retries=1)
+        self.assertEqual(failed, [os.path.join(".", self.names[3])])
+        with open("sparse_" + self.names[3] + ".failed") as fin:
+            self.assertEqual(int(fin.read()), 2)  # first try + 1 retry
+        for name in self.names[:3]:
+            self.assertTrue(lima_segmenter.is_done("sparse_" + name, LIMAPATH))
+            self.assertFalse(os.path.exists("sparse_" + name + ".lock"))
+        # a job killed while writing the second file
+        with h5py.File("sparse_" + self.names[1], "a") as hout:
+            del hout[LIMAPATH].attrs["npx"]
+        mtime = os.path.getmtime("sparse_" + self.names[0])
+        opts = lima_segmenter.SegmenterOptions()
+        opts.load(self.dsname, "lima_segmenter")
+        opts.jobid = 0
+        todo = lima_segmenter.filequeue(lima_segmenter.job_args(opts), retries=1)
+        self.assertEqual([arg[0] for arg in todo.todo()], [os.path.join(".", self.names[1])])
+        lima_segmenter.main(self.dsname, 0, retries=1)
+        self.assertEqual(mtime, os.path.getmtime("sparse_" + self.names[0]))
+        self.assertTrue(lima_segmenter.is_done("sparse_" + self.names[1], LIMAPATH))
+        scan = sparseframe.SparseScan("sparse_" + self.names[1], LIMAPATH)
+        self.assertEqual(scan.shape[0], 5)
+
+    def test_stale_lock(self):
+        opts = lima_segmenter.SegmenterOptions()
+        opts.load(self.dsname, "lima_segmenter")
+        opts.jobid = 0
+        todo = lima_segmenter.filequeue(lima_segmenter.job_args(opts))
+        first = todo.args[0]
+        with open(todo.lockname(first), "w") as fout:
+            fout.write("%s %d\n" % (todo.host, 2**22 + 1))  # nobody
+        self.assertEqual(todo.claim(), first)
+        self.assertEqual(todo.claim(), todo.args[1])
+        todo.release(first, True)
+        todo.release(todo.args[1], True)
+        self.assertFalse(os.path.exists(todo.lockname(first)))
+
+    def test_other_host_lock(self):
+        opts = lima_segmenter.SegmenterOptions()
+        opts.load(self.dsname, "lima_segmenter")
+        opts.jobid = 0
+        args = lima_segmenter.job_args(opts)
+        first = args[0]
+        lockname = lima_segmenter.filequeue(args).lockname(first)
+        with open(lockname, "w") as fout:
+            fout.write("%s %d\n" % ("elsewhere", os.getpid()))
+        # recent lock on another host: somebody is working on it
+        todo = lima_segmenter.filequeue(args, timeout=60)
+        self.assertEqual(todo.claim(), args[1])
+        todo.release(args[1], True)
+        # a killed job on another host stops touching its lock
+        old = time.time() - 120
+        os.utime(lockname, (old, old))
+        todo = lima_segmenter.filequeue(args, timeout=60)
+        self.assertEqual(todo.claim(), first)
+        with open(lockname) as fin:
+            self.assertEqual(fin.read().split()[0], todo.host)
+        todo.release(first, True)
+        self.assertFalse(os.path.exists(lockname))
+        # we stalled and another host took the lock over: leave it alone
+        todo = lima_segmenter.filequeue(args, timeout=60)
+        self.assertEqual(todo.claim(), first)
+        with open(lockname, "w") as fout:
+            fout.write("%s %d\n" % ("elsewhere", os.getpid()))
+        todo.release(first, True)
+        self.assertTrue(os.path.exists(lockname))
+        os.remove(lockname)
+
+    def test_heartbeat(self):
+        opts = lima_segmenter.SegmenterOptions()
+        opts.load(self.dsname, "lima_segmenter")
+        opts.jobid = 0
+        ndone = [0]
+        is_done = lima_segmenter.is_done
+
+        def counting(*args):
+            ndone[0] += 1
+            return is_done(*args)
+
+        lima_segmenter.is_done = counting
+        try:
+            todo = lima_segmenter.filequeue(lima_segmenter.job_args(opts), timeout=0.2)
+            first = todo.claim()
+            old = time.time() - 100
+            os.utime(todo.lockname(first), (old, old))
+            time.sleep(0.3)
+            self.assertTrue(time.time() - os.path.getmtime(todo.lockname(first)) < 1)
+            second = todo.claim()
+            todo.release(first, True)
+            todo.release(second, True)
+        finally:
+            lima_segmenter.is_done = is_done
+        # once for the todo list, then once per claim
+        self.assertEqual(ndone[0], len(todo.args) + 2)
+
+
+class test_adaptive(unittest.TestCase):
+    src = "testlimabg.h5"
+
+    def setUp(self):
+        # strong radial background getting brighter through the scan
+        rng = np.random.RandomState(7)
+        shape = (50, 60)
+        i, j = np.mgrid[0 : shape[0], 0 : shape[1]]
+        self.r = np.hypot(i - 20.0, j - 25.0)
+        self.spots = []
+        frames = np.empty((20,) + shape, np.uint16)
+        for f in range(len(frames)):
+            bg = (100 + 5 * f) * (1 + np.cos(self.r / 6.0))
+            img = rng.poisson(bg).astype(float)
+            ci, cj = rng.random_sample(2) * (shape[0] - 10, shape[1] - 10) + 5
+            img += 1000 * np.exp(-((i - ci) ** 2 + (j - cj) ** 2) / 2.0)
+            self.spots.append((int(round(ci)), int(round(cj))))
+            frames[f] = img
+        with h5py.File(self.src, "w") as hout:
+            hout.create_dataset(LIMAPATH, data=frames, chunks=(1,) + shape)
+        self.frames = frames
+        self.dests = []
+
+    def tearDown(self):
+        for name in [self.src] + self.dests:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def segment(self, name, tth=None, **kwds):
+        set_options(**kwds)
+        lima_segmenter.OPTIONS.howmany = self.frames[0].size
+        lima_segmenter.OPTIONS.tth = tth
+        self.dests.append(name)
+        lima_segmenter.segment_lima((self.src, name, LIMAPATH))
+        return sparseframe.SparseScan(name, LIMAPATH)
+
+    def check_spots(self, scan):
+        for f, (ci, cj) in enumerate(self.spots):
+            s, e = scan.ipt[f], scan.ipt[f + 1]
+            found = (scan.row[s:e] == ci) & (scan.col[s:e] == cj)
+            self.assertEqual(found.sum(), 1)
+
+    def test_per_pixel(self):
+        fixed = self.segment("testlimafixed.h5")
+        adapt = self.segment("testlimaadapt.h5", nsigma=5)
+        self.check_spots(adapt)
+        # fixed cut keeps most of the background
+        self.assertTrue(fixed.nnz.min() > self.frames[0].size // 2)
+        self.assertTrue(adapt.nnz.max() < 100)
+
+    def test_radial(self):
+        adapt = self.segment("testlimaradial.h5", nsigma=5, tth=self.r, radial_bins=30)
+        self.check_spots(adapt)
+        self.assertTrue(adapt.nnz.max() < 100)
+        piped = self.segment(
+            "testlimaradialp.h5", nsigma=5, tth=self.r, radial_bins=30, segment_threads=2
+        )
+        self.assertTrue((piped.nnz == adapt.nnz).all())
+        self.assertTrue((piped.row == adapt.row).all())
+        self.assertTrue((piped.col == adapt.col).all())
+        self.assertTrue((piped.intensity == adapt.intensity).all())
+
+    def test_parfile(self):
+        parfile = "testlimabg.par"
+        self.dests.append(parfile)
+        with open(parfile, "w") as fout:
+            fout.write(PARFILE)
+        adapt = self.segment("testlimapar.h5", nsigma=5, parfile=parfile, radial_bins=30)
+        tth = lima_segmenter.OPTIONS.tth
+        self.assertEqual(tth.shape, self.frames[0].shape)
+        # 2theta goes up with the distance from the beam centre
+        self.assertTrue(tth[20, 25] < tth[20, 35] < tth[20, 45])
+        self.check_spots(adapt)
+        self.assertTrue(adapt.nnz.max() < 100)
+        pars = parameters.read_par_file(parfile).parameters
+        pars["shape"] = self.frames[0].shape
+        ref = self.segment("testlimatth.h5", nsigma=5, radial_bins=30,
+                           tth=transform.PixelLUT(pars).tth)
+        self.assertTrue((ref.nnz == adapt.nnz).all())
+        self.assertTrue((ref.row == adapt.row).all())
+        self.assertTrue((ref.col == adapt.col).all())
+
+    def test_background_jump(self):
+        # a background that goes over the cut in every pixel of a bin
+        rng = np.random.RandomState(8)
+        shape = self.frames[0].shape
+        cut = lima_segmenter.adaptivecut(
+            np.ones(shape, np.uint8), np.uint16, 5, tth=self.r, nbins=30
+        )
+        self.assertEqual(cut(rng.poisson(100, shape).astype(np.uint16))[0], 0)
+        nnz = [cut(rng.poisson(1000, shape).astype(np.uint16))[0] for _ in range(100)]
+        self.assertEqual(nnz[0], self.frames[0].size)
+        self.assertTrue(nnz[-1] < 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
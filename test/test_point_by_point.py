@@ -1,12 +1,15 @@
+import os
+import shutil
 import numpy as np
+import h5py
 import unittest
 
 import sys
 if int(sys.version_info.major) == 2:
     raise unittest.SkipTest('Skipping PBP tests on Python 2')
 else:
-    from ImageD11.sinograms import point_by_point
-    from ImageD11 import transform
+    from ImageD11.sinograms import point_by_point, geometry
+    from ImageD11 import transform, parameters, unitcell, sym_u, indexing
 
 
 class TestDetectorRotationMatrix(unittest.TestCase):
@@ -247,5 +250,239 @@ class TestDivideWhere(unittest.TestCase):
         
         self.assertTrue(np.allclose(result_numpy, result_numba))
         
+class TestMaskerPeaks(unittest.TestCase):
+    def test_same_as_dtyimask(self):
+        rng = np.random.RandomState(42)
+        npeaks = 20000
+        ystep, ymin, y0 = 0.5, -10.0, 0.3
+        ybincens = np.arange(ymin, 10.0 + ystep / 2, ystep)
+        omega = rng.random_sample(npeaks) * 360 - 180
+        dty = ybincens[rng.randint(0, len(ybincens), npeaks)]
+        dty += rng.uniform(-0.01, 0.01, npeaks) * ystep  # motor noise
+        dtyi = geometry.dty_to_dtyi(dty, ystep, ymin)
+        sinomega = np.sin(np.radians(omega))
+        cosomega = np.cos(np.radians(omega))
+        masker = point_by_point.voxel_masker(omega, dtyi, ystep, ymin)
+        for si, sj in geometry.step_grid_from_ybincens(ybincens, ystep, 1, y0):
+            ip = point_by_point.masker_peaks(
+                masker, si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin
+            )
+            m = geometry.dtyimask_from_step_sincos(
+                si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin
+            )
+            self.assertTrue((ip == np.flatnonzero(m)).all())
+
+    def test_tiles(self):
+        rng = np.random.RandomState(43)
+        npeaks = 20000
+        ystep, ymin, y0 = 0.5, -10.0, 0.3
+        ybincens = np.arange(ymin, 10.0 + ystep / 2, ystep)
+        omega = rng.random_sample(npeaks) * 360 - 180
+        dty = ybincens[rng.randint(0, len(ybincens), npeaks)]
+        dtyi = geometry.dty_to_dtyi(dty, ystep, ymin)
+        sinomega = np.sin(np.radians(omega))
+        cosomega = np.cos(np.radians(omega))
+        masker = point_by_point.voxel_masker(omega, dtyi, ystep, ymin)
+        points = geometry.step_grid_from_ybincens(ybincens, ystep, 1, y0)
+        tiles = point_by_point.step_tiles(points, 4)
+        self.assertEqual(sorted(p for t in tiles for p in t), sorted(points))
+        for tile in tiles:
+            si, sj = np.array(tile).T
+            self.assertTrue(si.max() - si.min() < 4 and sj.max() - sj.min() < 4)
+            ip = point_by_point.tile_peaks(masker, tile, ystep, y0)
+            for si, sj in tile:
+                m = geometry.dtyimask_from_step_sincos(
+                    si, sj, sinomega, cosomega, dtyi, y0, ystep, ymin
+                )
+                # same peaks in the same order from the tile subset
+                mt = geometry.dtyimask_from_step_sincos(
+                    si, sj, sinomega[ip], cosomega[ip], dtyi[ip], y0, ystep, ymin
+                )
+                self.assertTrue((ip[mt] == np.flatnonzero(m)).all())
+
+
+class TestIndexer(unittest.TestCase):
+    """The reused indexer of get_indexer gives what a new one gives"""
+
+    def setUp(self):
+        rng = np.random.RandomState(45)
+        self.pars = parameters.parameters(
+            cell__a=4.05, cell__b=4.05, cell__c=4.05,
+            cell_alpha=90.0, cell_beta=90.0, cell_gamma=90.0,
+            wavelength=0.3, omegasign=1.0, wedge=0.0, chi=0.0,
+        )
+        self.pars.set("cell_lattice_[P,A,B,C,I,F,R]", "F")
+        uc = unitcell.unitcell_from_parameters(self.pars)
+        hkls = np.array([h for d, h in uc.gethkls(1.25)], float).T
+        gvs = []
+        for _ in range(3):
+            q, r = np.linalg.qr(rng.standard_normal((3, 3)))
+            q = q * np.sign(np.diag(r))
+            if np.linalg.det(q) < 0:
+                q = -q
+            gvs.append(np.dot(np.dot(q, uc.B), hkls))
+        # a little strain: peaks sit below the computed rings
+        gv = np.concatenate(gvs, axis=1) * 0.98
+        gv += rng.standard_normal(gv.shape) * 1e-4
+        tth, (eta, _), (omega, _) = transform.uncompute_g_vectors(gv, 0.3)
+        ok = np.isfinite(omega)
+        ok[ok] = abs(transform.compute_g_vectors(tth[ok], eta[ok], omega[ok], 0.3)
+                     - gv[:, ok]).max(axis=0) < 1e-9
+        t, e = np.radians(tth[ok]), np.radians(eta[ok])
+        self.omega, self.eta = omega[ok], eta[ok]
+        self.xyz = np.cos(t), -np.sin(t) * np.sin(e), np.sin(t) * np.cos(e)
+        self.ds = np.sqrt((gv[:, ok] ** 2).sum(axis=0))
+        point_by_point.parglobal = self.pars
+        point_by_point.ucglobal = uc
+        point_by_point.symglobal = sym_u.getgroup("cubic")()
+        point_by_point.colglobal = {"ds": self.ds}
+        point_by_point.indexerglobal = None
+        self.loglevel = indexing.loglevel
+        indexing.loglevel = 5
+
+    def tearDown(self):
+        point_by_point.indexerglobal = None
+        point_by_point.colglobal = None
+        indexing.loglevel = self.loglevel
+
+    def test_same_ubis(self):
+        opts = dict(ystep=1.0, y0=0.0, ymin=-1.0, minpks=20, hkl_tol=0.1,
+                    ds_tol=0.04, forgen=[0, 1, 2, 3], hmax=6)
+        sinomega = np.sin(np.radians(self.omega))
+        cosomega = np.cos(np.radians(self.omega))
+        dtyi = np.ones(len(self.ds), int)  # all in the beam at (0, 0)
+        for dsmax in [0.83, 1.2, 1.06, 1.0]:
+            m = self.ds < dsmax
+            args = (0, 0, m[m], self.omega[m], sinomega[m], cosomega[m], dtyi[m],
+                    self.xyz[0][m], self.xyz[1][m], self.xyz[2][m], self.eta[m])
+            fresh = point_by_point.idxpoint(*args, **opts)
+            ind = point_by_point.get_indexer(opts["ds_tol"])
+            reuse = point_by_point.idxpoint(*args, indexer=ind, **opts)
+            self.assertTrue(len(fresh) > 1)
+            self.assertEqual(len(fresh), len(reuse))
+            for f, r in zip(fresh, reuse):
+                self.assertEqual(f[:2], r[:2])
+                self.assertTrue((f[2] == r[2]).all())
+            # rings past the limit of this point are not used
+            new = indexing.indexer(
+                unitcell=unitcell.unitcell_from_parameters(self.pars),
+                wavelength=0.3, gv=ind.gv,
+            )
+            new.ds_tol = opts["ds_tol"]
+            new.assigntorings()
+            self.assertTrue((new.ra == ind.ra).all())
+            self.assertTrue((new.na == ind.na).all())
+            for j in range(len(new.na)):
+                self.assertEqual(new.ring_hkls(j), ind.ring_hkls(j))
+
+
+class TestPBPStore(unittest.TestCase):
+    h5name = "testpbpstore.h5"
+    txtname = "testpbpstore.txt"
+
+    def setUp(self):
+        rng = np.random.RandomState(44)
+        self.results = []
+        for i in range(-3, 4):
+            for j in range(-3, 4):
+                grains = [(rng.randint(10, 99), rng.randint(1, 9), rng.random_sample((3, 3)))
+                          for _ in range(rng.randint(1, 4))]
+                self.results.append((i, j, grains))
+
+    def tearDown(self):
+        for name in (self.h5name, self.txtname):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def check(self, pmap, results, tol=0):
+        rows = [(i, j, n, u) + tuple(ubi.ravel()) for i, j, g in results for n, u, ubi in g]
+        self.assertEqual(pmap.nrows, len(rows))
+        for k, t in enumerate(point_by_point.PBPStore.titles):
+            self.assertTrue(np.abs(pmap.getcolumn(t) - np.array(rows)[:, k]).max() <= tol)
+
+    def test_store(self):
+        with point_by_point.PBPStore(self.h5name, flush_points=10) as store:
+            for i, j, g in self.results[:25]:
+                store.append(i, j, g)
+            # 20 points written so far
+            self.assertEqual(store.nrows, sum(len(g) for i, j, g in self.results[:20]))
+        self.check(point_by_point.PBPMap(self.h5name), self.results[:25])
+        # a job killed while writing leaves rows after nrows
+        with h5py.File(self.h5name, "a") as hout:
+            g = hout["pbpmap"]
+            for t in point_by_point.PBPStore.titles[:5]:
+                g[t].resize((g[t].shape[0] + 2,))
+        self.check(point_by_point.PBPMap(self.h5name), self.results[:25])
+        # appending goes on from the last complete flush
+        with point_by_point.PBPStore(self.h5name, flush_points=10) as store:
+            for i, j, g in self.results[25:]:
+                store.append(i, j, g)
+        self.check(point_by_point.PBPMap(self.h5name), self.results)
+        dset = type("dset", (), {"ybincens": np.arange(-3, 4.0), "ystep": 1.0,
+                                 "refmapfile": self.h5name, "refpeaksfile": None,
+                                 "refoutfile": None, "refmanfile": None})()
+        refine = point_by_point.PBPRefine(dset, "phase")
+        refine.loadmap()
+        self.check(refine.pbpmap, self.results)
+
+    def test_crash(self):
+        store = point_by_point.PBPStore(self.h5name, flush_points=10)
+        for i, j, g in self.results[:25]:
+            store.append(i, j, g)
+        del store  # killed: not closed
+        segdir = point_by_point.pbp_store_segdir(self.h5name)
+        self.addCleanup(shutil.rmtree, segdir, True)
+        points = [(i, j) for i, j, g in self.results]
+        self.assertEqual(point_by_point.pbp_done_points([self.h5name]), set(points[:20]))
+        # killed in the middle of writing the next segment or the hdf file
+        with open(os.path.join(segdir, "000003.npy.tmp"), "wb") as fout:
+            fout.write(b"\x93NUMPY")
+        with open(self.h5name + ".tmp", "wb") as fout:
+            fout.write(b"\x89HDF")
+        first = os.path.join(segdir, "000001.npy")
+        with open(first, "rb") as fin:
+            saved = fin.read()
+        with point_by_point.PBPStore(self.h5name) as store:
+            self.assertEqual(store.nrows, sum(len(g) for i, j, g in self.results[:20]))
+            self.assertEqual(os.listdir(segdir), [])
+        self.assertFalse(os.path.exists(segdir))
+        self.check(point_by_point.PBPMap(self.h5name), self.results[:20])
+        # killed after writing the hdf file, before removing the segments
+        os.mkdir(segdir)
+        with open(first, "wb") as fout:
+            fout.write(saved)
+        with point_by_point.PBPStore(self.h5name, flush_points=10) as store:
+            for i, j, g in self.results[20:]:
+                store.append(i, j, g)
+        self.check(point_by_point.PBPMap(self.h5name), self.results)
+        self.assertFalse(os.path.exists(self.h5name + ".tmp"))
+
+    def test_text_to_hdf(self):
+        with point_by_point.PBPTextFile(self.txtname) as gout:
+            for i, j, g in self.results:
+                gout.append(i, j, g)
+        point_by_point.pbp_text_to_hdf(self.txtname, self.h5name)
+        self.check(point_by_point.PBPMap(self.h5name), self.results, tol=5e-7)
+
+    def test_resume(self):
+        names = [self.h5name, "testpbpstore1.h5"]
+        merged = "testpbpstore2.h5"
+        self.addCleanup(os.remove, names[1])
+        self.addCleanup(os.remove, merged)
+        with point_by_point.PBPStore(names[0], flush_points=10) as store:
+            for i, j, g in self.results[:25]:
+                store.append(i, j, g)
+            # not flushed yet, so would be done again
+            self.assertEqual(len(store.done_points()), 20)
+        with point_by_point.PBPStore(names[1]) as store:
+            for i, j, g in self.results[25:]:
+                store.append(i, j, g)
+        points = [(i, j) for i, j, g in self.results]
+        self.assertEqual(point_by_point.pbp_done_points(names[:1]), set(points[:25]))
+        self.assertEqual(point_by_point.pbp_done_points(names + ["missing.h5"]), set(points))
+        point_by_point.merge_pbp_stores(names, merged)
+        self.check(point_by_point.PBPMap(merged), self.results)
+
+
 if __name__ == "__main__":
     unittest.main()
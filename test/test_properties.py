@@ -0,0 +1,235 @@
+
+import os
+import shutil
+import unittest
+import numpy as np
+import h5py
+
+import sys
+if int(sys.version_info.major) == 2:
+    raise unittest.SkipTest('Skipping properties tests on Python 2')
+else:
+    from ImageD11 import sparseframe
+    from ImageD11.sinograms import properties, dataset
+    from test_sparsescan import make_sparse_scan
+
+
+def dict_to_coo(s1, s2, pairs):
+    """the old dict of frame pairs as (peak1, peak2, npixels)"""
+    pk1 = sparseframe.nnz_to_pointer(s1.nlabels)
+    pk2 = sparseframe.nnz_to_pointer(s2.nlabels)
+    out = []
+    for (row1, frame1, row2, frame2), (npairs, ijn) in pairs.items():
+        if npairs == 0:
+            continue
+        out.append(
+            (pk1[frame1] + ijn[:, 0] - 1, pk2[frame2] + ijn[:, 1] - 1, ijn[:, 2])
+        )
+    return np.concatenate(out, axis=1)
+
+
+class test_overlaps(unittest.TestCase):
+    names = ("testprops1.h5", "testprops2.h5")
+
+    def setUp(self):
+        self.scans = []
+        for i, name in enumerate(self.names):
+            make_sparse_scan(name, seed=i)
+            scan = sparseframe.SparseScan(name, "1.1")
+            # spots last a few frames and appear in both scans
+            scan.motors["omega"] = scan.motors["omega"][::-1].copy()
+            self.scans.append(scan)
+
+    def tearDown(self):
+        for name in self.names:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_pairrow(self):
+        for algorithm in ("lmlabel", "cplabel"):
+            s = self.scans[0]
+            getattr(s, algorithm)(countall=False)
+            coo = properties.pairrow_coo(s)
+            self.assertTrue(coo.shape[1] > 0)
+            ref = dict_to_coo(s, s, properties.pairrow(s, 0))
+            self.assertTrue((coo == ref).all())
+
+    def test_pairscans(self):
+        s1, s2 = self.scans
+        s1.lmlabel(countall=False)
+        s2.lmlabel(countall=False)
+        s1.sinorow, s2.sinorow = 1, 0
+        coo = properties.pairscans_coo(s1, s2)
+        self.assertTrue(coo.shape[1] > 0)
+        ref = dict_to_coo(s1, s2, properties.pairscans(s1, s2))
+        self.assertTrue((coo == ref).all())
+        # the output grows when the first guess is too small
+        frames = np.concatenate([np.arange(len(s1.nnz))] * 20)
+        big = properties.scan_overlaps(s1, s1, frames, frames)
+        self.assertEqual(big.shape[1], 20 * s1.total_labels)
+
+
+class test_uniq_labels(unittest.TestCase):
+    def test_same_as_find_ND_labels(self):
+        rng = np.random.RandomState(3)
+        npks = 5000
+        for nedge in (100, 3000, 20000):
+            i = rng.randint(0, npks, nedge)
+            j = np.clip(i + rng.randint(-50, 50, nedge), 0, npks - 1)
+            n, labels = properties.find_ND_labels(i, j, npks, verbose=0)
+            uf = properties.uniq_labels(npks)
+            # edges arrive in pieces, in any order
+            order = rng.permutation(nedge)
+            for block in np.array_split(order, 7):
+                uf.add(j[block], i[block])
+            nu, ulabels = uf.labels()
+            self.assertEqual(n, nu)
+            self.assertTrue((labels == ulabels).all())
+
+    def test_find_uniq(self):
+        rng = np.random.RandomState(4)
+        npk = np.array([(300, 200, 0), (200, 100, 100)])
+        pkst = properties.pks_table(npk=npk)
+        pkst.rc[0] = rng.randint(0, 500, 400)
+        pkst.rc[1] = rng.randint(0, 500, 400)
+        n, labels = pkst.find_uniq()
+        labels = labels.copy()
+        nu, ulabels = pkst.find_uniq(use_unionfind=True)
+        self.assertEqual(n, nu)
+        self.assertTrue((labels == ulabels).all())
+
+
+def make_dataset(dsname, sparsename, nscans=5, nframes=40):
+    """dataset of a few rotation scans with the sparse pixels"""
+    with h5py.File(sparsename, "w") as hout:
+        pass
+    for i in range(nscans):
+        scan = "%d.1" % (i + 1)
+        make_sparse_scan("tmp_" + sparsename, scan=scan, nframes=nframes, seed=i % 2)
+        with h5py.File("tmp_" + sparsename, "r") as hin:
+            with h5py.File(sparsename, "a") as hout:
+                hin.copy(scan, hout)
+    os.remove("tmp_" + sparsename)
+    ds = dataset.DataSet(dataroot=".", analysisroot=".", sample="s", dset="d")
+    ds.scans = ["%d.1" % (i + 1) for i in range(nscans)]
+    ds.omega = np.array([np.linspace(0, 180, nframes)] * nscans)
+    ds.dty = np.array([np.full(nframes, i) for i in range(nscans)], float)
+    ds.sparsefile = sparsename
+    ds.save(dsname)
+    return ds
+
+
+def read_pks(pksname):
+    with h5py.File(pksname, "r") as hin:
+        return hin["pks2d/pk_props"][()], hin["pks2d/glabel"][()]
+
+
+class test_main(unittest.TestCase):
+    dsname = "testpropsds.h5"
+    sparsename = "testpropssparse.h5"
+    folder = "testpropsblocks"
+
+    def setUp(self):
+        make_dataset(self.dsname, self.sparsename)
+        self.pksnames = []
+
+    def tearDown(self):
+        for name in [self.dsname, self.sparsename] + self.pksnames:
+            if os.path.exists(name):
+                os.remove(name)
+        if os.path.exists(self.folder):
+            shutil.rmtree(self.folder)
+
+    def run_main(self, pksname, **options):
+        self.pksnames.append(pksname)
+        options["nproc"] = 2
+        properties.main(self.dsname, self.sparsename, pksname, options=options)
+        return read_pks(pksname)
+
+    def test_stream(self):
+        pks, glabel = self.run_main("testpropspks.h5")
+        spks, sglabel = self.run_main("testpropspkss.h5", stream_overlaps=True)
+        self.assertTrue((spks == pks).all())
+        self.assertTrue((sglabel == glabel).all())
+        with self.assertRaises(Exception):
+            properties.check_options({"stream_overlaps": True, "save_overlaps": True})
+
+    def test_checkpoint(self):
+        pks, glabel = self.run_main("testpropspks.h5")
+        # a previous run finished the first block
+        ds = dataset.load(self.dsname)
+        start, end = properties.get_start_end(len(ds.scans), 2)[0]
+        mypks, pii, pij = properties.label_block(
+            self.sparsename, ds, start, end, properties.default_options
+        )
+        mypks[start][4] += 1000  # so we see it was read
+        os.mkdir(self.folder)
+        fname = properties.block_name(self.folder, start, end)
+        signature = properties.block_signature(self.sparsename, properties.default_options)
+        properties.save_block(fname, start, end, mypks, pii, pij, signature)
+        cpks, cglabel = self.run_main("testpropspksc.h5", checkpoint_dir=self.folder)
+        n = mypks[start].shape[1]
+        self.assertTrue((cpks[4, :n] == pks[4, :n] + 1000).all())
+        self.assertTrue((cpks[:, n:] == pks[:, n:]).all())
+        self.assertTrue((cglabel == glabel).all())
+        # finished, so the blocks are removed
+        self.assertEqual(os.listdir(self.folder), [])
+
+    def test_stale_checkpoint(self):
+        pks, glabel = self.run_main("testpropspks.h5")
+        ds = dataset.load(self.dsname)
+        start, end = properties.get_start_end(len(ds.scans), 2)[0]
+        mypks, pii, pij = properties.label_block(
+            self.sparsename, ds, start, end, properties.default_options
+        )
+        mypks[start][4] += 1000
+        os.mkdir(self.folder)
+        fname = properties.block_name(self.folder, start, end)
+        options = dict(properties.default_options, algorithm="cplabel")
+        # from other options, or without a signature: not used
+        for signature in (properties.block_signature(self.sparsename, options), None):
+            properties.save_block(fname, start, end, mypks, pii, pij, signature)
+            cpks, cglabel = self.run_main("testpropspksc.h5", checkpoint_dir=self.folder)
+            self.assertTrue((cpks == pks).all())
+            self.assertTrue((cglabel == glabel).all())
+            os.remove(self.pksnames.pop())
+
+    def test_stale_blocks(self):
+        options = {"nproc": 1}
+        properties.label_node(self.dsname, self.folder, 0, 2, options=options)
+        properties.label_node(self.dsname, self.folder, 1, 2, options=options)
+        ds = dataset.load(self.dsname)
+        start, end = properties.get_start_end(len(ds.scans), 2)[0]
+        fname = properties.block_name(self.folder, start, end)
+        # the sparse file changed since
+        os.utime(self.sparsename, (0, 0))
+        self.assertFalse(properties.block_ok(
+            fname, properties.block_signature(self.sparsename, properties.default_options)))
+        self.pksnames.append("testpropspksd.h5")
+        with self.assertRaises(Exception):
+            properties.merge_blocks(self.dsname, self.folder, "testpropspksd.h5")
+        mtime = os.path.getmtime(fname)
+        properties.label_node(self.dsname, self.folder, 0, 2, options=options)
+        self.assertNotEqual(mtime, os.path.getmtime(fname))
+        with self.assertRaises(Exception):  # a mix of old and new blocks
+            properties.merge_blocks(self.dsname, self.folder, "testpropspksd.h5")
+        properties.label_node(self.dsname, self.folder, 1, 2, options=options)
+        properties.merge_blocks(self.dsname, self.folder, "testpropspksd.h5")
+
+    def test_distributed(self):
+        pks, glabel = self.run_main("testpropspks.h5")
+        self.pksnames.append("testpropspksd.h5")
+        options = {"nproc": 2}
+        properties.label_node(self.dsname, self.folder, 0, 2, options=options)
+        with self.assertRaises(Exception):
+            properties.merge_blocks(self.dsname, self.folder, "testpropspksd.h5")
+        properties.label_node(self.dsname, self.folder, 1, 2, options={"nproc": 1})
+        self.assertEqual(len(os.listdir(self.folder)), 3)
+        properties.merge_blocks(self.dsname, self.folder, "testpropspksd.h5")
+        dpks, dglabel = read_pks("testpropspksd.h5")
+        self.assertTrue((dpks == pks).all())
+        self.assertTrue((dglabel == glabel).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+
+import os
+import unittest
+import numpy as np
+import h5py
+from ImageD11 import sparseframe
+
+
+def make_sparse_scan(hname, scan="1.1", nframes=40, shape=(64, 72), seed=42):
+    """
+    Writes a scan of frames with a few gaussian spots, thresholded,
+    in the layout used by the lima segmenter
+    """
+    rng = np.random.RandomState(seed)
+    i, j = np.mgrid[0 : shape[0], 0 : shape[1]]
+    rows, cols, vals, nnz = [], [], [], []
+    for f in range(nframes):
+        img = rng.random_sample(shape) * 5
+        for _ in range(rng.randint(0, 6)):
+            ci, cj = rng.random_sample(2) * shape
+            img += 200 * np.exp(-((i - ci) ** 2 + (j - cj) ** 2) / 4.0)
+        img = img.astype(np.uint16)
+        r, c = np.nonzero(img > 10)
+        rows.append(r)
+        cols.append(c)
+        vals.append(img[r, c])
+        nnz.append(len(r))
+    with h5py.File(hname, "w") as hout:
+        g = hout.create_group(scan)
+        g.attrs["itype"] = np.dtype(np.uint16).name
+        g.attrs["nframes"] = nframes
+        g.attrs["shape0"] = shape[0]
+        g.attrs["shape1"] = shape[1]
+        g["row"] = np.concatenate(rows).astype(np.uint16)
+        g["col"] = np.concatenate(cols).astype(np.uint16)
+        g["intensity"] = np.concatenate(vals).astype(np.uint16)
+        g["nnz"] = np.array(nnz, np.uint32)
+        g["measurement/rot_center"] = np.linspace(0, 180, nframes)
+        g["measurement/dty"] = np.full(nframes, 1.5)
+
+
+class test_threaded_labels(unittest.TestCase):
+    hname = "testsparsescan.h5"
+
+    def setUp(self):
+        make_sparse_scan(self.hname)
+
+    def tearDown(self):
+        if os.path.exists(self.hname):
+            os.remove(self.hname)
+
+    def check(self, algorithm, **kwds):
+        for countall in (True, False):
+            serial = sparseframe.SparseScan(self.hname, "1.1")
+            getattr(serial, algorithm)(countall=countall, **kwds)
+            threaded = sparseframe.SparseScan(self.hname, "1.1")
+            getattr(threaded, algorithm)(countall=countall, nthreads=3, **kwds)
+            self.assertTrue(serial.total_labels > 0)
+            self.assertEqual(serial.total_labels, threaded.total_labels)
+            self.assertTrue((serial.nlabels == threaded.nlabels).all())
+            self.assertTrue((serial.labels == threaded.labels).all())
+            if countall:
+                self.assertEqual(serial.labels.max(), serial.total_labels)
+
+    def test_cplabel(self):
+        self.check("cplabel", threshold=20)
+
+    def test_lmlabel(self):
+        self.check("lmlabel")
+        self.check("lmlabel", smooth=False)
+
+
+class test_blocks(unittest.TestCase):
+    hname = "testsparseblocks.h5"
+
+    def setUp(self):
+        make_sparse_scan(self.hname)
+        self.full = sparseframe.SparseScan(self.hname, "1.1")
+
+    def tearDown(self):
+        if os.path.exists(self.hname):
+            os.remove(self.hname)
+
+    def test_blocks(self):
+        blocks = sparseframe.SparseScanBlocks(
+            self.hname, "1.1", max_pixels=self.full.nnz.sum() // 7
+        )
+        self.assertTrue(len(blocks) > 5)
+        frames = 0
+        for block in blocks:
+            self.assertEqual(block.noverlap, 0)
+            s = self.full.ipt[block.start]
+            e = self.full.ipt[block.start + block.shape[0]]
+            self.assertTrue((block.row == self.full.row[s:e]).all())
+            self.assertTrue((block.intensity == self.full.intensity[s:e]).all())
+            self.assertTrue(
+                (block.motors["omega"] == self.full.motors["omega"][block.start :][: block.shape[0]]).all()
+            )
+            frames += block.shape[0]
+        self.assertEqual(frames, self.full.shape[0])
+
+    def test_labels_and_moments(self):
+        for algorithm in ("cplabel", "lmlabel"):
+            getattr(self.full, algorithm)()
+            pks = self.full.moments()
+            blocks = sparseframe.SparseScanBlocks(
+                self.hname, "1.1", max_pixels=self.full.nnz.sum() // 5, overlap=2
+            )
+            for block in blocks.label(algorithm):
+                s = self.full.ipt[block.start]
+                e = self.full.ipt[block.start + block.shape[0]]
+                labels = np.where(block.labels > 0, block.labels + block.label_offset, 0)
+                self.assertTrue((labels == self.full.labels[s:e]).all())
+            bpks = blocks.moments(algorithm)
+            self.assertEqual(sorted(pks.keys()), sorted(bpks.keys()))
+            for name in pks:
+                self.assertTrue(np.allclose(pks[name], bpks[name]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,34 @@ class t2(unittest.TestCase):
         print( "read db",time.time()-start, len(dat[0]), len(dat))
         
 
+class t3(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        n = 1000
+        self.c = columnfile.colfile_from_dict( {
+            'omega' : np.linspace( -180, 180, n ),
+            'spot3d_id' : np.arange( n ),
+            'sum_intensity^2' : np.random.random( n ) } )
+        if os.path.exists("test3.db"):
+            os.remove("test3.db")
+
+    def test1(self):
+        columnfile.colfile2db( self.c, "test3.db", index_columns=['omega'],
+                               extra_columns={'scan' : 1}, blocksize=64 )
+        columnfile.colfile2db( self.c, "test3.db", extra_columns={'scan' : 2} )
+        con = sqlite3.connect("test3.db")
+        names = [ r[1] for r in con.execute("pragma index_list(peaks)") ]
+        con.close()
+        self.assertEqual( names, ['peaks_omega'] )
+        r = columnfile.colfile_from_db( "test3.db",
+            "select * from peaks where scan = ? and omega >= ?", (2, 0) )
+        m = self.c.omega >= 0
+        self.assertEqual( r.nrows, m.sum() )
+        self.assertTrue( (r.spot3d_id == self.c.spot3d_id[m]).all() )
+        self.assertTrue( (r['sum_intensity^2'] == self.c['sum_intensity^2'][m]).all() )
+        self.assertTrue( (r.scan == 2).all() )
+
+
 if __name__=="__main__":
     unittest.main()               
     